@@ -0,0 +1,125 @@
+"""
+Benchmark JSONParser throughput (records/sec) on the JSON parser test fixtures.
+Each scenario is timed twice: through the plain row TypedDict adapters the parser uses, and through the
+generic SQLModel validate-and-dump path as a baseline.
+
+Usage: python -m src.benchmarks.json_parser [--records 10000] [--rounds 5]
+"""
+
+import os
+
+# Needs to happen before local imports
+os.environ.setdefault("ENV_STATE", "test")
+
+import argparse
+import asyncio
+import time
+
+from sqlmodel import SQLModel
+
+from src.pipeline.parse.json import JSONParser
+from src.sources.base import APIEndpointConfig
+from src.tests.fixtures.test_configs.json_parser_configs import (
+    TEST_JSON_PARSER_CONFIG_DEEPLY_NESTED,
+    TEST_JSON_PARSER_CONFIG_LIST_ROOT,
+    TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES,
+    TEST_JSON_PARSER_CONFIG_NESTED,
+    TEST_JSON_PARSER_CONFIG_SIMPLE,
+    TEST_JSON_PARSER_CONFIG_WITH_LISTS,
+)
+from src.tests.fixtures.test_responses.json_parser_responses import (
+    TEST_JSON_PARSER_DEEPLY_NESTED_RESPONSE,
+    TEST_JSON_PARSER_LIST_ROOT_RESPONSE,
+    TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE,
+    TEST_JSON_PARSER_NESTED_RESPONSE,
+    TEST_JSON_PARSER_SIMPLE_RESPONSE,
+    TEST_JSON_PARSER_WITH_LISTS_RESPONSE,
+)
+
+SCENARIOS: dict[str, tuple[APIEndpointConfig, list[dict]]] = {
+    "simple": (
+        TEST_JSON_PARSER_CONFIG_SIMPLE.endpoints["products"],
+        TEST_JSON_PARSER_SIMPLE_RESPONSE,
+    ),
+    "nested": (
+        TEST_JSON_PARSER_CONFIG_NESTED.endpoints["products"],
+        TEST_JSON_PARSER_NESTED_RESPONSE,
+    ),
+    "with_lists": (
+        TEST_JSON_PARSER_CONFIG_WITH_LISTS.endpoints["products"],
+        TEST_JSON_PARSER_WITH_LISTS_RESPONSE,
+    ),
+    "multiple_tables": (
+        TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES.endpoints["products"],
+        TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE,
+    ),
+    "list_root": (
+        TEST_JSON_PARSER_CONFIG_LIST_ROOT.endpoints["posts"],
+        TEST_JSON_PARSER_LIST_ROOT_RESPONSE,
+    ),
+    "deeply_nested": (
+        TEST_JSON_PARSER_CONFIG_DEEPLY_NESTED.endpoints["invoices"],
+        TEST_JSON_PARSER_DEEPLY_NESTED_RESPONSE,
+    ),
+}
+
+
+class SQLModelPathJSONParser(JSONParser):
+    """Baseline: validates and dumps every model through the SQLModel, as models with validators do."""
+
+    def _model_specs_needs_model(self, model_cls: type[SQLModel]) -> bool:
+        return True
+
+
+async def _parse_once(parser: JSONParser, batch: list[dict]) -> int:
+    rows = 0
+    async for table_batches in parser.parse(batch):
+        rows = sum(len(table_batch.records) for table_batch in table_batches)
+    return rows
+
+
+async def _best_time(
+    parser_cls: type[JSONParser],
+    endpoint_config: APIEndpointConfig,
+    batch: list[dict],
+    rounds: int,
+) -> tuple[float, int]:
+    parser = parser_cls(endpoint_config=endpoint_config)
+    await _parse_once(parser, batch[:1])  # warm up adapters and plan
+
+    best = float("inf")
+    rows = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        rows = await _parse_once(parser, batch)
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+async def benchmark(records: int, rounds: int) -> None:
+    print(
+        f"{'scenario':<18}{'sqlmodel rec/s':>16}{'typeddict rec/s':>17}"
+        f"{'rows/sec':>14}{'speedup':>9}"
+    )
+    for name, (endpoint_config, response) in SCENARIOS.items():
+        batch = (response * (records // len(response) + 1))[:records]
+        baseline, _ = await _best_time(
+            SQLModelPathJSONParser, endpoint_config, batch, rounds
+        )
+        best, rows = await _best_time(JSONParser, endpoint_config, batch, rounds)
+        print(
+            f"{name:<18}{len(batch) / baseline:>16,.0f}{len(batch) / best:>17,.0f}"
+            f"{rows / best:>14,.0f}{baseline / best:>8.1f}x"
+        )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--records", type=int, default=10000)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+    asyncio.run(benchmark(args.records, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark a full PipelineRunner run (read, parse, stage, audit, merge) against a recorded cassette.
+
+Record first with the regular CLI:
+    HTTP_CASSETTE_MODE=record HTTP_CASSETTE_PATH=stripe.cassette.gz python -m src.cli.main process -s stripe -e charges
+
+Usage: python -m src.benchmarks.pipeline_replay --cassette stripe.cassette.gz --source stripe --endpoint charges
+           [--rounds 3] [--latency 0.05] [--bandwidth 5000000] [--reuse-last]
+"""
+
+import os
+
+# Needs to happen before local imports
+os.environ.setdefault("ENV_STATE", "test")
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+from sqlalchemy import MetaData, create_engine
+
+from src.pipeline.runner import PipelineRunner
+from src.process.cassette import Cassette
+from src.process.tables import create_production_tables, create_watermark_table
+from src.settings import config
+from src.sources.master import MASTER_SOURCE_REGISTRY
+
+
+async def _run_once(
+    cassette: Cassette,
+    source_name: str,
+    endpoint: str,
+    latency: float,
+    bandwidth: Optional[float],
+    reuse_last: bool,
+) -> float:
+    source = MASTER_SOURCE_REGISTRY.get_source(source_name)
+    endpoint_config = source.endpoints[endpoint]
+    with tempfile.TemporaryDirectory() as directory:
+        # Fresh database each round so every run stages and merges the same rows
+        engine = create_engine(
+            f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            connect_args={"check_same_thread": False},
+        )
+        metadata = MetaData()
+        create_watermark_table(engine, metadata)
+        create_production_tables(endpoint_config, engine, metadata)
+        transport = cassette.transport(
+            "replay", latency=latency, bandwidth=bandwidth, reuse_last=reuse_last
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            runner = PipelineRunner(
+                source=source,
+                endpoint=endpoint,
+                endpoint_config=endpoint_config,
+                engine=engine,
+                metadata=metadata,
+                http_client=client,
+            )
+            start = time.perf_counter()
+            success, url, error = await runner.run()
+            elapsed = time.perf_counter() - start
+        engine.dispose()
+    if not success:
+        raise RuntimeError(f"Replay run failed for {url}: {error}")
+    return elapsed
+
+
+async def benchmark(
+    cassette_path: str,
+    source_name: str,
+    endpoint: str,
+    rounds: int,
+    latency: float,
+    bandwidth: Optional[float],
+    reuse_last: bool,
+) -> None:
+    # Keys were redacted while recording, so replay must redact the same params
+    cassette = Cassette.load(
+        cassette_path, redact_params=config.HTTP_CASSETTE_REDACT_PARAMS
+    )
+    timings = []
+    for _ in range(rounds):
+        timings.append(
+            await _run_once(
+                cassette, source_name, endpoint, latency, bandwidth, reuse_last
+            )
+        )
+    print(f"{'round':<8}{'seconds':>10}")
+    for round_number, elapsed in enumerate(timings, start=1):
+        print(f"{round_number:<8}{elapsed:>10.3f}")
+    print(f"{'best':<8}{min(timings):>10.3f}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--cassette", required=True)
+    arg_parser.add_argument("--source", required=True)
+    arg_parser.add_argument("--endpoint", required=True)
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    arg_parser.add_argument("--latency", type=float, default=0.0)
+    arg_parser.add_argument("--bandwidth", type=float, default=None)
+    arg_parser.add_argument(
+        "--reuse-last",
+        action="store_true",
+        help="Replay the last response when a request outruns its recordings",
+    )
+    args = arg_parser.parse_args()
+    asyncio.run(
+        benchmark(
+            args.cassette,
+            args.source,
+            args.endpoint,
+            args.rounds,
+            args.latency,
+            args.bandwidth,
+            args.reuse_last,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
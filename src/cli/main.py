@@ -41,18 +41,30 @@ def process(
         )
 
         async def run():
-            await processor.process_endpoint(source, endpoint, None)
+            try:
+                await processor.process_endpoint(source, endpoint, None)
+            finally:
+                await processor.close_clients()
             processor.results_summary()
 
-        uvloop.run(run())
+        try:
+            uvloop.run(run())
+        finally:
+            processor.shutdown()
     elif source:
         console.print(f"[green]Processing API {source}...[/green]")
 
         async def run():
-            await processor.process_api(source)
+            try:
+                await processor.process_api(source)
+            finally:
+                await processor.close_clients()
             processor.results_summary()
 
-        uvloop.run(run())
+        try:
+            uvloop.run(run())
+        finally:
+            processor.shutdown()
     else:
         console.print("[green]Processing all APIs...[/green]")
         processor.process()
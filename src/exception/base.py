@@ -8,3 +8,19 @@ class GrainValidationError(CustomException):
 
 class AuditFailedError(CustomException):
     pass
+
+
+class RowCoercionError(CustomException):
+    pass
+
+
+class NotModifiedError(CustomException):
+    pass
+
+
+class CircuitOpenError(CustomException):
+    pass
+
+
+class CassetteMissError(CustomException):
+    pass
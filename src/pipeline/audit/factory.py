@@ -2,6 +2,7 @@ from sqlalchemy import Engine
 
 from src.pipeline.audit.base import BaseAuditor
 from src.pipeline.audit.postgresql import PostgreSQLAuditor
+from src.pipeline.audit.sqlite import SQLiteAuditor
 from src.settings import config
 from src.sources.base import APIEndpointConfig
 
@@ -9,6 +10,7 @@ from src.sources.base import APIEndpointConfig
 class AuditorFactory:
     _auditors = {
         "postgresql": PostgreSQLAuditor,
+        "sqlite": SQLiteAuditor,
     }
 
     @classmethod
@@ -0,0 +1,19 @@
+from sqlalchemy import Engine
+
+from src.pipeline.audit.base import BaseAuditor
+from src.sources.base import APIEndpointConfig
+
+
+class SQLiteAuditor(BaseAuditor):
+    def __init__(self, endpoint_config: APIEndpointConfig, engine: Engine):
+        super().__init__(endpoint_config=endpoint_config, engine=engine)
+
+    def create_grain_validation_sql(self, primary_keys: list[str]):
+        grain_sql = None
+        if len(primary_keys) == 1:
+            grain_sql = f"SELECT CASE WHEN COUNT(DISTINCT {primary_keys[0]}) = COUNT(*) THEN 1 ELSE 0 END AS grain_unique FROM {{table}}"
+        else:
+            # SQLite has no COUNT(DISTINCT (a, b)); count the distinct rows instead
+            grain_cols = ", ".join(primary_keys)
+            grain_sql = f"SELECT CASE WHEN (SELECT COUNT(*) FROM (SELECT DISTINCT {grain_cols} FROM {{table}})) = COUNT(*) THEN 1 ELSE 0 END AS grain_unique FROM {{table}}"
+        return grain_sql
@@ -9,7 +9,9 @@ class BaseParser(ABC):
         self.endpoint_config = endpoint_config
 
     @abstractmethod
-    async def parse(self, batch: list[dict]) -> AsyncGenerator[list[TableBatch], None]:
-        if False:  # pragma: no cover
-            yield []
+    def parse_batch(self, batch: list[dict]) -> list[TableBatch]:
+        """Synchronous, CPU-bound parse; safe to run in a worker pool."""
         raise NotImplementedError
+
+    async def parse(self, batch: list[dict]) -> AsyncGenerator[list[TableBatch], None]:
+        yield self.parse_batch(batch)
@@ -0,0 +1,127 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Type
+
+import pendulum
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric, String
+from sqlmodel import SQLModel
+
+from src.exception.base import RowCoercionError
+from src.process.tables import _get_model_columns
+
+TRUE_STRINGS = {"true", "t", "yes", "y", "1"}
+
+
+def _coerce_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    # int() would silently turn True into 1 and truncate 2.5 to 2
+    if isinstance(value, bool):
+        raise TypeError(f"Expected an integer, got {value!r}")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Expected an integer, got {value!r}")
+    return int(value)
+
+
+def _coerce_float(value: Any) -> float:
+    return value if type(value) is float else float(value)
+
+
+def _coerce_decimal(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _coerce_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
+
+
+def _coerce_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _coerce_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return pendulum.from_timestamp(value)
+    parsed = pendulum.parse(str(value))
+    if not isinstance(parsed, datetime):
+        raise ValueError(f"Expected a datetime, got {value!r}")
+    return parsed
+
+
+def _coerce_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    parsed = pendulum.parse(str(value), exact=True)
+    if not isinstance(parsed, date):
+        raise ValueError(f"Expected a date, got {value!r}")
+    return parsed
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _get_coercer(sa_type: Any) -> Callable[[Any], Any]:
+    sa_class = sa_type if isinstance(sa_type, type) else type(sa_type)
+    if issubclass(sa_class, Boolean):
+        return _coerce_bool
+    if issubclass(sa_class, Integer):
+        return _coerce_int
+    if issubclass(sa_class, Float):
+        return _coerce_float
+    if issubclass(sa_class, Numeric):
+        return _coerce_decimal
+    if issubclass(sa_class, DateTime):
+        return _coerce_datetime
+    if issubclass(sa_class, Date):
+        return _coerce_date
+    if issubclass(sa_class, String):
+        return _coerce_str
+    return _passthrough
+
+
+def create_row_coercer(
+    model: Type[SQLModel],
+) -> Callable[[list[dict]], list[dict]]:
+    """
+    Lightweight replacement for Pydantic validation on trusted sources.
+    Values are coerced to the SQL column types from _get_model_columns; a missing
+    value for a non-nullable column raises RowCoercionError.
+    """
+    columns = [
+        (name, _get_coercer(col_info["type"]), col_info["nullable"])
+        for name, col_info in _get_model_columns(model).items()
+    ]
+    model_name = model.__name__
+
+    def coerce_rows(rows: list[dict]) -> list[dict]:
+        for index, row in enumerate(rows):
+            for name, coercer, nullable in columns:
+                value = row.get(name)
+                if value is None:
+                    if not nullable:
+                        raise RowCoercionError(
+                            f"Missing required field '{name}' for {model_name} (row {index})"
+                        )
+                    row[name] = None
+                    continue
+                try:
+                    row[name] = coercer(value)
+                except (TypeError, ValueError) as e:
+                    raise RowCoercionError(
+                        f"Could not coerce field '{name}' for {model_name} (row {index}): {e}"
+                    ) from e
+        return rows
+
+    return coerce_rows
@@ -1,40 +1,80 @@
 import json
 import re
-from typing import Annotated, Any, AsyncGenerator, cast
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Optional,
+    Type,
+    TypedDict,
+    cast,
+)
 
 import structlog
 from pydantic import BeforeValidator, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from sqlmodel import SQLModel
 
+from src.exception.base import RowCoercionError
 from src.pipeline.db_utils import db_create_row_hash
 from src.pipeline.parse.base import BaseParser
+from src.pipeline.parse.coerce import create_row_coercer
 from src.sources.base import APIEndpointConfig, TableBatch
 
 logger = structlog.getLogger(__name__)
 
+# A compiled path step is one of:
+#   ("key", name)   -> dict lookup
+#   ("index", n)    -> explicit list index from the alias (e.g. items[0])
+#   ("wildcard",)   -> fan out over every list element (row anchors only)
+#   ("bound", k)    -> list index bound by the k-th wildcard of the row anchor
+PlanStep = tuple
+SEGMENT_PATTERN = re.compile(r"^([^\[]*)((?:\[(?:\d+|\*)\])*)$")
+BRACKET_PATTERN = re.compile(r"\[(\d+|\*)\]")
+# model_config keys every table SQLModel carries; any other key changes validation
+SQLMODEL_CONFIG_KEYS = {
+    "from_attributes",
+    "registry",
+    "table",
+    "read_from_attributes",
+    "read_with_orm_mode",
+}
+
+
+class ExtractionNode:
+    """Node of the extraction plan tree; tables anchored here emit one row per dict."""
+
+    __slots__ = ("children", "tables")
+
+    def __init__(self):
+        self.children: dict[PlanStep, ExtractionNode] = {}
+        self.tables: list[str] = []
+
+    def child(self, step: PlanStep) -> "ExtractionNode":
+        if step not in self.children:
+            self.children[step] = ExtractionNode()
+        return self.children[step]
+
 
 class JSONParser(BaseParser):
     def __init__(self, endpoint_config: APIEndpointConfig):
         super().__init__(endpoint_config)
         self.table_batches: dict[str, TableBatch] = {}
         self.model_adapters: dict[str, TypeAdapter] = {}
-        self.indexed_cache = {}
-        self.regex_pattern_cache = {}
+        self.model_dumps: dict[str, bool] = {}
+        self.model_coercers: dict[str, Callable[[list[dict]], list[dict]]] = {}
+        self.raw_rows: dict[str, list[dict]] = {}
         self.model_fields_cache = {}
         self.sorted_keys_cache = {}
-        self.index_pattern = re.compile(r"\[(\d+)\]")
+        self.extraction_plan = ExtractionNode()
         self._initialized = False
 
-    async def _initialize(self) -> None:
+    def _initialize(self) -> None:
         if not self._initialized:
-            await self._create_table_batches_and_adapters()
+            self._create_table_batches_and_adapters()
             self._initialized = True
 
-    async def clear_index_cache(self):
-        self.indexed_cache = {}
-
-    async def _model_specs_find_deepest_common_path_pattern(
-        self, aliases: list[str]
-    ) -> str:
+    def _model_specs_find_deepest_common_path_pattern(self, aliases: list[str]) -> str:
         paths = [".".join(alias.split(".")[:-1]) for alias in aliases]
         path_segments = [path.split(".") for path in paths]
         common_segments = []
@@ -57,18 +97,157 @@ class JSONParser(BaseParser):
 
         return ".".join(common_segments) if common_segments else "root"
 
-    async def _model_specs_find_deepest_wildcard_path(self, aliases: list[str]) -> str:
+    def _model_specs_find_deepest_wildcard_path(self, aliases: list[str]) -> str:
         return max(
             (".".join(alias.split(".")[:-1]) for alias in aliases),
             key=lambda p: p.count("."),
         )
 
-    async def _create_table_batches_and_adapters(self) -> None:
+    def _model_specs_split_path(
+        self, path: str
+    ) -> Optional[list[tuple[str, list[str]]]]:
+        """Split "root.items[*].id" into [(name, [brackets]), ...]; None if malformed."""
+        segments = []
+        for segment in path.split("."):
+            match = SEGMENT_PATTERN.match(segment)
+            if match is None:
+                return None
+            segments.append((match.group(1), BRACKET_PATTERN.findall(match.group(2))))
+        if not segments or segments[0][0] != "root":
+            return None
+        return segments
+
+    def _model_specs_compile_anchor(self, json_path_pattern: str) -> list:
+        segments = self._model_specs_split_path(json_path_pattern)
+        if segments is None:
+            raise ValueError(f"Invalid JSON path pattern: {json_path_pattern}")
+        steps: list[PlanStep] = []
+        for index, (name, brackets) in enumerate(segments):
+            if index > 0:
+                steps.append(("key", name))
+            for bracket in brackets:
+                steps.append(
+                    ("wildcard",) if bracket == "*" else ("index", int(bracket))
+                )
+        return steps
+
+    def _model_specs_compile_accessor(
+        self, alias: str, json_path_pattern: str
+    ) -> Optional[tuple[PlanStep, ...]]:
+        """
+        Compile an alias into lookup steps relative to the record root.
+        Each [*] is bound to the index of the row anchor segment with the same key,
+        so "root.items[*].id" on anchor "root.items[*]" reads items[<row index>].id.
+        Returns None when a wildcard cannot be bound (the field is always None).
+        """
+        alias_segments = self._model_specs_split_path(alias)
+        anchor_segments = self._model_specs_split_path(json_path_pattern)
+        if alias_segments is None or anchor_segments is None:
+            return None
+
+        # Number the anchor wildcards in the order the walker binds them
+        anchor_brackets: list[list[PlanStep]] = []
+        wildcard_count = 0
+        for _, brackets in anchor_segments:
+            bound = []
+            for bracket in brackets:
+                if bracket == "*":
+                    bound.append(("bound", wildcard_count))
+                    wildcard_count += 1
+                else:
+                    bound.append(("index", int(bracket)))
+            anchor_brackets.append(bound)
+
+        steps: list[PlanStep] = []
+        anchor_index = 0
+        for position, (name, brackets) in enumerate(alias_segments):
+            if position > 0:
+                steps.append(("key", name))
+            if "*" in brackets:
+                for index in range(anchor_index, len(anchor_segments)):
+                    anchor_name, anchor_segment_brackets = anchor_segments[index]
+                    if anchor_name == name and anchor_segment_brackets:
+                        if len(anchor_segment_brackets) < len(brackets):
+                            return None
+                        for bracket_index, bracket in enumerate(brackets):
+                            if bracket == "*":
+                                steps.append(anchor_brackets[index][bracket_index])
+                            else:
+                                steps.append(("index", int(bracket)))
+                        anchor_index = index + 1
+                        break
+                else:
+                    return None
+            else:
+                steps.extend(("index", int(bracket)) for bracket in brackets)
+                if anchor_index < len(anchor_segments) and anchor_segments[
+                    anchor_index
+                ] == (name, brackets):
+                    anchor_index += 1
+        return tuple(steps)
+
+    def _model_specs_compile_list_accessor(
+        self, alias: str
+    ) -> Optional[tuple[PlanStep, ...]]:
+        """Steps to the list itself for aliases like "root.tags[*]" (wildcards dropped)."""
+        return self._model_specs_compile_accessor(alias.replace("[*]", ""), "root")
+
+    def _model_specs_needs_model(self, model_cls: Type[SQLModel]) -> bool:
+        """
+        True when validating or dumping through the SQLModel does more than the plain row TypedDict would:
+        custom validators, serializers, computed fields or model_config options (str_strip_whitespace, extra, ...).
+        """
+        decorators = model_cls.__pydantic_decorators__
+        if (
+            decorators.field_validators
+            or decorators.model_validators
+            or decorators.validators
+            or decorators.root_validators
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or decorators.computed_fields
+        ):
+            return True
+        return any(
+            key not in SQLMODEL_CONFIG_KEYS for key in model_cls.model_config.keys()
+        )
+
+    def _model_specs_create_adapter(self, model_cls: Type[SQLModel]) -> None:
+        """
+        Build one TypeAdapter(list[...]) per model so a whole TableBatch validates
+        in a single call. Fields are copied (minus the JSON path alias) into a
+        TypedDict so rows come back as plain dicts without SQLModel instances.
+        Models with custom validators, serializers or config keep validating through the SQLModel.
+        """
+        model_name = model_cls.__name__
+        if self._model_specs_needs_model(model_cls):
+            # TypeAdapters do not like SQLModels. cast breaks SQLModel narrowing so
+            # Annotated[...] sees Any (Ty rejects variables typed as type[SQLModel]).
+            model_type_any = cast(Any, model_cls)
+            safe_model_cls = Annotated[
+                model_type_any,
+                BeforeValidator(model_cls.model_validate),
+            ]
+            self.model_adapters[model_name] = TypeAdapter(list[safe_model_cls])
+            self.model_dumps[model_name] = True
+            return
+
+        row_fields = {}
+        for field_name, field_info in model_cls.model_fields.items():
+            row_field_info = FieldInfo.merge_field_infos(
+                field_info, alias=None, validation_alias=None, serialization_alias=None
+            )
+            row_fields[field_name] = Annotated[field_info.annotation, row_field_info]
+        row_type = TypedDict(f"{model_name}Row", row_fields)  # ty: ignore[invalid-argument-type]
+        self.model_adapters[model_name] = TypeAdapter(list[row_type])
+        self.model_dumps[model_name] = False
+
+    def _create_table_batches_and_adapters(self) -> None:
         for table_config in self.endpoint_config.tables:
             model_cls = table_config.data_model
             model_name = model_cls.__name__
             all_aliases = []
-            fields = []
+            aliases = []
             sorted_keys = []
 
             for field_name, field_info in sorted(model_cls.model_fields.items()):
@@ -76,27 +255,39 @@ class JSONParser(BaseParser):
                 if alias is None:
                     raise ValueError(f"Alias is required for field {field_name}")
 
-                has_wildcard = "[*]" in alias
-                fields.append((field_name, alias, has_wildcard))
+                aliases.append((field_name, alias, "[*]" in alias))
                 all_aliases.append(alias)
                 sorted_keys.append(field_name)
 
-            self.model_fields_cache[model_name] = fields
             self.sorted_keys_cache[model_name] = tuple(sorted_keys)
 
             wildcard_aliases = [
-                alias for _, alias, has_wildcard in fields if has_wildcard
+                alias for _, alias, has_wildcard in aliases if has_wildcard
             ]
             if wildcard_aliases:
-                json_path_pattern = await self._model_specs_find_deepest_wildcard_path(
+                json_path_pattern = self._model_specs_find_deepest_wildcard_path(
                     wildcard_aliases
                 )
             else:
-                json_path_pattern = (
-                    await self._model_specs_find_deepest_common_path_pattern(
-                        all_aliases
-                    )
+                json_path_pattern = self._model_specs_find_deepest_common_path_pattern(
+                    all_aliases
+                )
+
+            fields = []
+            for field_name, alias, has_wildcard in aliases:
+                accessor = self._model_specs_compile_accessor(alias, json_path_pattern)
+                list_accessor = (
+                    self._model_specs_compile_list_accessor(alias)
+                    if has_wildcard
+                    else None
                 )
+                fields.append((field_name, accessor, list_accessor))
+            self.model_fields_cache[model_name] = fields
+
+            node = self.extraction_plan
+            for step in self._model_specs_compile_anchor(json_path_pattern):
+                node = node.child(step)
+            node.tables.append(model_name)
 
             table_batch = TableBatch(
                 data_model=model_cls,
@@ -104,123 +295,112 @@ class JSONParser(BaseParser):
             )
 
             self.table_batches[model_name] = table_batch
-            # TypeAdapters do not like SQLModels. cast breaks SQLModel narrowing so
-            # Annotated[...] sees Any (Ty rejects variables typed as type[SQLModel]).
-            model_type_any = cast(Any, model_cls)
-            safe_model_cls = Annotated[
-                model_type_any,
-                BeforeValidator(model_cls.model_validate),
-            ]
-            self.model_adapters[model_name] = TypeAdapter(safe_model_cls)
-
-    async def _parsing_path_matches(self, path: str, pattern: str) -> bool:
-        if pattern not in self.regex_pattern_cache:
-            escaped = re.escape(pattern).replace(r"\[\*\]", r"\[\d+\]")
-            self.regex_pattern_cache[pattern] = re.compile(escaped)
-        return bool(self.regex_pattern_cache[pattern].fullmatch(path))
-
-    async def _parsing_replace_wildcard_with_index(
-        self, alias_path: str, current_path: str
-    ) -> str:
-        alias_segments = alias_path.split(".")
-        current_segments = current_path.split(".")
-        resolved_segments = []
-        current_index = 0
-
-        for alias_segment in alias_segments:
-            if "[*]" in alias_segment:
-                key_name = alias_segment.split("[")[0]
-                found = False
-                for index in range(current_index, len(current_segments)):
-                    seg = current_segments[index]
-                    if seg.startswith(key_name + "["):
-                        match = self.index_pattern.search(seg)
-                        if match:
-                            resolved_segments.append(f"{key_name}[{match.group(1)}]")
-                            current_index = index + 1
-                            found = True
-                            break
-                if not found:
-                    resolved_segments.append(alias_segment)
+            self.raw_rows[model_name] = []
+            if table_config.skip_validation:
+                self.model_coercers[model_name] = create_row_coercer(model_cls)
             else:
-                resolved_segments.append(alias_segment)
-                if (
-                    current_index < len(current_segments)
-                    and current_segments[current_index] == alias_segment
-                ):
-                    current_index += 1
-
-        return ".".join(resolved_segments)
-
-    async def _parsing_build_model_data(
-        self, path: str, table_batch: TableBatch
+                self._model_specs_create_adapter(model_cls)
+
+    def _parsing_resolve(
+        self, record: Any, steps: tuple[PlanStep, ...], bound: tuple[int, ...]
+    ) -> Any:
+        current = record
+        for step in steps:
+            kind = step[0]
+            if kind == "key":
+                if not isinstance(current, dict) or step[1] not in current:
+                    return None
+                current = current[step[1]]
+            else:
+                index = bound[step[1]] if kind == "bound" else step[1]
+                if not isinstance(current, list) or index >= len(current):
+                    return None
+                current = current[index]
+        return current
+
+    def _parsing_build_model_data(
+        self, model_name: str, record: Any, bound: tuple[int, ...]
     ) -> dict:
         data = {}
-        model_name = table_batch.data_model.__name__
-        for field_name, alias, has_wildcard in self.model_fields_cache[model_name]:
-            if has_wildcard:
-                list_path = alias.replace("[*]", "")
-                list_value = self.indexed_cache.get(list_path)
-                if isinstance(list_value, list):
-                    if not list_value or not isinstance(list_value[0], dict):
-                        data[field_name] = json.dumps(list_value)
-                    else:
-                        resolved_alias = (
-                            await self._parsing_replace_wildcard_with_index(alias, path)
-                        )
-                        data[field_name] = self.indexed_cache.get(resolved_alias)
-                else:
-                    resolved_alias = await self._parsing_replace_wildcard_with_index(
-                        alias, path
-                    )
-                    data[field_name] = self.indexed_cache.get(resolved_alias)
+        for field_name, accessor, list_accessor in self.model_fields_cache[model_name]:
+            if list_accessor is not None:
+                list_value = self._parsing_resolve(record, list_accessor, bound)
+                if isinstance(list_value, list) and (
+                    not list_value or not isinstance(list_value[0], dict)
+                ):
+                    data[field_name] = json.dumps(list_value)
+                    continue
+            if accessor is None:
+                data[field_name] = None
             else:
-                resolved_alias = alias
-                data[field_name] = self.indexed_cache.get(resolved_alias)
+                data[field_name] = self._parsing_resolve(record, accessor, bound)
         return data
 
-    async def _parsing_extract_models_at_path(self, path: str) -> None:
-        for model_name, table_batch in self.table_batches.items():
-            if await self._parsing_path_matches(path, table_batch.json_path_pattern):
-                try:
-                    data = await self._parsing_build_model_data(path, table_batch)
-
-                    adapter = self.model_adapters[model_name]
-                    sorted_keys = self.sorted_keys_cache[model_name]
-
-                    record = adapter.validate_python(data).model_dump()
-                    record["etl_row_hash"] = db_create_row_hash(record, sorted_keys)
-
-                    table_batch.add_record(record)
-                except ValidationError as e:
-                    logger.error(f"Validation error: {e}")
-                    raise e
-
-    async def _parsing_walk(self, obj: Any, path: str = "root"):
-        if path != "root":
-            self.indexed_cache[path] = obj
-
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                field_path = f"{path}.{key}"
-                self.indexed_cache[field_path] = value
-                if isinstance(value, (dict, list)):
-                    await self._parsing_walk(value, field_path)
-
-            await self._parsing_extract_models_at_path(path)
-
-        elif isinstance(obj, list):
-            for index, item in enumerate(obj):
-                item_path = f"{path}[{index}]"
-                self.indexed_cache[item_path] = item
-                if isinstance(item, (dict, list)):
-                    await self._parsing_walk(item, item_path)
-
-    async def parse(self, batch: list[dict]) -> AsyncGenerator[list[TableBatch], None]:
-        await self._initialize()
-        for table_batch in self.table_batches.values():
-            table_batch.clear_records()
+    def _parsing_extract_models(
+        self, model_names: list[str], record: Any, bound: tuple[int, ...]
+    ) -> None:
+        for model_name in model_names:
+            data = self._parsing_build_model_data(model_name, record, bound)
+            self.raw_rows[model_name].append(data)
+
+    def _parsing_validate_models(self) -> list[TableBatch]:
+        """Validate the collected rows into new TableBatches (safe to hand off)."""
+        table_batches = []
+        for model_name, template in self.table_batches.items():
+            table_batch = TableBatch(
+                data_model=template.data_model,
+                json_path_pattern=template.json_path_pattern,
+            )
+            table_batches.append(table_batch)
+            raw_rows = self.raw_rows[model_name]
+            if not raw_rows:
+                continue
+            self.raw_rows[model_name] = []
+            sorted_keys = self.sorted_keys_cache[model_name]
+            try:
+                if model_name in self.model_coercers:
+                    rows = self.model_coercers[model_name](raw_rows)
+                else:
+                    rows = self.model_adapters[model_name].validate_python(raw_rows)
+                    if self.model_dumps[model_name]:
+                        rows = [row.model_dump() for row in rows]
+            except (ValidationError, RowCoercionError) as e:
+                logger.error(f"Validation error: {e}")
+                raise e
+
+            for row in rows:
+                row["etl_row_hash"] = db_create_row_hash(row, sorted_keys)
+            table_batch.add_records(rows)
+        return table_batches
+
+    def _parsing_walk(
+        self,
+        node: ExtractionNode,
+        obj: Any,
+        record: Any,
+        bound: tuple[int, ...] = (),
+    ) -> None:
+        """Follow only the plan's paths through the record, emitting rows at anchors."""
+        if node.tables and isinstance(obj, dict):
+            self._parsing_extract_models(node.tables, record, bound)
+
+        for step, child in node.children.items():
+            kind = step[0]
+            if kind == "key":
+                if isinstance(obj, dict) and step[1] in obj:
+                    self._parsing_walk(child, obj[step[1]], record, bound)
+            elif kind == "index":
+                if isinstance(obj, list) and step[1] < len(obj):
+                    self._parsing_walk(child, obj[step[1]], record, bound)
+            elif isinstance(obj, list):
+                for index, item in enumerate(obj):
+                    self._parsing_walk(child, item, record, bound + (index,))
+
+    def parse_batch(self, batch: list[dict]) -> list[TableBatch]:
+        """Synchronous parse engine; nothing in the hot path awaits."""
+        self._initialize()
+        for model_name in self.raw_rows:
+            self.raw_rows[model_name] = []
         for record in batch:
-            await self.clear_index_cache()
-            await self._parsing_walk(record)
-        yield list(self.table_batches.values())
+            self._parsing_walk(self.extraction_plan, record, record)
+        return self._parsing_validate_models()
@@ -0,0 +1,31 @@
+import orjson
+
+from src.pipeline.parse.base import BaseParser
+from src.pipeline.parse.factory import ParserFactory
+from src.sources.base import TableBatch
+from src.sources.master import MASTER_SOURCE_REGISTRY
+
+# One compiled parser per (source, endpoint), per worker process
+_parsers: dict[tuple[str, str], BaseParser] = {}
+
+
+def get_parser(source_name: str, endpoint: str) -> BaseParser:
+    """
+    Rebuild the parser from the source registry instead of pickling configs and models.
+    The extraction plan and adapters are compiled once and reused for every batch.
+    """
+    key = (source_name, endpoint)
+    if key not in _parsers:
+        source = MASTER_SOURCE_REGISTRY.get_source(source_name)
+        _parsers[key] = ParserFactory.create_parser(
+            source=source, endpoint_config=source.endpoints[endpoint]
+        )
+    return _parsers[key]
+
+
+def parse_batch_bytes(
+    source_name: str, endpoint: str, batch: bytes
+) -> list[TableBatch]:
+    """Process pool entrypoint: decode a JSON encoded page batch and parse it."""
+    parser = get_parser(source_name, endpoint)
+    return parser.parse_batch(orjson.loads(batch))
@@ -2,6 +2,7 @@ from sqlalchemy import Engine
 
 from src.pipeline.publish.base import BasePublisher
 from src.pipeline.publish.postgresql import PostgreSQLPublisher
+from src.pipeline.publish.sqlite import SQLitePublisher
 from src.settings import config
 from src.sources.base import APIEndpointConfig
 
@@ -9,6 +10,7 @@ from src.sources.base import APIEndpointConfig
 class PublisherFactory:
     _publishers = {
         "postgresql": PostgreSQLPublisher,
+        "sqlite": SQLitePublisher,
     }
 
     @classmethod
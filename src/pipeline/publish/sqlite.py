@@ -0,0 +1,45 @@
+from typing import Type
+
+from sqlalchemy import Engine, TextClause, text
+from sqlmodel import SQLModel
+
+from src.pipeline.publish.base import BasePublisher
+from src.sources.base import APIEndpointConfig
+
+
+class SQLitePublisher(BasePublisher):
+    """SQLite has no MERGE; upsert with INSERT ... ON CONFLICT DO UPDATE instead."""
+
+    def __init__(self, engine: Engine, endpoint_config: APIEndpointConfig):
+        super().__init__(engine, endpoint_config)
+
+    def create_publish_sql(
+        self, data_model: Type[SQLModel], now_iso: str
+    ) -> TextClause:
+        variables = self.variable_cache[data_model.__name__]
+        target_table_name = variables["target_table_name"]
+        primary_keys = variables["primary_keys"]
+        update = [
+            col
+            for col in variables["columns"]
+            if col not in primary_keys and col != "etl_row_hash"
+        ]
+        if update:
+            update_set = ", ".join(
+                f"{col} = excluded.{col}" for col in [*update, "etl_row_hash"]
+            )
+            on_conflict = f"""DO UPDATE
+            SET {update_set}, etl_updated_at = '{now_iso}'
+            WHERE {target_table_name}.etl_row_hash != excluded.etl_row_hash"""
+        else:
+            # Every column is part of the grain: an existing row can never change
+            on_conflict = "DO NOTHING"
+
+        # WHERE true disambiguates the ON CONFLICT clause from a join constraint
+        return text(f"""
+            INSERT INTO {target_table_name} ({variables["insert_columns"]})
+            SELECT {variables["insert_values"]}
+            FROM {variables["stage_table_name"]} AS stage
+            WHERE true
+            ON CONFLICT ({", ".join(primary_keys)}) {on_conflict};
+        """)
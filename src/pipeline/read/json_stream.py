@@ -0,0 +1,197 @@
+import re
+from typing import Any, Optional
+
+import orjson
+
+# A complete string literal, or a structural character. A lone quote means the string is cut off by the chunk end.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]:,"]', re.S)
+_WHITESPACE = b" \t\r\n"
+_OPEN = (ord("{"), ord("["))
+_CLOSE = (ord("}"), ord("]"))
+_BRACKETS = b"{}[]"
+# Prefixes tried per chunk before falling back to the token scan
+_MAX_DECODE_ATTEMPTS = 4
+
+
+class JSONItemStream:
+    """
+    Incremental decoder for the items under `json_entrypoint` in a JSON document.
+    Bytes are fed in as they arrive; each element of the target array is decoded as soon as it is complete,
+    so only the element being read is held in memory. Mirrors `extract_items`: a non-array target is one item.
+    """
+
+    def __init__(self, json_entrypoint: Optional[str]):
+        self.path = json_entrypoint.split(".") if json_entrypoint else []
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        # Number of path keys matched by the objects enclosing the scan position
+        self.matched = 0
+        self.key: Optional[str] = None
+        self.expect_key = False
+        self.awaiting_value = True
+        # Set while streaming the elements of the target array
+        self.array_depth: Optional[int] = None
+        self.item_start: Optional[int] = None
+        # Set while buffering a non-array target value
+        self.value_depth: Optional[int] = None
+        self.value_start: Optional[int] = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        items: list[Any] = []
+        if self.done:
+            return items
+        self.buffer += chunk
+        self._scan(items)
+        self._compact()
+        return items
+
+    def close(self) -> list[Any]:
+        """Flush a top-level non-array value and check the target was read to its end."""
+        if self.done:
+            return []
+        if self.value_start is not None and self.value_depth == 0:
+            self.done = True
+            return [orjson.loads(self.buffer[self.value_start :])]
+        if self.matched < len(self.path):
+            raise self._path_not_found()
+        raise ValueError("JSON response ended before the items were complete")
+
+    def _path_not_found(self) -> KeyError:
+        return KeyError(
+            f"Path '{'.'.join(self.path)}' not found in data. Failed at key '{self.path[self.matched]}'"
+        )
+
+    def _on_path_object(self) -> bool:
+        return (
+            self.array_depth is None
+            and self.value_start is None
+            and self.depth == self.matched + 1
+        )
+
+    def _start_value(self, byte: int) -> None:
+        if self.matched < len(self.path):
+            if byte != _OPEN[0]:
+                raise self._path_not_found()
+            self.depth += 1
+            self.pos += 1
+            self.expect_key = True
+        elif byte == _OPEN[1]:
+            self.depth += 1
+            self.pos += 1
+            self.array_depth = self.depth
+            self.item_start = self.pos
+        else:
+            self.value_depth = self.depth
+            self.value_start = self.pos
+
+    def _emit(self, items: list[Any], start: int, end: int) -> None:
+        raw = self.buffer[start:end]
+        if raw.strip():
+            items.append(orjson.loads(raw))
+
+    def _consume_complete_items(self, items: list[Any]) -> None:
+        """
+        Fast path: decode every complete element buffered so far with one orjson call.
+        Walks back from the last comma until the prefix has balanced brackets and parses; a prefix that
+        parses as a list of values can only end at a comma of the target array itself.
+        """
+        buffer, start, end = self.buffer, self.item_start, len(self.buffer)
+        counts = [buffer.count(bracket, start, end) for bracket in _BRACKETS]
+        attempts = 0
+        comma = buffer.rfind(b",", start, end)
+        while comma != -1 and attempts < _MAX_DECODE_ATTEMPTS:
+            for index, bracket in enumerate(_BRACKETS):
+                counts[index] -= buffer.count(bracket, comma, end)
+            end = comma
+            if counts[0] == counts[1] and counts[2] == counts[3]:
+                attempts += 1
+                try:
+                    decoded = orjson.loads(b"[" + buffer[start:comma] + b"]")
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    items.extend(decoded)
+                    self.item_start = self.pos = comma + 1
+                    self.depth = self.array_depth
+                    return
+            comma = buffer.rfind(b",", start, end)
+
+    def _scan(self, items: list[Any]) -> None:
+        buffer = self.buffer
+        fast_path_done = False
+        while not self.done:
+            if self.array_depth is not None and not fast_path_done:
+                fast_path_done = True
+                self._consume_complete_items(items)
+            if self.awaiting_value:
+                while self.pos < len(buffer) and buffer[self.pos] in _WHITESPACE:
+                    self.pos += 1
+                if self.pos == len(buffer):
+                    return
+                self.awaiting_value = False
+                self._start_value(buffer[self.pos])
+                continue
+
+            match = _TOKEN.search(buffer, self.pos)
+            if match is None:
+                self.pos = len(buffer)
+                return
+            byte = buffer[match.start()]
+            if byte == ord('"'):
+                if match.end() - match.start() == 1:
+                    # Wait for the rest of the string
+                    self.pos = match.start()
+                    return
+                self.pos = match.end()
+                if self.expect_key and self._on_path_object():
+                    self.key = orjson.loads(match.group())
+                    self.expect_key = False
+                continue
+
+            self.pos = match.end()
+            if byte in _OPEN:
+                self.depth += 1
+            elif byte in _CLOSE:
+                if self.depth == self.array_depth:
+                    self._emit(items, self.item_start, match.start())
+                    self.done = True
+                elif self.depth == self.value_depth:
+                    self._emit(items, self.value_start, match.start())
+                    self.done = True
+                elif self._on_path_object():
+                    raise self._path_not_found()
+                self.depth -= 1
+            elif byte == ord(","):
+                if self.depth == self.array_depth:
+                    self._emit(items, self.item_start, match.start())
+                    self.item_start = self.pos
+                elif self.depth == self.value_depth:
+                    self._emit(items, self.value_start, match.start())
+                    self.done = True
+                elif self._on_path_object():
+                    self.expect_key = True
+            elif (
+                self._on_path_object()
+                and self.key is not None
+                and self.key == self.path[self.matched]
+            ):
+                self.matched += 1
+                self.key = None
+                self.awaiting_value = True
+
+    def _compact(self) -> None:
+        """Drop bytes that were fully consumed so memory stays bounded by one item."""
+        keep = self.pos
+        for start in (self.item_start, self.value_start):
+            if start is not None and not self.done:
+                keep = min(keep, start)
+        if keep == 0:
+            return
+        del self.buffer[:keep]
+        self.pos -= keep
+        if self.item_start is not None:
+            self.item_start -= keep
+        if self.value_start is not None:
+            self.value_start -= keep
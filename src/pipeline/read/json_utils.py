@@ -12,14 +12,20 @@ def _get_nested_value(data: dict, path: str) -> list[dict] | dict:
     return current
 
 
-def extract_items(
-    data: dict, endpoint_config: APIEndpointConfig, source: APIConfig
-) -> list[dict]:
-    json_entrypoint = (
+def get_json_entrypoint(
+    endpoint_config: APIEndpointConfig, source: APIConfig
+) -> str | None:
+    return (
         endpoint_config.json_entrypoint
         if endpoint_config.json_entrypoint is not None
         else source.json_entrypoint
     )
+
+
+def extract_items(
+    data: dict, endpoint_config: APIEndpointConfig, source: APIConfig
+) -> list[dict]:
+    json_entrypoint = get_json_entrypoint(endpoint_config, source)
     if json_entrypoint is not None:
         result = _get_nested_value(data, json_entrypoint)
         return result if isinstance(result, list) else [result]
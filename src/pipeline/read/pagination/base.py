@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 
@@ -35,3 +36,45 @@ class BasePaginationStrategy(ABC):
         if False:  # pragma: no cover
             yield []
         raise NotImplementedError
+
+    async def prefetch(
+        self, pages: AsyncGenerator[list[dict], None], lookahead: int
+    ) -> AsyncGenerator[list[dict], None]:
+        """
+        Drive a serial page generator in a background task, up to `lookahead` pages ahead,
+        so the next request is in flight while the consumer parses and writes the current page.
+        """
+        async for items in self.merge([pages], buffer=lookahead):
+            yield items
+
+    async def merge(
+        self, generators: list[AsyncGenerator[list[dict], None]], buffer: int
+    ) -> AsyncGenerator[list[dict], None]:
+        """Run page generators concurrently, yielding pages as they arrive through a bounded queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+
+        async def produce(pages: AsyncGenerator[list[dict], None]) -> None:
+            try:
+                async for items in pages:
+                    await queue.put(items)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+
+        producers = [asyncio.create_task(produce(pages)) for pages in generators]
+        remaining = len(producers)
+        try:
+            while remaining:
+                items = await queue.get()
+                if items is None:
+                    remaining -= 1
+                    continue
+                if isinstance(items, Exception):
+                    raise items
+                yield items
+        finally:
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+            for pages in generators:
+                await pages.aclose()
@@ -0,0 +1,49 @@
+import time
+from typing import Optional
+
+import structlog
+
+logger = structlog.getLogger(__name__)
+
+
+class AIMDConcurrencyController:
+    """
+    Additive-increase / multiplicative-decrease window for in-flight requests.
+    Grows by ~1 slot per window of healthy responses and halves on 429/5xx or transport errors.
+    Responses slower than latency_tolerance x the fastest seen hold the window instead of growing it.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum if maximum is not None else initial)
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.min_latency: Optional[float] = None
+        self.last_decrease_at = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_success(self, latency: float) -> None:
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if latency > self.min_latency * self.latency_tolerance:
+            return
+        self._limit = min(self.maximum, self._limit + 1 / self._limit)
+
+    def on_overload(self, started_at: float) -> None:
+        # One decrease per window: requests sent before the last cut reflect the old limit
+        if started_at < self.last_decrease_at:
+            return
+        self._limit = max(self.minimum, self._limit * self.decrease_factor)
+        self.last_decrease_at = time.monotonic()
+        logger.info(f"Overload detected, reducing concurrency to {self.limit}")
@@ -1,7 +1,9 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any, Optional
 
 import httpx
+import pendulum
 import structlog
 from httpx import Request
 from sqlalchemy import Engine
@@ -74,6 +76,8 @@ class CursorPaginationStrategy(BasePaginationStrategy):
         self.limit_param = source.pagination.limit_param
         self.limit = source.pagination.limit
         self.initial_value = source.pagination.initial_value
+        self.lookahead = source.pagination.lookahead
+        self.partition = source.pagination.partition
 
     async def _fetch_cursor(
         self,
@@ -104,14 +108,69 @@ class CursorPaginationStrategy(BasePaginationStrategy):
                 return None
             raise
 
+    def _format_partition_value(self, value: pendulum.DateTime) -> str:
+        if self.partition.value_format == "unix":
+            return str(int(value.timestamp()))
+        return value.to_iso8601_string()
+
+    def _partition_requests(self, request: Request) -> list[tuple[Request, str]]:
+        """Split [start, end) into equal slices; each gets its own filter params and watermark key."""
+        start = pendulum.instance(self.partition.start)
+        end = pendulum.instance(self.partition.end)
+        step = (end - start) / self.partition.partitions
+        partition_requests = []
+        for index in range(self.partition.partitions):
+            lower = start + step * index
+            upper = end if index == self.partition.partitions - 1 else lower + step
+            lower_value = self._format_partition_value(lower)
+            upper_value = self._format_partition_value(upper)
+            partition_request = Request(
+                method=request.method,
+                url=request.url.copy_merge_params(
+                    {
+                        self.partition.lower_param: lower_value,
+                        self.partition.upper_param: upper_value,
+                    }
+                ),
+                headers=request.headers,
+            )
+            watermark_key = f"{self.endpoint_name}@{lower_value}-{upper_value}"
+            partition_requests.append((partition_request, watermark_key))
+        return partition_requests
+
     async def pages(
         self, request: Request, endpoint_config: APIEndpointConfig
+    ) -> AsyncGenerator[list[dict], None]:
+        if self.partition is not None:
+            # Every slice walks its own cursor chain; the chains run concurrently
+            partitions = self._partition_requests(request)
+            logger.info(f"Reading {len(partitions)} partitions concurrently")
+            pages = self.merge(
+                [
+                    self._pages(partition_request, endpoint_config, watermark_key)
+                    for partition_request, watermark_key in partitions
+                ],
+                buffer=max(self.lookahead, 1),
+            )
+        else:
+            pages = self._pages(request, endpoint_config)
+            if self.lookahead > 0:
+                pages = self.prefetch(pages, self.lookahead)
+        async for items in pages:
+            yield items
+
+    async def _pages(
+        self,
+        request: Request,
+        endpoint_config: APIEndpointConfig,
+        watermark_key: Optional[str] = None,
     ) -> AsyncGenerator[list[dict], None]:
         """Paginate through pages using cursor from the response."""
+        watermark_key = watermark_key or self.endpoint_name
         cursor = None
         if endpoint_config.incremental:
-            watermark = get_watermark(
-                self.source_name, self.endpoint_name, self.Session
+            watermark = await asyncio.to_thread(
+                get_watermark, self.source_name, watermark_key, self.Session
             )
             if watermark:
                 logger.info(f"Using watermark to get next cursor: {watermark}")
@@ -139,9 +198,11 @@ class CursorPaginationStrategy(BasePaginationStrategy):
             if len(items) == 0:
                 break
 
+            # Read the token before handing items downstream so a prefetcher can request the next page
+            next_cursor = _extract_next_value(response_data, self.next_cursor_key)
+            del response_data
             yield items
 
-            next_cursor = _extract_next_value(response_data, self.next_cursor_key)
             if not next_cursor:
                 logger.debug(
                     f"No next_cursor found in response - stopping pagination, cursor: {cursor}"
@@ -152,4 +213,6 @@ class CursorPaginationStrategy(BasePaginationStrategy):
             logger.debug(f"Using next_cursor from response, next_cursor: {next_cursor}")
 
         if endpoint_config.incremental and cursor:
-            set_watermark(self.source_name, self.endpoint_name, cursor, self.Session)
+            await asyncio.to_thread(
+                set_watermark, self.source_name, watermark_key, cursor, self.Session
+            )
@@ -6,6 +6,10 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from src.pipeline.read.pagination.base import BasePaginationStrategy
 from src.pipeline.read.pagination.cursor import CursorPaginationStrategy
+from src.pipeline.read.pagination.graphql import (
+    GraphQLCursorPaginationStrategy,
+    GraphQLPagePaginationStrategy,
+)
 from src.pipeline.read.pagination.next_url import NextURLPaginationStrategy
 from src.pipeline.read.pagination.offset import OffsetPaginationStrategy
 from src.pipeline.read.pagination.query import QueryPaginationStrategy
@@ -21,6 +25,8 @@ class PaginationStrategyFactory:
         "next_url": NextURLPaginationStrategy,
         "cursor": CursorPaginationStrategy,
         "query": QueryPaginationStrategy,
+        "graphql_cursor": GraphQLCursorPaginationStrategy,
+        "graphql_page": GraphQLPagePaginationStrategy,
     }
 
     @classmethod
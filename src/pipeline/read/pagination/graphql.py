@@ -0,0 +1,295 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any, Optional
+
+import structlog
+from httpx import Request
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.pipeline.read.json_utils import _get_nested_value, extract_items
+from src.pipeline.read.pagination.base import BasePaginationStrategy
+from src.pipeline.watermark import get_watermark, set_watermark
+from src.process.client import AsyncProductionHTTPClient
+from src.sources.base import (
+    APIConfig,
+    APIEndpointConfig,
+    GraphQLCursorPaginationConfig,
+    GraphQLPagePaginationConfig,
+)
+
+logger = structlog.getLogger(__name__)
+
+
+def _get_optional_value(data: Optional[dict], path: str) -> Optional[Any]:
+    if data is None:
+        return None
+    try:
+        return _get_nested_value(data, path)
+    except KeyError:
+        return None
+
+
+class BaseGraphQLPaginationStrategy(BasePaginationStrategy):
+    """GraphQL pages are selected through `variables` in the POST body, not URL params."""
+
+    def _body_with_variables(
+        self, endpoint_config: APIEndpointConfig, variables: dict[str, Any]
+    ) -> dict:
+        body = dict(endpoint_config.body or {})
+        body["variables"] = {**body.get("variables", {}), **variables}
+        return body
+
+    async def _fetch_variables_batch(
+        self,
+        request: Request,
+        endpoint_config: APIEndpointConfig,
+        variable_sets: list[dict[str, Any]],
+    ) -> list[dict]:
+        """Send several operations as one JSON array POST; the server answers with an array in the same order."""
+        url = str(request.url.copy_with(query=None))
+        logger.debug(
+            f"Fetching {len(variable_sets)} batched GraphQL pages, url: {url}, variables: {variable_sets}"
+        )
+        response_data = await self.client.post(
+            url,
+            backoff_starting_delay=endpoint_config.backoff_starting_delay,
+            headers=dict(request.headers),
+            params=dict(request.url.params),
+            json=[
+                self._body_with_variables(endpoint_config, variables)
+                for variables in variable_sets
+            ],
+        )
+        if not isinstance(response_data, list) or len(response_data) != len(
+            variable_sets
+        ):
+            raise ValueError(
+                f"Expected a JSON array of {len(variable_sets)} results for a batched GraphQL request, "
+                f"got {type(response_data).__name__}"
+            )
+        return response_data
+
+    async def _fetch_variables(
+        self,
+        request: Request,
+        endpoint_config: APIEndpointConfig,
+        variables: dict[str, Any],
+    ) -> dict:
+        body = self._body_with_variables(endpoint_config, variables)
+        url = str(request.url.copy_with(query=None))
+        logger.debug(f"Fetching GraphQL page, url: {url}, variables: {variables}")
+        return await self.client.post(
+            url,
+            backoff_starting_delay=endpoint_config.backoff_starting_delay,
+            headers=dict(request.headers),
+            params=dict(request.url.params),
+            json=body,
+        )
+
+
+class GraphQLCursorPaginationStrategy(BaseGraphQLPaginationStrategy):
+    def __init__(
+        self,
+        source: APIConfig,
+        client: AsyncProductionHTTPClient,
+        Session: sessionmaker[Session],
+        source_name: str,
+        endpoint_name: str,
+        engine: Engine,
+    ):
+        super().__init__(
+            source=source,
+            client=client,
+            Session=Session,
+            source_name=source_name,
+            endpoint_name=endpoint_name,
+            engine=engine,
+        )
+        if not isinstance(source.pagination, GraphQLCursorPaginationConfig):
+            raise ValueError(
+                f"Expected GraphQLCursorPaginationConfig, got {type(source.pagination)}"
+            )
+        self.config = source.pagination
+
+    async def pages(
+        self, request: Request, endpoint_config: APIEndpointConfig
+    ) -> AsyncGenerator[list[dict], None]:
+        pages = self._pages(request, endpoint_config)
+        if self.config.lookahead > 0:
+            pages = self.prefetch(pages, self.config.lookahead)
+        async for items in pages:
+            yield items
+
+    async def _pages(
+        self, request: Request, endpoint_config: APIEndpointConfig
+    ) -> AsyncGenerator[list[dict], None]:
+        """Follow pageInfo.endCursor until hasNextPage is false."""
+        cursor = None
+        if endpoint_config.incremental:
+            cursor = await asyncio.to_thread(
+                get_watermark, self.source_name, self.endpoint_name, self.Session
+            )
+            if cursor:
+                logger.info(f"Using watermark to resume after cursor: {cursor}")
+
+        variables: dict[str, Any] = {}
+        if self.config.page_size_variable and self.config.page_size:
+            variables[self.config.page_size_variable] = self.config.page_size
+
+        while True:
+            if cursor is not None:
+                variables[self.config.cursor_variable] = cursor
+            response_data = await self._fetch_variables(
+                request, endpoint_config, variables
+            )
+            items = extract_items(response_data, endpoint_config, self.source)
+            page_info = _get_optional_value(response_data, self.config.page_info_key)
+            del response_data
+            if not isinstance(page_info, dict):
+                page_info = {}
+
+            end_cursor = page_info.get("endCursor")
+            if end_cursor:
+                cursor = end_cursor
+            if items:
+                yield items
+
+            if not items or not page_info.get("hasNextPage") or not end_cursor:
+                logger.debug(
+                    f"No next page in pageInfo - stopping pagination: {cursor}"
+                )
+                break
+
+        if endpoint_config.incremental and cursor:
+            await asyncio.to_thread(
+                set_watermark,
+                self.source_name,
+                self.endpoint_name,
+                cursor,
+                self.Session,
+            )
+
+
+class GraphQLPagePaginationStrategy(BaseGraphQLPaginationStrategy):
+    def __init__(
+        self,
+        source: APIConfig,
+        client: AsyncProductionHTTPClient,
+        Session: sessionmaker[Session],
+        source_name: str,
+        endpoint_name: str,
+        engine: Engine,
+    ):
+        super().__init__(
+            source=source,
+            client=client,
+            Session=Session,
+            source_name=source_name,
+            endpoint_name=endpoint_name,
+            engine=engine,
+        )
+        if not isinstance(source.pagination, GraphQLPagePaginationConfig):
+            raise ValueError(
+                f"Expected GraphQLPagePaginationConfig, got {type(source.pagination)}"
+            )
+        self.config = source.pagination
+
+    async def _fetch_pages(
+        self, request: Request, endpoint_config: APIEndpointConfig, pages: list[int]
+    ) -> list[list[dict]]:
+        variable_sets = [{self.config.page_variable: page} for page in pages]
+        if len(variable_sets) == 1:
+            responses = [
+                await self._fetch_variables(request, endpoint_config, variable_sets[0])
+            ]
+        else:
+            responses = await self._fetch_variables_batch(
+                request, endpoint_config, variable_sets
+            )
+        return [
+            extract_items(response_data, endpoint_config, self.source)
+            for response_data in responses
+        ]
+
+    async def _fan_out(
+        self,
+        request: Request,
+        endpoint_config: APIEndpointConfig,
+        pages: range,
+    ) -> AsyncGenerator[list[dict], None]:
+        """
+        Keep max_concurrent requests in flight, yielding pages as they complete.
+        Each request carries operations_per_request pages.
+        """
+        step = self.config.operations_per_request
+        page_groups = iter(
+            [list(pages[index : index + step]) for index in range(0, len(pages), step)]
+        )
+        in_flight: set[asyncio.Task] = set()
+
+        def schedule_next() -> None:
+            page_group = next(page_groups, None)
+            if page_group is not None:
+                in_flight.add(
+                    asyncio.create_task(
+                        self._fetch_pages(request, endpoint_config, page_group)
+                    )
+                )
+
+        try:
+            for _ in range(self.config.max_concurrent):
+                schedule_next()
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    schedule_next()
+                    for items in task.result():
+                        if items:
+                            yield items
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def pages(
+        self, request: Request, endpoint_config: APIEndpointConfig
+    ) -> AsyncGenerator[list[dict], None]:
+        page = self.config.start_page
+        response_data = await self._fetch_variables(
+            request, endpoint_config, {self.config.page_variable: page}
+        )
+        total_pages = (
+            _get_optional_value(response_data, self.config.total_pages_key)
+            if self.config.total_pages_key
+            else None
+        )
+        while True:
+            items = extract_items(response_data, endpoint_config, self.source)
+            next_page = (
+                _get_optional_value(response_data, self.config.next_page_key)
+                if self.config.next_page_key
+                else page + 1
+            )
+            del response_data
+            if not items:
+                break
+            yield items
+
+            if isinstance(total_pages, int):
+                # The page count is known: request every remaining page concurrently.
+                # Pages are numbered from start_page, so 0-indexed APIs end at total_pages - 1
+                remaining = range(page + 1, self.config.start_page + total_pages)
+                logger.info(f"Fanning out {len(remaining)} remaining pages")
+                async for items in self._fan_out(request, endpoint_config, remaining):
+                    yield items
+                break
+
+            if next_page is None:
+                break
+            page = int(next_page)
+            response_data = await self._fetch_variables(
+                request, endpoint_config, {self.config.page_variable: page}
+            )
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Optional
 
@@ -53,6 +54,7 @@ class NextURLPaginationStrategy(BasePaginationStrategy):
                 f"Expected NextUrlPaginationConfig, got {type(source.pagination)}"
             )
         self.next_url_key = source.pagination.next_url_key
+        self.lookahead = source.pagination.lookahead
 
     async def _fetch_url(
         self, url: str, headers: dict, endpoint_config: APIEndpointConfig
@@ -77,14 +79,25 @@ class NextURLPaginationStrategy(BasePaginationStrategy):
         self,
         request: Request,
         endpoint_config: APIEndpointConfig,
+    ) -> AsyncGenerator[list[dict], None]:
+        pages = self._pages(request, endpoint_config)
+        if self.lookahead > 0:
+            pages = self.prefetch(pages, self.lookahead)
+        async for items in pages:
+            yield items
+
+    async def _pages(
+        self,
+        request: Request,
+        endpoint_config: APIEndpointConfig,
     ) -> AsyncGenerator[list[dict], None]:
         """Paginate through pages using next_url from the response."""
         headers = dict(request.headers)
         current_url = str(request.url)
 
         if endpoint_config.incremental:
-            watermark = get_watermark(
-                self.source_name, self.endpoint_name, self.Session
+            watermark = await asyncio.to_thread(
+                get_watermark, self.source_name, self.endpoint_name, self.Session
             )
             if watermark:
                 logger.info(f"Using watermark to get next URL: {watermark}")
@@ -112,16 +125,22 @@ class NextURLPaginationStrategy(BasePaginationStrategy):
             if len(items) == 0:
                 break
 
+            # Read the next URL before handing items downstream so a prefetcher can request it
+            next_url = _get_nested_value(response_data, self.next_url_key)
+            del response_data
             yield items
 
-            next_url = _get_nested_value(response_data, self.next_url_key)
             if not next_url:
                 logger.debug(
                     f"No next_url found in response - stopping pagination: {current_url}",
                 )
                 if endpoint_config.incremental:
-                    set_watermark(
-                        self.source_name, self.endpoint_name, current_url, self.Session
+                    await asyncio.to_thread(
+                        set_watermark,
+                        self.source_name,
+                        self.endpoint_name,
+                        current_url,
+                        self.Session,
                     )
                 break
 
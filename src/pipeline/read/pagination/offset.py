@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 
 import httpx
@@ -7,8 +8,9 @@ from httpx import Request
 from sqlalchemy import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.pipeline.read.json_utils import extract_items
+from src.pipeline.read.json_utils import _get_nested_value, extract_items
 from src.pipeline.read.pagination.base import BasePaginationStrategy
+from src.pipeline.read.pagination.concurrency import AIMDConcurrencyController
 from src.pipeline.watermark import get_watermark, set_watermark
 from src.process.client import AsyncProductionHTTPClient
 from src.sources.base import APIConfig, APIEndpointConfig, OffsetPaginationConfig
@@ -45,34 +47,69 @@ class OffsetPaginationStrategy(BasePaginationStrategy):
         self.limit_param = source.pagination.limit_param
         self.start_offset = source.pagination.start_offset
         self.max_concurrent = source.pagination.max_concurrent
-        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        self.total_key = source.pagination.total_key
+        self.ordered = source.pagination.ordered
+        self.max_concurrent_ceiling = (
+            source.pagination.max_concurrent_ceiling or self.max_concurrent
+        )
+        self.controller = AIMDConcurrencyController(
+            initial=self.max_concurrent, maximum=self.max_concurrent_ceiling
+        )
 
-    async def _fetch_offset(
+    async def _fetch_page(
         self,
         request: Request,
         offset: int,
         endpoint_config: APIEndpointConfig,
     ) -> dict | None:
-        async with self.semaphore:
-            params = dict(request.url.params)
-            params[self.offset_param] = str(offset)
-            params[self.limit_param] = str(self.limit)
-            url = str(request.url.copy_with(query=None))
-            logger.debug(f"Fetching paginated page for url: {url}, offset: {offset}")
-            try:
-                return await self.client.get(
-                    url=url,
-                    backoff_starting_delay=endpoint_config.backoff_starting_delay,
-                    headers=request.headers,
-                    params=params,
+        params = dict(request.url.params)
+        params[self.offset_param] = str(offset)
+        params[self.limit_param] = str(self.limit)
+        url = str(request.url.copy_with(query=None))
+        logger.debug(f"Fetching paginated page for url: {url}, offset: {offset}")
+        started_at = time.monotonic()
+        try:
+            response_data = await self.client.get(
+                url=url,
+                backoff_starting_delay=endpoint_config.backoff_starting_delay,
+                on_retry=lambda: self.controller.on_overload(started_at),
+                headers=request.headers,
+                params=params,
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 400:
+                logger.debug(
+                    f"400 Bad Request - stopping pagination, url: {str(e.request.url), offset: {offset}}",
                 )
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 400:
-                    logger.debug(
-                        f"400 Bad Request - stopping pagination, url: {str(e.request.url), offset: {offset}}",
-                    )
-                    return None
-                raise
+                return None
+            raise
+        self.controller.on_success(time.monotonic() - started_at)
+        return response_data
+
+    def _read_total(self, page: dict) -> int | None:
+        """Record count reported on the first page; None keeps pagination unbounded."""
+        try:
+            total = _get_nested_value(page, self.total_key)
+            end_offset = int(total)
+        except (KeyError, TypeError, ValueError):
+            logger.warning(
+                f"No numeric total at '{self.total_key}' on the first page; paginating until an empty or partial page"
+            )
+            return None
+        logger.info(f"Total of {end_offset} records reported by the API")
+        return end_offset
+
+    async def _fetch_offset(
+        self,
+        request: Request,
+        offset: int,
+        endpoint_config: APIEndpointConfig,
+    ) -> list[dict]:
+        """Extract items as soon as the page lands so the raw response is released right away."""
+        response_data = await self._fetch_page(request, offset, endpoint_config)
+        if not response_data:
+            return []
+        return extract_items(response_data, endpoint_config, self.source)
 
     async def pages(
         self,
@@ -81,8 +118,8 @@ class OffsetPaginationStrategy(BasePaginationStrategy):
     ) -> AsyncGenerator[list[dict], None]:
         offset = self.start_offset
         if endpoint_config.incremental:
-            watermark = get_watermark(
-                self.source_name, self.endpoint_name, self.Session
+            watermark = await asyncio.to_thread(
+                get_watermark, self.source_name, self.endpoint_name, self.Session
             )
             if watermark:
                 try:
@@ -94,48 +131,86 @@ class OffsetPaginationStrategy(BasePaginationStrategy):
                 logger.info(f"Using watermark to resume from offset: {offset}")
 
         highest_next_offset = offset
-        while True:
-            tasks = []
-            for index in range(self.max_concurrent):
-                current_offset = offset + (index * self.limit)
-                tasks.append(
-                    self._fetch_offset(
-                        request=request,
-                        offset=current_offset,
-                        endpoint_config=endpoint_config,
-                    )
+        # Sliding window: a new page is requested as soon as any slot frees up.
+        # Completed pages hold only their extracted items until they are yielded.
+        in_flight: dict[asyncio.Task, int] = {}
+        completed: dict[int, list[dict]] = {}
+        next_offset = offset
+        end_offset: int | None = None
+        if self.total_key is not None:
+            # The first page's total fixes the exact set of offsets, so nothing overshoots
+            first_page = await self._fetch_page(request, offset, endpoint_config)
+            if first_page:
+                end_offset = self._read_total(first_page)
+                completed[offset] = extract_items(
+                    first_page, endpoint_config, self.source
                 )
+            else:
+                completed[offset] = []
+            del first_page
+            next_offset += self.limit
 
-            results = await asyncio.gather(*tasks)
+        cancelled: list[asyncio.Task] = []
+        try:
+            while True:
+                if self.ordered:
+                    ready = []
+                    while offset in completed:
+                        ready.append(offset)
+                        offset += self.limit
+                else:
+                    ready = sorted(completed)
+                for page_offset in ready:
+                    items = completed.pop(page_offset)
+                    if end_offset is not None and page_offset >= end_offset:
+                        continue
+                    if len(items) > 0:
+                        highest_next_offset = max(
+                            highest_next_offset, page_offset + len(items)
+                        )
+                        yield items
+                    # An empty or partial page is the last one
+                    if len(items) < self.limit:
+                        if end_offset is None or page_offset + 1 < end_offset:
+                            end_offset = page_offset + 1
 
-            all_empty = True
-            for index, response_data in enumerate(results):
-                if not response_data:
-                    continue
-                items = extract_items(response_data, endpoint_config, self.source)
-                if len(items) > 0:
-                    all_empty = False
-                    request_offset = offset + (index * self.limit)
-                    next_offset = request_offset + len(items)
-                    highest_next_offset = max(highest_next_offset, next_offset)
-                    yield items
-            if all_empty:
-                break
+                if end_offset is not None:
+                    for task, task_offset in list(in_flight.items()):
+                        if task_offset >= end_offset:
+                            task.cancel()
+                            del in_flight[task]
+                            cancelled.append(task)
+                    if not in_flight and next_offset >= end_offset:
+                        break
 
-            offset += self.max_concurrent * self.limit
+                while (
+                    len(in_flight) < self.controller.limit
+                    and len(completed) < self.max_concurrent_ceiling
+                    and (end_offset is None or next_offset < end_offset)
+                ):
+                    task = asyncio.create_task(
+                        self._fetch_offset(
+                            request=request,
+                            offset=next_offset,
+                            endpoint_config=endpoint_config,
+                        )
+                    )
+                    in_flight[task] = next_offset
+                    next_offset += self.limit
 
-            has_partial_page = False
-            for response_data in results:
-                if response_data:
-                    items = extract_items(response_data, endpoint_config, self.source)
-                    if len(items) > 0 and len(items) < self.limit:
-                        has_partial_page = True
-                        break
-            if has_partial_page:
-                break
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    completed[in_flight.pop(task)] = task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, *cancelled, return_exceptions=True)
 
         if endpoint_config.incremental:
-            set_watermark(
+            await asyncio.to_thread(
+                set_watermark,
                 self.source_name,
                 self.endpoint_name,
                 str(highest_next_offset),
@@ -1,10 +1,13 @@
 import asyncio
+from collections import deque
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from urllib.parse import urlencode, urljoin
 
 import structlog
+import xxhash
 from httpx import Request
-from sqlalchemy import Engine, text
+from sqlalchemy import Connection, CursorResult, Engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.pipeline.read.pagination.base import BasePaginationStrategy
@@ -14,6 +17,29 @@ from src.sources.base import APIConfig, APIEndpointConfig, QueryPaginationConfig
 logger = structlog.getLogger(__name__)
 
 
+class SeenURLs:
+    """
+    Bounded memory of requested URLs, kept as 64-bit xxh3 hashes (~100 bytes each instead of the full URL).
+    Past max_urls the oldest hash is forgotten, so a URL repeated that far apart is requested again.
+    """
+
+    def __init__(self, max_urls: int):
+        self.max_urls = max_urls
+        self._hashes: set[int] = set()
+        self._order: deque[int] = deque()
+
+    def add(self, url: str) -> bool:
+        """Remember url; False if it was already seen."""
+        url_hash = xxhash.xxh3_64_intdigest(url.encode())
+        if url_hash in self._hashes:
+            return False
+        self._hashes.add(url_hash)
+        self._order.append(url_hash)
+        if len(self._order) > self.max_urls:
+            self._hashes.discard(self._order.popleft())
+        return True
+
+
 class QueryPaginationStrategy(BasePaginationStrategy):
     """Pages through query result rows; each row → one GET (path or params from row)."""
 
@@ -40,12 +66,39 @@ class QueryPaginationStrategy(BasePaginationStrategy):
                 f"Expected QueryPaginationConfig, got {type(source.pagination)}"
             )
         self.config = source.pagination
-        self.semaphore = asyncio.Semaphore(self.config.max_concurrent)
 
-    def _run_query(self) -> list[dict]:
-        with self.engine.connect() as conn:
-            result = conn.execute(text(self.config.query))
-            return [dict(row) for row in result.mappings().fetchall()]
+    def _open_query(self) -> tuple[Connection, CursorResult]:
+        conn = self.engine.connect()
+        try:
+            result = conn.execution_options(
+                stream_results=True, yield_per=self.config.query_batch_size
+            ).execute(text(self.config.query))
+        except Exception:
+            conn.close()
+            raise
+        return conn, result
+
+    @staticmethod
+    def _close_query(conn: Connection, result: CursorResult) -> None:
+        try:
+            result.close()
+        finally:
+            conn.close()
+
+    async def _stream_query(self) -> AsyncGenerator[list[dict], None]:
+        """
+        Stream the driving query through a server-side cursor, query_batch_size rows at a time.
+        Connecting, executing, each fetch and closing run in a thread so the shared loop never blocks on the database.
+        """
+        conn, result = await asyncio.to_thread(self._open_query)
+        try:
+            rows = result.mappings()
+            while chunk := await asyncio.to_thread(
+                rows.fetchmany, self.config.query_batch_size
+            ):
+                yield [dict(row) for row in chunk]
+        finally:
+            await asyncio.to_thread(self._close_query, conn, result)
 
     def _url_for_row(self, base: str, row: dict) -> str:
         if self.config.value_in == "path":
@@ -63,35 +116,56 @@ class QueryPaginationStrategy(BasePaginationStrategy):
         request: Request,
         endpoint_config: APIEndpointConfig,
     ) -> dict:
-        async with self.semaphore:
-            return await self.client.get(
-                url,
-                backoff_starting_delay=endpoint_config.backoff_starting_delay,
-                headers=dict(request.headers),
-            )
+        return await self.client.get(
+            url,
+            backoff_starting_delay=endpoint_config.backoff_starting_delay,
+            headers=dict(request.headers),
+        )
 
     async def pages(
         self,
         request: Request,
         endpoint_config: APIEndpointConfig,
     ) -> AsyncGenerator[list[dict], None]:
-        rows = self._run_query()
-        if not rows:
-            logger.warning("QueryPagination query returned no rows")
-            return
         base = str(request.url).split("?")[0]
         logger.info(
-            f"Query pagination: {len(rows)} rows, max_concurrent={self.config.max_concurrent}"
+            f"Query pagination: streaming rows, max_concurrent={self.config.max_concurrent}"
         )
-        for index in range(0, len(rows), self.config.max_concurrent):
-            chunk = rows[index : index + self.config.max_concurrent]
-            tasks = [
-                self._fetch_one(
-                    self._url_for_row(base, row),
-                    request,
-                    endpoint_config,
-                )
-                for row in chunk
-            ]
-            results = await asyncio.gather(*tasks)
-            yield list(results)
+        row_count = 0
+        seen_urls = SeenURLs(self.config.deduplicate_max_urls)
+        # Worker-pool window: keep max_concurrent requests in flight and
+        # yield responses as they complete instead of waiting on chunk barriers.
+        in_flight: set[asyncio.Task] = set()
+        # A consumer that stops early (break, cancellation, a failed request) closes the
+        # cursor and connection here, not whenever the generator is garbage collected
+        async with aclosing(self._stream_query()) as query_chunks:
+            try:
+                async for rows in query_chunks:
+                    row_count += len(rows)
+                    for row in rows:
+                        url = self._url_for_row(base, row)
+                        if self.config.deduplicate and not seen_urls.add(url):
+                            continue
+                        in_flight.add(
+                            asyncio.create_task(
+                                self._fetch_one(url, request, endpoint_config)
+                            )
+                        )
+                        if len(in_flight) >= self.config.max_concurrent:
+                            done, in_flight = await asyncio.wait(
+                                in_flight, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            yield [task.result() for task in done]
+                while in_flight:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    yield [task.result() for task in done]
+            finally:
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        if row_count == 0:
+            logger.warning("QueryPagination query returned no rows")
+        else:
+            logger.info(f"Query pagination: processed {row_count} rows")
@@ -6,7 +6,8 @@ from sqlalchemy import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.pipeline.read.base import BaseReader
-from src.pipeline.read.json_utils import extract_items
+from src.pipeline.read.json_stream import JSONItemStream
+from src.pipeline.read.json_utils import extract_items, get_json_entrypoint
 from src.process.client import AsyncProductionHTTPClient
 from src.sources.base import APIConfig, APIEndpointConfig
 
@@ -50,23 +51,14 @@ class RESTReader(BaseReader):
             request = self.authentication_strategy.apply(self.client, request)
 
         if self.pagination_strategy is not None:
-            accumulated_items = []
-            async for page_items in self.pagination_strategy.pages(
-                request, endpoint_config
-            ):
-                accumulated_items.extend(page_items)
-                while len(accumulated_items) >= self.batch_size:
-                    batch = accumulated_items[: self.batch_size]
-                    accumulated_items = accumulated_items[self.batch_size :]
-                    logger.debug(f"Read batch of {len(batch)} items...")
-                    yield batch
-            if accumulated_items:
-                logger.debug(f"Read final batch of {len(accumulated_items)} items")
-                yield accumulated_items
+            pages = self.pagination_strategy.pages(request, endpoint_config)
+        elif endpoint_config.stream_response:
+            pages = self._stream_items(url, request, endpoint_config)
         else:
             data = await self.client.get(
                 url,
                 backoff_starting_delay=endpoint_config.backoff_starting_delay,
+                conditional=endpoint_config.conditional_requests,
                 headers=dict(request.headers),
                 params=default_params,
             )
@@ -74,3 +66,34 @@ class RESTReader(BaseReader):
             if items:
                 logger.debug(f"Read single batch of {len(items)} items")
                 yield items
+            return
+
+        accumulated_items = []
+        async for page_items in pages:
+            accumulated_items.extend(page_items)
+            while len(accumulated_items) >= self.batch_size:
+                batch = accumulated_items[: self.batch_size]
+                accumulated_items = accumulated_items[self.batch_size :]
+                logger.debug(f"Read batch of {len(batch)} items...")
+                yield batch
+        if accumulated_items:
+            logger.debug(f"Read final batch of {len(accumulated_items)} items")
+            yield accumulated_items
+
+    async def _stream_items(
+        self, url: str, request: Request, endpoint_config: APIEndpointConfig
+    ) -> AsyncGenerator[list[dict], None]:
+        """Yield the items decoded from each chunk of the body, never holding the whole response."""
+        stream = JSONItemStream(get_json_entrypoint(endpoint_config, self.source))
+        async for chunk in self.client.stream_bytes(
+            url,
+            backoff_starting_delay=endpoint_config.backoff_starting_delay,
+            headers=dict(request.headers),
+            params=dict(request.url.params),
+        ):
+            items = stream.feed(chunk)
+            if items:
+                yield items
+        items = stream.close()
+        if items:
+            yield items
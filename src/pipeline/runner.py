@@ -1,22 +1,35 @@
 import asyncio
 from collections.abc import AsyncGenerator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Optional
 from urllib.parse import urljoin
 
+import httpx
+import orjson
 import structlog
 from sqlalchemy import Engine, MetaData
 from sqlalchemy.orm import Session, sessionmaker
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
+from src.exception.base import NotModifiedError
 from src.pipeline.audit.factory import AuditorFactory
 from src.pipeline.parse.factory import ParserFactory
+from src.pipeline.parse.worker import parse_batch_bytes
 from src.pipeline.publish.factory import PublisherFactory
 from src.pipeline.read.factory import ReaderFactory
 from src.pipeline.watermark import commit_watermark
 from src.pipeline.write.factory import WriterFactory
-from src.process.client import AsyncProductionHTTPClient
+from src.process.client import (
+    AsyncProductionHTTPClient,
+    AsyncTokenBucket,
+    CircuitBreaker,
+    RequestHedger,
+)
+from src.process.http_cache import HTTPValidatorCache
 from src.process.tables import create_stage_tables, drop_stage_tables
+from src.settings import config
 from src.sources.base import APIConfig, APIEndpointConfig, TableBatch
+from src.sources.master import MASTER_SOURCE_REGISTRY
 
 logger = structlog.getLogger(__name__)
 
@@ -29,14 +42,20 @@ class PipelineRunner:
         endpoint_config: APIEndpointConfig,
         engine: Engine,
         metadata: MetaData,
+        parse_executor: Optional[Executor] = None,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        http_cache: Optional[HTTPValidatorCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[RequestHedger] = None,
     ):
         clear_contextvars()
         bind_contextvars(source=source, endpoint=endpoint)
         self.source = source
         self.engine = engine
         self.metadata = metadata
-        create_stage_tables(endpoint_config, self.engine, self.metadata)
         self.Session: sessionmaker[Session] = sessionmaker(bind=self.engine)
+        self.endpoint_name = endpoint
         self.endpoint = endpoint.lstrip("/")
         self.endpoint_config = endpoint_config
 
@@ -46,7 +65,24 @@ class PipelineRunner:
             base_url = source.base_url.rstrip("/") + "/"
             self.url = urljoin(base_url, self.endpoint.lstrip("/"))
 
-        self.client = AsyncProductionHTTPClient()
+        if rate_limiter is None and source.rate_limit is not None:
+            rate_limiter = AsyncTokenBucket(
+                rate=source.rate_limit.requests_per_second,
+                burst=source.rate_limit.burst,
+            )
+        if hedger is None and source.hedge is not None:
+            hedger = RequestHedger(
+                percentile=source.hedge.percentile,
+                budget=source.hedge.budget,
+                min_samples=source.hedge.min_samples,
+            )
+        self.client = AsyncProductionHTTPClient(
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            client=http_client,
+            circuit_breaker=circuit_breaker,
+            hedger=hedger,
+        )
         self._client_closed = False
         self.reader = ReaderFactory.create_reader(
             source=source,
@@ -66,8 +102,24 @@ class PipelineRunner:
         self.publisher = PublisherFactory.create_publisher(
             engine=self.engine, endpoint_config=endpoint_config
         )
+        self.queue_size = config.PIPELINE_QUEUE_SIZE
+        self.parse_executor = parse_executor
+        self.parse_in_process = isinstance(parse_executor, ProcessPoolExecutor)
+        if self.parse_in_process and not self._is_registered_endpoint():
+            logger.warning(
+                f"{source.name}/{endpoint} does not match its MASTER_SOURCE_REGISTRY entry; parsing in a thread instead of worker processes"
+            )
+            self.parse_in_process = False
         self.result: Optional[tuple[bool, str, Optional[str]]] = None
 
+    def _is_registered_endpoint(self) -> bool:
+        """Worker processes rebuild the parser from MASTER_SOURCE_REGISTRY by source and endpoint name."""
+        try:
+            registered = MASTER_SOURCE_REGISTRY.get_source(self.source.name)
+        except ValueError:
+            return False
+        return registered.endpoints.get(self.endpoint_name) == self.endpoint_config
+
     async def read(self) -> AsyncGenerator[list[dict], None]:
         async for batch in self.reader.read(
             url=self.url, endpoint_config=self.endpoint_config
@@ -75,8 +127,28 @@ class PipelineRunner:
             yield batch
 
     async def parse(self, batch: list[dict]) -> AsyncGenerator[list[TableBatch], None]:
-        async for table_batches in self.parser.parse(batch=batch):
-            yield table_batches
+        if self.parse_executor is None:
+            async for table_batches in self.parser.parse(batch=batch):
+                yield table_batches
+        elif self.parse_in_process:
+            # Workers rebuild the parser from the registry; only bytes cross the boundary
+            loop = asyncio.get_running_loop()
+            yield await loop.run_in_executor(
+                self.parse_executor,
+                parse_batch_bytes,
+                self.source.name,
+                self.endpoint_name,
+                orjson.dumps(batch),
+            )
+        elif isinstance(self.parse_executor, ProcessPoolExecutor):
+            # Workers could not rebuild this parser; the loop's default thread pool parses instead
+            yield await asyncio.to_thread(self.parser.parse_batch, batch)
+        else:
+            # Keep CPU-bound parsing off the shared event loop
+            loop = asyncio.get_running_loop()
+            yield await loop.run_in_executor(
+                self.parse_executor, self.parser.parse_batch, batch
+            )
 
     def write(self, table_batches: list[TableBatch]) -> None:
         self.writer.write(table_batches=table_batches)
@@ -89,23 +161,69 @@ class PipelineRunner:
     def publish(self) -> None:
         logger.info(f"Publishing data from API endpoint...")
         self.publisher.publish()
-        if self.endpoint_config.incremental:
-            commit_watermark(self.source.name, self.endpoint, self.Session)
 
     def cleanup(self) -> None:
         drop_stage_tables(self.endpoint_config, self.Session)
 
+    async def setup(self) -> None:
+        # Blocking DDL runs in a thread so other sources keep the shared loop
+        await asyncio.to_thread(
+            create_stage_tables, self.endpoint_config, self.engine, self.metadata
+        )
+
+    async def _read_stage(self, parse_queue: asyncio.Queue) -> None:
+        async for batch in self.read():
+            await parse_queue.put(batch)
+        await parse_queue.put(None)
+
+    async def _parse_stage(
+        self, parse_queue: asyncio.Queue, write_queue: asyncio.Queue
+    ) -> None:
+        while (batch := await parse_queue.get()) is not None:
+            async for table_batches in self.parse(batch=batch):
+                await write_queue.put(table_batches)
+        await write_queue.put(None)
+
+    async def _write_stage(self, write_queue: asyncio.Queue) -> None:
+        while (table_batches := await write_queue.get()) is not None:
+            await asyncio.to_thread(self.write, table_batches)
+
+    async def load_stage_tables(self) -> None:
+        """
+        Run read, parse and write concurrently so HTTP latency overlaps with DB inserts.
+        Bounded queues between the stages apply backpressure to cap memory.
+        """
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(self._read_stage(parse_queue))
+                task_group.create_task(self._parse_stage(parse_queue, write_queue))
+                task_group.create_task(self._write_stage(write_queue))
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+
     async def run(self):
         try:
             logger.info(f"Starting to process API endpoint...")
-            async for batch in self.read():
-                async for table_batches in self.parse(batch=batch):
-                    await asyncio.to_thread(self.write, table_batches)
+            await self.setup()
+            await self.load_stage_tables()
             await asyncio.to_thread(self.audit)
             await asyncio.to_thread(self.publish)
+            if self.endpoint_config.incremental:
+                # Watermarks advance only once their data is published
+                await asyncio.to_thread(
+                    commit_watermark, self.source.name, self.endpoint, self.Session
+                )
+            await asyncio.to_thread(self.client.commit_validators)
             await asyncio.to_thread(self.cleanup)
             self.result = (True, self.url, None)
             logger.info(f"API Endpoint processed successfully!")
+        except NotModifiedError as e:
+            # Nothing changed upstream: skip parse, stage, audit and merge entirely
+            logger.info(f"Skipping endpoint: {e}")
+            await asyncio.to_thread(self.cleanup)
+            self.result = (True, self.url, None)
         except Exception as e:
             logger.exception(f"Error processing endpoint {self.url}: {e}")
             self.result = (False, self.url, str(e))
@@ -98,13 +98,21 @@ def commit_watermark(
                     """
                     UPDATE api_watermark 
                     SET watermark_committed = watermark_staged, etl_updated_at = :etl_updated_at
-                    WHERE source_name = :source_name AND endpoint_name = :endpoint_name
+                    WHERE source_name = :source_name
+                    AND (
+                        endpoint_name = :endpoint_name
+                        OR substr(endpoint_name, 1, :partition_prefix_length) = :partition_prefix
+                    )
                     AND watermark_staged IS NOT NULL
                     """
                 ),
                 {
                     "source_name": source_name,
                     "endpoint_name": endpoint_name,
+                    # Per-partition watermarks are keyed "<endpoint>@<lower>-<upper>";
+                    # a prefix compare, since LIKE would treat _ and % in endpoint names as wildcards
+                    "partition_prefix": f"{endpoint_name}@",
+                    "partition_prefix_length": len(endpoint_name) + 1,
                     "etl_updated_at": pendulum.now("UTC"),
                 },
             )
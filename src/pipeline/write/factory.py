@@ -2,12 +2,14 @@ from sqlalchemy import Engine
 
 from src.pipeline.write.base import BaseWriter
 from src.pipeline.write.postgresql import PostgreSQLWriter
+from src.pipeline.write.sqlite import SQLiteWriter
 from src.settings import config
 
 
 class WriterFactory:
     _writers = {
         "postgresql": PostgreSQLWriter,
+        "sqlite": SQLiteWriter,
     }
 
     @classmethod
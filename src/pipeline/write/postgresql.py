@@ -1,8 +1,94 @@
-from sqlalchemy import Engine
+from typing import Any
+
+import structlog
+from psycopg.types.json import Json
+from sqlalchemy import Engine, text
 
 from src.pipeline.write.base import BaseWriter
+from src.settings import config
+from src.sources.base import TableBatch
+
+logger = structlog.getLogger(__name__)
 
 
 class PostgreSQLWriter(BaseWriter):
+    """Streams stage rows with psycopg 3 COPY ... FROM STDIN instead of INSERT executemany."""
+
     def __init__(self, engine: Engine):
         super().__init__(engine=engine)
+        self.engine = engine
+        self.copy_format = config.POSTGRESQL_COPY_FORMAT
+        self.use_copy = engine.dialect.driver == "psycopg"
+        self.column_type_oids: dict[str, list[int]] = {}
+        if not self.use_copy:
+            logger.warning(
+                f"COPY requires the psycopg driver, got {engine.dialect.driver}; falling back to INSERT"
+            )
+
+    def create_stage_copy_sql(self, table_name: str, columns: list[str]) -> str:
+        copy_sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+        if self.copy_format == "binary":
+            copy_sql += " (FORMAT BINARY)"
+        return copy_sql
+
+    def _get_column_type_oids(self, table_name: str, columns: list[str]) -> list[int]:
+        """Binary COPY needs the exact column types; read them from the stage table."""
+        if table_name not in self.column_type_oids:
+            with self.engine.connect() as conn:
+                result = conn.execute(
+                    text(
+                        """
+                        SELECT attname, atttypid::int AS type_oid
+                        FROM pg_attribute
+                        WHERE attrelid = CAST(:table_name AS regclass)
+                        AND attnum > 0 AND NOT attisdropped
+                        """
+                    ),
+                    {"table_name": table_name},
+                )
+                type_oids = {row.attname: row.type_oid for row in result}
+            self.column_type_oids[table_name] = [type_oids[col] for col in columns]
+        return self.column_type_oids[table_name]
+
+    def _record_to_row(self, record: dict[str, Any], columns: list[str]) -> tuple:
+        record = self._convert_record(record)
+        # Text COPY has no column types to pick a dumper from, so JSON values are wrapped explicitly
+        return tuple(
+            Json(value) if isinstance(value, (dict, list)) else value
+            for value in (record.get(col) for col in columns)
+        )
+
+    def _write_batch(self, table_batch: TableBatch) -> None:
+        if not self.use_copy:
+            return super()._write_batch(table_batch)
+        if not table_batch.records:
+            return
+
+        stage_table_name = table_batch.stage_table_name
+        columns = self.columns[table_batch.data_model.__name__]
+        copy_sql = self.create_stage_copy_sql(stage_table_name, columns)
+        type_oids = (
+            self._get_column_type_oids(stage_table_name, columns)
+            if self.copy_format == "binary"
+            else None
+        )
+
+        logger.debug(
+            f"Copying {len(table_batch.records)} items to {stage_table_name} ({self.copy_format})..."
+        )
+        connection = self.engine.raw_connection()
+        try:
+            driver_connection = connection.driver_connection
+            with driver_connection.cursor() as cursor:
+                with cursor.copy(copy_sql) as copy:
+                    if type_oids is not None:
+                        copy.set_types(type_oids)
+                    for record in table_batch.records:
+                        copy.write_row(self._record_to_row(record, columns))
+            connection.commit()
+        except Exception as e:
+            logger.exception(f"Error copying batch into stage table: {e}")
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
@@ -0,0 +1,65 @@
+import structlog
+from sqlalchemy import Connection, Engine
+
+from src.pipeline.write.base import BaseWriter
+from src.sources.base import TableBatch
+
+logger = structlog.getLogger(__name__)
+
+# Bulk-load pragmas, applied per connection while a batch is written
+LOAD_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-64000",
+}
+
+
+class SQLiteWriter(BaseWriter):
+    """Writes every chunk of a TableBatch in one transaction with bulk-load pragmas."""
+
+    def __init__(self, engine: Engine):
+        super().__init__(engine=engine)
+        self.engine = engine
+
+    def _set_load_pragmas(self, conn: Connection) -> dict[str, str]:
+        previous = {}
+        for pragma, value in LOAD_PRAGMAS.items():
+            previous[pragma] = conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+        return previous
+
+    def _restore_pragmas(self, conn: Connection, previous: dict[str, str]) -> None:
+        # journal_mode stays WAL: it persists in the database file and suits loads
+        for pragma, value in previous.items():
+            if pragma != "journal_mode" and value is not None:
+                conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+
+    def _write_batch(self, table_batch: TableBatch) -> None:
+        if not table_batch.records:
+            return
+        stage_table_name = table_batch.stage_table_name
+        columns = self.columns[table_batch.data_model.__name__]
+        insert_sql = self.create_stage_insert_sql(stage_table_name, columns)
+
+        with self.engine.connect() as conn:
+            previous = self._set_load_pragmas(conn)
+            try:
+                for index in range(0, len(table_batch.records), self.batch_size):
+                    chunk = [
+                        self._convert_record(record)
+                        for record in table_batch.records[
+                            index : index + self.batch_size
+                        ]
+                    ]
+                    logger.debug(
+                        f"Writing batch of {len(chunk)} items to {stage_table_name}..."
+                    )
+                    conn.execute(insert_sql, chunk)
+                conn.commit()
+            except Exception as e:
+                logger.exception(f"Error inserting batch into stage table: {e}")
+                conn.rollback()
+                raise e
+            finally:
+                self._restore_pragmas(conn, previous)
@@ -0,0 +1,196 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Literal, Optional
+
+import httpx
+import orjson
+import structlog
+
+from src.exception.base import CassetteMissError
+
+logger = structlog.getLogger(__name__)
+
+# Bodies are stored decoded, so encoding/framing headers would no longer describe them
+_DROPPED_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "set-cookie",
+}
+
+
+_REDACTED = "REDACTED"
+
+
+def _redact_url(url: httpx.URL, redact_params: frozenset[str]) -> httpx.URL:
+    params = url.params.multi_items()
+    if not any(name.lower() in redact_params for name, _ in params):
+        return url
+    return url.copy_with(
+        params=[
+            (name, _REDACTED if name.lower() in redact_params else value)
+            for name, value in params
+        ]
+    )
+
+
+def _replayable_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in headers.multi_items()
+        if name.lower() not in _DROPPED_HEADERS
+    ]
+
+
+class Cassette:
+    """
+    Recorded HTTP interactions kept in a gzip-compressed JSON-lines archive.
+    Requests are matched on method, full URL and body hash; repeated requests replay in recorded order.
+    Values of `redact_params` query params (API keys such as OpenWeather's appid) are masked in the key,
+    both when recording and when matching, so secrets are never written to the archive.
+    """
+
+    def __init__(self, path: str, redact_params: Iterable[str] = ()):
+        self.path = Path(path)
+        self.redact_params = frozenset(name.lower() for name in redact_params)
+        self.interactions: dict[str, list[dict]] = defaultdict(list)
+
+    @classmethod
+    def load(cls, path: str, redact_params: Iterable[str] = ()) -> "Cassette":
+        cassette = cls(path, redact_params=redact_params)
+        with gzip.open(cassette.path, "rb") as archive:
+            for line in archive:
+                interaction = orjson.loads(line)
+                cassette.interactions[interaction["key"]].append(interaction)
+        logger.info(
+            f"Loaded {sum(map(len, cassette.interactions.values()))} recorded responses from {path}"
+        )
+        return cassette
+
+    def request_key(self, request: httpx.Request) -> str:
+        body_hash = (
+            hashlib.sha256(request.content).hexdigest() if request.content else ""
+        )
+        url = _redact_url(request.url, self.redact_params)
+        return f"{request.method} {url} {body_hash}"
+
+    def add(
+        self,
+        request: httpx.Request,
+        status_code: int,
+        headers: httpx.Headers,
+        content: bytes,
+    ) -> None:
+        key = self.request_key(request)
+        self.interactions[key].append(
+            {
+                "key": key,
+                "status_code": status_code,
+                "headers": _replayable_headers(headers),
+                "content": base64.b64encode(content).decode(),
+            }
+        )
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wb") as archive:
+            for interactions in self.interactions.values():
+                for interaction in interactions:
+                    archive.write(orjson.dumps(interaction) + b"\n")
+        logger.info(
+            f"Saved {sum(map(len, self.interactions.values()))} recorded responses to {self.path}"
+        )
+
+    def transport(
+        self,
+        mode: Literal["record", "replay"],
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        reuse_last: bool = False,
+    ) -> httpx.AsyncBaseTransport:
+        if mode == "record":
+            return RecordingTransport(self)
+        return ReplayTransport(
+            self, latency=latency, bandwidth=bandwidth, reuse_last=reuse_last
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests to the network and add every response to the cassette."""
+
+    def __init__(
+        self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport(http2=True)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        self.cassette.add(request, response.status_code, response.headers, content)
+        return httpx.Response(
+            response.status_code,
+            headers=_replayable_headers(response.headers),
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serve recorded responses without touching the network.
+    Each response is delayed by `latency` seconds plus its size over `bandwidth` bytes/sec, if set.
+    A request made more often than it was recorded is a miss, unless `reuse_last` replays the last response again.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        reuse_last: bool = False,
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.reuse_last = reuse_last
+        self.positions: dict[str, int] = defaultdict(int)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.cassette.request_key(request)
+        interactions = self.cassette.interactions.get(key)
+        if not interactions:
+            raise CassetteMissError(f"No recorded response for {key}")
+        position = self.positions[key]
+        if position >= len(interactions):
+            if not self.reuse_last:
+                raise CassetteMissError(
+                    f"All {len(interactions)} recorded responses already replayed for {key}"
+                )
+            position = len(interactions) - 1
+        interaction = interactions[position]
+        self.positions[key] += 1
+
+        content = base64.b64decode(interaction["content"])
+        delay = self.latency
+        if self.bandwidth:
+            delay += len(content) / self.bandwidth
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            interaction["status_code"],
+            headers=interaction["headers"],
+            content=content,
+            request=request,
+        )
@@ -1,12 +1,18 @@
 import asyncio
 import random
-from typing import Any, Optional, cast
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from typing import Any, Callable, Literal, Optional, cast
 
 import httpx
 import orjson
 import pendulum
 import structlog
 
+from src.exception.base import CircuitOpenError, NotModifiedError
+from src.process.http_cache import HTTPValidatorCache
+
 logger = structlog.getLogger(__name__)
 
 RETRIABLE_STATUS_CODES = {
@@ -80,6 +86,162 @@ def _calculate_backoff_for_response(
     return _calculate_backoff(attempt, backoff_starting_delay)
 
 
+class AsyncTokenBucket:
+    """
+    Token bucket shared by every client of one source: refills at `rate` tokens/sec up to `burst`.
+    Each caller reserves a token immediately and sleeps off any deficit, so waiters are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class RequestHedger:
+    """
+    Per-source hedging policy: the hedge delay is the `percentile` of recent GET latencies, and at most
+    `budget` x the GETs sent may be duplicated, so hedging stays within the rate-limit headroom.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window_size: int = 200,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.latencies: deque[float] = deque(maxlen=window_size)
+        self.requests = 0
+        self.hedges = 0
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little history."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(self.percentile * (len(ordered) - 1))]
+
+    def record_request(self) -> None:
+        self.requests += 1
+
+    def record_latency(self, latency: float) -> None:
+        self.latencies.append(latency)
+
+    def try_acquire(self) -> bool:
+        if self.hedges + 1 > self.budget * self.requests:
+            return False
+        self.hedges += 1
+        return True
+
+    def release(self) -> None:
+        """Return a hedge that was granted but not sent."""
+        self.hedges -= 1
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker over the outcomes of the last `window_size` attempts.
+    Opens once at least `minimum_requests` were seen and the failure rate reaches the threshold; while open,
+    requests fail fast. After `reset_timeout` one probe is let through (half-open): success closes the
+    breaker, failure opens it again. Outcomes are reported with the start time `before_request` returned,
+    so late results of requests sent before the probe are ignored while half-open.
+    5xx and transport errors are failures; 429 is left to the rate limiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_requests: int = 10,
+        window_size: int = 20,
+        reset_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.reset_timeout = reset_timeout
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.state == "open"
+            and time.monotonic() - self.opened_at < self.reset_timeout
+        )
+
+    def before_request(self) -> float:
+        """Admit a request or raise CircuitOpenError; returns its start time for record_success/record_failure."""
+        now = time.monotonic()
+        if self.state == "open":
+            if now - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"Circuit open for {self.name}, failing fast")
+            self.state = "half_open"
+            self.probe_started_at = None
+        if self.state == "half_open":
+            # One probe at a time; a probe that never reports back expires after reset_timeout
+            if (
+                self.probe_started_at is not None
+                and now - self.probe_started_at < self.reset_timeout
+            ):
+                raise CircuitOpenError(
+                    f"Circuit half-open for {self.name}, waiting on probe"
+                )
+            self.probe_started_at = now
+        return now
+
+    def record_success(self, started_at: float) -> None:
+        if self.state == "open" or not self._counts(started_at):
+            return
+        if self.state == "half_open":
+            logger.info(f"Circuit closed for {self.name}")
+            self.state = "closed"
+            self.outcomes.clear()
+        self.outcomes.append(True)
+
+    def record_failure(self, started_at: float) -> None:
+        if self.state == "open" or not self._counts(started_at):
+            return
+        if self.state == "half_open":
+            self._open()
+            return
+        self.outcomes.append(False)
+        failures = self.outcomes.count(False)
+        if (
+            len(self.outcomes) >= self.minimum_requests
+            and failures / len(self.outcomes) >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def _counts(self, started_at: float) -> bool:
+        """While half-open only the admitted probe decides the state."""
+        return self.state != "half_open" or started_at == self.probe_started_at
+
+    def _open(self) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self.probe_started_at = None
+        self.outcomes.clear()
+        logger.warning(
+            f"Circuit opened for {self.name}, failing fast for {self.reset_timeout}s"
+        )
+
+
 class AsyncProductionHTTPClient:
     def __init__(
         self,
@@ -93,9 +255,21 @@ class AsyncProductionHTTPClient:
         keepalive_expiry: float = 30.0,
         max_attempts: int = 5,  # Total number of attempts (initial + retries)
         default_headers: Optional[dict] = None,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        http_cache: Optional[HTTPValidatorCache] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[RequestHedger] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.base_url = base_url
         self.max_attempts = max_attempts
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.http_cache = http_cache
+        # Validators from this run, persisted only once their data is published
+        self.pending_validators: dict[str, tuple[Optional[str], Optional[str]]] = {}
 
         # Configure timeout with individual timeout controls
         httpx_timeout = httpx.Timeout(
@@ -110,13 +284,18 @@ class AsyncProductionHTTPClient:
             max_connections=max_connections,
             keepalive_expiry=keepalive_expiry,
         )
-        if base_url is not None:
+        # A client passed in belongs to a shared pool and outlives this wrapper
+        self.owns_client = client is None
+        if client is not None:
+            self.client = client
+        elif base_url is not None:
             self.client = httpx.AsyncClient(
                 timeout=httpx_timeout,
                 headers=default_headers,
                 limits=limits,
                 http2=True,
                 base_url=base_url,
+                transport=transport,
             )
         else:
             self.client = httpx.AsyncClient(
@@ -124,11 +303,13 @@ class AsyncProductionHTTPClient:
                 headers=default_headers,
                 limits=limits,
                 http2=True,
+                transport=transport,
             )
 
     async def close(self):
         """Clean up the client and close all connections."""
-        await self.client.aclose()
+        if self.owns_client:
+            await self.client.aclose()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -139,17 +320,49 @@ class AsyncProductionHTTPClient:
         await self.close()
 
     async def request_with_retry(
-        self, method: str, url: str, backoff_starting_delay: float = 1, **kwargs
+        self,
+        method: str,
+        url: str,
+        backoff_starting_delay: float = 1,
+        on_retry: Optional[Callable[[], None]] = None,
+        stream: bool = False,
+        **kwargs,
     ) -> httpx.Response:
-        """Make an HTTP request with automatic retry for transient errors."""
+        """
+        Make an HTTP request with automatic retry for transient errors.
+        on_retry is called before every backoff, letting callers react to 429/5xx and timeouts.
+        With stream=True only the headers are read; the caller must read and close the response.
+        """
         last_exception = None
 
         for attempt in range(self.max_attempts):
+            if self.circuit_breaker is not None:
+                started_at = self.circuit_breaker.before_request()
             try:
-                response = await self.client.request(method, url, **kwargs)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                if stream:
+                    response = await self.client.send(
+                        self.client.build_request(method, url, **kwargs), stream=True
+                    )
+                elif self.hedger is not None and method == "GET":
+                    response = await self._send_hedged(method, url, **kwargs)
+                else:
+                    response = await self.client.request(method, url, **kwargs)
+
+                if self.circuit_breaker is not None:
+                    if (
+                        response.status_code in RETRIABLE_STATUS_CODES
+                        and response.status_code != 429
+                    ):
+                        self.circuit_breaker.record_failure(started_at)
+                    else:
+                        self.circuit_breaker.record_success(started_at)
 
                 if response.status_code in RETRIABLE_STATUS_CODES:
                     if attempt < self.max_attempts - 1:
+                        await response.aclose()
+                        self._fail_fast_if_open(method, url)
                         error_desc = RETRIABLE_STATUS_CODES[response.status_code]
                         backoff = _calculate_backoff_for_response(
                             response.status_code,
@@ -160,20 +373,31 @@ class AsyncProductionHTTPClient:
                         logger.warning(
                             f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
                         )
+                        if on_retry is not None:
+                            on_retry()
                         await asyncio.sleep(backoff)
                         continue
 
+                if stream and response.is_error:
+                    # Error bodies are small; read them so callers can inspect the response
+                    await response.aread()
+                    await response.aclose()
                 response.raise_for_status()
                 return response
 
             except HTTPX_EXCEPTIONS_KEYS as e:
                 last_exception = e
                 error_desc = HTTPX_EXCEPTIONS[type(e)]
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(started_at)
                 if attempt < self.max_attempts - 1:
+                    self._fail_fast_if_open(method, url)
                     backoff = _calculate_backoff(attempt, backoff_starting_delay)
                     logger.warning(
                         f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
                     )
+                    if on_retry is not None:
+                        on_retry()
                     await asyncio.sleep(backoff)
                 else:
                     raise
@@ -182,17 +406,138 @@ class AsyncProductionHTTPClient:
             raise last_exception
         raise RuntimeError("Unexpected error in request_with_retry")
 
-    async def get(self, url: str, backoff_starting_delay: float = 1, **kwargs) -> Any:
-        """GET request with retry logic; returns JSON body as dict/list."""
+    async def _send_hedged(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an idempotent request; if it is still unanswered after the hedge delay and the budget
+        allows, send a duplicate and return whichever response arrives first.
+        """
+        hedger = cast(RequestHedger, self.hedger)
+        hedger.record_request()
+        # Each copy's own start time, so a winning hedge is not charged the hedge delay
+        started_at: dict[asyncio.Task, float] = {}
+
+        def send() -> asyncio.Task:
+            task = asyncio.create_task(self.client.request(method, url, **kwargs))
+            started_at[task] = time.monotonic()
+            return task
+
+        tasks = {send()}
+        try:
+            delay = hedger.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and hedger.try_acquire():
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire()
+                    if any(task.done() for task in tasks):
+                        # The primary answered while we waited on the rate limiter
+                        hedger.release()
+                    else:
+                        logger.debug(f"Hedging {method} {url} after {delay:.3f}s")
+                        tasks.add(send())
+            while True:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                # A failed copy only loses if the other one can still answer
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not tasks:
+                    break
+            winner = succeeded[0] if succeeded else done.pop()
+            response = winner.result()
+            hedger.record_latency(time.monotonic() - started_at[winner])
+            return response
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _fail_fast_if_open(self, method: str, url: str) -> None:
+        """Skip the remaining backoffs once the host's breaker has opened."""
+        if self.circuit_breaker is not None and self.circuit_breaker.is_open:
+            raise CircuitOpenError(
+                f"Circuit open for {self.circuit_breaker.name}, abandoning {method} {url}"
+            )
+
+    async def get(
+        self,
+        url: str,
+        backoff_starting_delay: float = 1,
+        on_retry: Optional[Callable[[], None]] = None,
+        conditional: bool = False,
+        **kwargs,
+    ) -> Any:
+        """
+        GET request with retry logic; returns JSON body as dict/list.
+        With conditional=True and a cache, cached validators are sent and a 304 raises NotModifiedError.
+        """
+        cache_key = None
+        if conditional and self.http_cache is not None:
+            request_url = self.client.build_request(
+                "GET", url, params=kwargs.get("params")
+            ).url
+            cache_key = HTTPValidatorCache.cache_key("GET", str(request_url))
+            validators = await asyncio.to_thread(self.http_cache.get, cache_key)
+            if validators is not None:
+                etag, last_modified = validators
+                headers = dict(kwargs.get("headers") or {})
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+                kwargs["headers"] = headers
+
+        try:
+            response = await self.request_with_retry(
+                "GET", url, backoff_starting_delay, on_retry, **kwargs
+            )
+        except httpx.HTTPStatusError as e:
+            if cache_key is not None and e.response.status_code == 304:
+                raise NotModifiedError(f"{url} has not changed since the last run")
+            raise
+
+        if cache_key is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.pending_validators[cache_key] = (etag, last_modified)
+        return orjson.loads(response.content)
+
+    def commit_validators(self) -> None:
+        """Persist the validators seen this run; call only after their data is published."""
+        if self.http_cache is None:
+            return
+        for cache_key, (etag, last_modified) in self.pending_validators.items():
+            self.http_cache.set(cache_key, etag, last_modified)
+        self.pending_validators.clear()
+
+    async def stream_bytes(
+        self,
+        url: str,
+        backoff_starting_delay: float = 1,
+        on_retry: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> AsyncGenerator[bytes, None]:
+        """GET request that yields the body in chunks as it arrives; retries apply until the headers are received."""
         response = await self.request_with_retry(
-            "GET", url, backoff_starting_delay, **kwargs
+            "GET", url, backoff_starting_delay, on_retry, stream=True, **kwargs
         )
-        return orjson.loads(response.content)
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        finally:
+            await response.aclose()
 
-    async def post(self, url: str, backoff_starting_delay: float = 1, **kwargs) -> Any:
+    async def post(
+        self,
+        url: str,
+        backoff_starting_delay: float = 1,
+        on_retry: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> Any:
         """POST request with retry logic; returns JSON body as dict/list."""
         response = await self.request_with_retry(
-            "POST", url, backoff_starting_delay, **kwargs
+            "POST", url, backoff_starting_delay, on_retry, **kwargs
         )
         return orjson.loads(response.content)
 
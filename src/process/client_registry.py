@@ -0,0 +1,142 @@
+from typing import Callable, Optional
+
+import httpx
+import structlog
+
+from src.process.client import AsyncProductionHTTPClient, CircuitBreaker
+from src.settings import config
+from src.sources.base import APIConfig
+
+logger = structlog.getLogger(__name__)
+
+
+class PoolStats:
+    """Request counters for one pooled client."""
+
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a pooled client's transport to keep its PoolStats. A request leaves in_flight exactly once,
+    when its response headers arrive or when it fails or is cancelled (timeouts, dropped hedge copies).
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: PoolStats):
+        self.transport = transport
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+        try:
+            response = await self.transport.handle_async_request(request)
+        finally:
+            self.stats.in_flight -= 1
+        self.stats.responses += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HTTPClientRegistry:
+    """
+    One pooled HTTP/2 client per origin and client settings, shared by every endpoint for the life of the Processor.
+    Endpoints on the same host reuse warm TLS/HTTP/2 connections instead of opening a pool each;
+    sources with different default headers on one host get separate pools. Circuit breakers are per origin.
+    """
+
+    def __init__(
+        self, transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None
+    ):
+        # Record/replay cassettes swap the network transport under every pooled client
+        self.transport_factory = transport_factory
+        self.clients: dict[tuple, AsyncProductionHTTPClient] = {}
+        self.pool_stats: dict[tuple, PoolStats] = {}
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def origin(url: str) -> str:
+        parsed = httpx.URL(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.host}{port}"
+
+    @classmethod
+    def pool_key(cls, source: APIConfig) -> tuple:
+        return cls.origin(source.base_url), tuple(
+            sorted(source.default_headers.items())
+        )
+
+    def get_client(self, source: APIConfig) -> httpx.AsyncClient:
+        key = self.pool_key(source)
+        if key not in self.clients:
+            stats = PoolStats()
+            transport = (
+                self.transport_factory()
+                if self.transport_factory
+                # An explicit transport ignores the client's limits, so the pool defaults are set here
+                else httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=20,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=30.0,
+                    ),
+                )
+            )
+            pooled = AsyncProductionHTTPClient(
+                default_headers=source.default_headers,
+                transport=CountingTransport(transport, stats),
+            )
+            self.clients[key] = pooled
+            self.pool_stats[key] = stats
+            logger.debug(f"Created pooled HTTP client for {key[0]} ({source.name})")
+        return self.clients[key].client
+
+    def get_circuit_breaker(self, url: str) -> CircuitBreaker:
+        origin = self.origin(url)
+        if origin not in self.circuit_breakers:
+            self.circuit_breakers[origin] = CircuitBreaker(
+                name=origin,
+                failure_rate_threshold=config.CIRCUIT_BREAKER_FAILURE_RATE,
+                minimum_requests=config.CIRCUIT_BREAKER_MIN_REQUESTS,
+                window_size=config.CIRCUIT_BREAKER_WINDOW,
+                reset_timeout=config.CIRCUIT_BREAKER_RESET_SECONDS,
+            )
+        return self.circuit_breakers[origin]
+
+    def stats(self) -> dict[str, dict[str, int | str]]:
+        """Circuit state and request counts per origin, summed over its pools."""
+        stats: dict[str, dict[str, int | str]] = {}
+        for (origin, _headers), pool_stats in self.pool_stats.items():
+            breaker = self.circuit_breakers.get(origin)
+            origin_stats = stats.setdefault(
+                origin,
+                {
+                    "circuit": breaker.state if breaker is not None else "closed",
+                    "pools": 0,
+                    "requests": 0,
+                    "responses": 0,
+                    "in_flight": 0,
+                    "peak_in_flight": 0,
+                },
+            )
+            origin_stats["pools"] += 1
+            origin_stats["requests"] += pool_stats.requests
+            origin_stats["responses"] += pool_stats.responses
+            origin_stats["in_flight"] += pool_stats.in_flight
+            origin_stats["peak_in_flight"] += pool_stats.peak_in_flight
+        return stats
+
+    async def close(self) -> None:
+        if self.clients:
+            logger.info(f"HTTP client pool stats: {self.stats()}")
+        for pooled in self.clients.values():
+            await pooled.close()
+        self.clients.clear()
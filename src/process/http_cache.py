@@ -0,0 +1,112 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+logger = structlog.getLogger(__name__)
+
+
+class HTTPValidatorCache:
+    """
+    Persistent store of ETag / Last-Modified validators keyed by request URL (params included).
+    Only validators are kept: a 304 skips the whole endpoint run, so the body is never needed.
+    Entries expire after ttl_seconds and the least recently used are evicted beyond max_entries.
+    Reads only SELECT; their access times are written in one batch on the next set() or close().
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._accessed: dict[str, float] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_validator_cache (
+                cache_key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def cache_key(method: str, url: str) -> str:
+        # Hashed so credentials passed as query params are not written to disk
+        return hashlib.sha256(f"{method} {url}".encode()).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """Return (etag, last_modified) for a live entry."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, stored_at FROM http_validator_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            etag, last_modified, stored_at = row
+            if now - stored_at > self.ttl_seconds:
+                # Deleted by the next eviction pass
+                return None
+            self._accessed[cache_key] = now
+        return etag, last_modified
+
+    def set(
+        self, cache_key: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT INTO http_validator_cache (cache_key, etag, last_modified, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (cache_key, etag, last_modified, now, now),
+            )
+            self._flush_accessed()
+            self._evict(now)
+            self._connection.commit()
+
+    def _flush_accessed(self) -> None:
+        self._connection.executemany(
+            "UPDATE http_validator_cache SET accessed_at = ? WHERE cache_key = ?",
+            [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute(
+            "DELETE FROM http_validator_cache WHERE stored_at < ?",
+            (now - self.ttl_seconds,),
+        )
+        deleted = self._connection.execute(
+            """
+            DELETE FROM http_validator_cache WHERE cache_key IN (
+                SELECT cache_key FROM http_validator_cache
+                ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        if deleted:
+            logger.debug(f"Evicted {deleted} least recently used HTTP cache entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accessed()
+            self._connection.commit()
+            self._connection.close()
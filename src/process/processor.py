@@ -1,5 +1,6 @@
-from concurrent.futures import ThreadPoolExecutor
-from queue import Empty, Queue
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Optional
 
 import psutil
@@ -10,8 +11,13 @@ from opentelemetry import trace
 from src.notify.factory import NotifierFactory
 from src.notify.webhook import AlertLevel
 from src.pipeline.runner import PipelineRunner
+from src.process.cassette import Cassette
+from src.process.client import AsyncTokenBucket, RequestHedger
+from src.process.client_registry import HTTPClientRegistry
 from src.process.db import setup_db
+from src.process.http_cache import HTTPValidatorCache
 from src.process.tables import create_production_tables, create_watermark_table
+from src.settings import config
 from src.sources.base import APIConfig
 from src.sources.master import MASTER_SOURCE_REGISTRY
 
@@ -24,9 +30,44 @@ class Processor:
     def __init__(self):
         self.engine, self.metadata = setup_db()
         create_watermark_table(self.engine, self.metadata)
+        cpu_count = psutil.cpu_count(logical=False) or 1
+        self.max_concurrent_sources = config.MAX_CONCURRENT_SOURCES or cpu_count
         self._thread_pool_shutdown = False
-        self.thread_pool = None
-        self.api_queue = Queue()
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=config.PARSE_WORKERS or cpu_count,
+            thread_name_prefix="parser",
+        )
+        # Workers are only spawned once an endpoint with parse_in_process submits work
+        self.process_pool = ProcessPoolExecutor(
+            max_workers=config.PARSE_WORKERS or cpu_count,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self.rate_limiters: dict[str, AsyncTokenBucket] = {}
+        self.hedgers: dict[str, RequestHedger] = {}
+        self.cassette = self._load_cassette()
+        self.client_registry = HTTPClientRegistry(
+            transport_factory=(
+                (
+                    lambda: self.cassette.transport(
+                        config.HTTP_CASSETTE_MODE,
+                        latency=config.HTTP_CASSETTE_LATENCY,
+                        bandwidth=config.HTTP_CASSETTE_BANDWIDTH,
+                        reuse_last=config.HTTP_CASSETTE_REUSE_LAST,
+                    )
+                )
+                if self.cassette is not None
+                else None
+            )
+        )
+        self.http_cache = (
+            HTTPValidatorCache(
+                path=config.HTTP_CACHE_PATH,
+                ttl_seconds=config.HTTP_CACHE_TTL_SECONDS,
+                max_entries=config.HTTP_CACHE_MAX_ENTRIES,
+            )
+            if config.HTTP_CACHE_PATH
+            else None
+        )
         self.results: list[tuple[bool, str, Optional[str]]] = []
         logger.info("Processor Initialized")
 
@@ -45,7 +86,17 @@ class Processor:
                 f"Available endpoints: {available}"
             )
         endpoint_config = source.endpoints[endpoint]
-        create_production_tables(endpoint_config, self.engine, self.metadata)
+        circuit_breaker = self.client_registry.get_circuit_breaker(source.base_url)
+        if circuit_breaker.is_open:
+            # Host is down: give the worker slot back instead of waiting out retries
+            logger.warning(f"Skipping {name}/{endpoint}: circuit open for its host")
+            self.results.append(
+                (False, source.base_url, f"Circuit open for {circuit_breaker.name}")
+            )
+            return
+        await asyncio.to_thread(
+            create_production_tables, endpoint_config, self.engine, self.metadata
+        )
 
         with tracer.start_as_current_span(f"API: {name} - Endpoint: {endpoint}"):
             runner = PipelineRunner(
@@ -54,47 +105,118 @@ class Processor:
                 endpoint_config=endpoint_config,
                 engine=self.engine,
                 metadata=self.metadata,
+                parse_executor=(
+                    self.process_pool
+                    if endpoint_config.parse_in_process
+                    else self.thread_pool
+                ),
+                rate_limiter=self.get_rate_limiter(source),
+                http_cache=self.http_cache,
+                http_client=self.client_registry.get_client(source),
+                circuit_breaker=circuit_breaker,
+                hedger=self.get_hedger(source),
             )
             result = await runner.run()
             self.results.append(result)
 
+    def get_rate_limiter(self, source: APIConfig) -> Optional[AsyncTokenBucket]:
+        """One token bucket per source, shared by all of its endpoints."""
+        if source.rate_limit is None:
+            return None
+        if source.name not in self.rate_limiters:
+            self.rate_limiters[source.name] = AsyncTokenBucket(
+                rate=source.rate_limit.requests_per_second,
+                burst=source.rate_limit.burst,
+            )
+        return self.rate_limiters[source.name]
+
+    def get_hedger(self, source: APIConfig) -> Optional[RequestHedger]:
+        """One hedge budget and latency history per source, shared by all of its endpoints."""
+        if source.hedge is None:
+            return None
+        if source.name not in self.hedgers:
+            self.hedgers[source.name] = RequestHedger(
+                percentile=source.hedge.percentile,
+                budget=source.hedge.budget,
+                min_samples=source.hedge.min_samples,
+            )
+        return self.hedgers[source.name]
+
     async def process_api(self, name: str) -> None:
         source = MASTER_SOURCE_REGISTRY.get_source(name)
-        # Process Sequentially to respect API rate-limits
-        for endpoint in source.endpoints.keys():
-            await self.process_endpoint(name, endpoint, source)
-
-    def _worker(self):
-        async def worker_loop():
-            while True:
-                try:
-                    api = self.api_queue.get_nowait()
-                    await self.process_api(api.name)
-                    self.api_queue.task_done()
-                except Empty:
-                    break
-
-        return uvloop.run(worker_loop())
-
-    def process(self) -> None:
-        self.thread_pool = ThreadPoolExecutor(
-            max_workers=psutil.cpu_count(logical=False)
+        if source.rate_limit is None:
+            # Process Sequentially to respect undeclared API rate-limits
+            for endpoint in source.endpoints.keys():
+                await self.process_endpoint(name, endpoint, source)
+            return
+        # The shared token bucket paces requests, so endpoints can run in parallel
+        outcomes = await asyncio.gather(
+            *(
+                self.process_endpoint(name, endpoint, source)
+                for endpoint in source.endpoints.keys()
+            ),
+            return_exceptions=True,
         )
-        for source in MASTER_SOURCE_REGISTRY.get_all_sources():
-            self.api_queue.put_nowait(source)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+
+    async def _process_api_limited(self, name: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            await self.process_api(name)
+
+    async def process_all(self) -> None:
+        """Run every source as a task on one event loop, capped by MAX_CONCURRENT_SOURCES."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
+        sources = MASTER_SOURCE_REGISTRY.get_all_sources()
+        outcomes = await asyncio.gather(
+            *(self._process_api_limited(source.name, semaphore) for source in sources),
+            return_exceptions=True,
+        )
+        for source, outcome in zip(sources, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error processing API {source.name}: {outcome}")
+                self.results.append((False, source.base_url, str(outcome)))
+
+    @staticmethod
+    def _load_cassette() -> Optional[Cassette]:
+        if config.HTTP_CASSETTE_MODE is None:
+            return None
+        if not config.HTTP_CASSETTE_PATH:
+            raise ValueError(
+                "HTTP_CASSETTE_PATH is required when HTTP_CASSETTE_MODE is set"
+            )
+        redact_params = config.HTTP_CASSETTE_REDACT_PARAMS
+        if config.HTTP_CASSETTE_MODE == "replay":
+            return Cassette.load(config.HTTP_CASSETTE_PATH, redact_params=redact_params)
+        return Cassette(config.HTTP_CASSETTE_PATH, redact_params=redact_params)
+
+    async def close_clients(self) -> None:
+        """Close the pooled HTTP clients; must run on the loop that used them."""
+        await self.client_registry.close()
+        if self.cassette is not None and config.HTTP_CASSETTE_MODE == "record":
+            self.cassette.save()
+
+    async def _process_all_and_close(self) -> None:
+        try:
+            await self.process_all()
+        finally:
+            await self.close_clients()
+
+    def shutdown(self) -> None:
+        if not self._thread_pool_shutdown:
+            self.thread_pool.shutdown(wait=True)
+            self.process_pool.shutdown(wait=True)
+            if self.http_cache is not None:
+                self.http_cache.close()
+            self._thread_pool_shutdown = True
 
+    def process(self) -> None:
         try:
-            futures = [
-                self.thread_pool.submit(self._worker)
-                for _ in range(self.thread_pool._max_workers)
-            ]
-            for future in futures:
-                future.result()
+            uvloop.run(self._process_all_and_close())
             self.results_summary()
         finally:
-            if not self._thread_pool_shutdown:
-                self.thread_pool.shutdown(wait=True)
-                self._thread_pool_shutdown = True
+            self.shutdown()
 
     def results_summary(self):
         success_count = 0
@@ -127,8 +249,7 @@ class Processor:
             webhook_notifier.notify()
 
     def __del__(self):
-        if hasattr(self, "_thread_pool_shutdown") and hasattr(self, "thread_pool"):
-            if not self._thread_pool_shutdown and self.thread_pool:
-                logger.warning("Processor thread pool not shut down before deletion")
-                self.thread_pool.shutdown(wait=True)
-                self._thread_pool_shutdown = True
+        if hasattr(self, "_thread_pool_shutdown") and hasattr(self, "process_pool"):
+            if not self._thread_pool_shutdown:
+                logger.warning("Processor worker pools not shut down before deletion")
+                self.shutdown()
@@ -67,7 +67,36 @@ class GlobalConfig(BaseConfig):
     OPEN_TELEMETRY_FLAG: bool = False
 
     BATCH_SIZE: int = 10000
+    PIPELINE_QUEUE_SIZE: int = 2  # Batches buffered between read, parse and write
+    MAX_CONCURRENT_SOURCES: Optional[int] = None  # Defaults to physical CPU count
+    PARSE_WORKERS: Optional[int] = None  # Defaults to physical CPU count
     DATABASE_URL: Optional[AnyUrl] = None
+    POSTGRESQL_COPY_FORMAT: Literal["text", "binary"] = "text"
+    HTTP_CACHE_PATH: Optional[str] = (
+        None  # SQLite file for ETag/Last-Modified validators
+    )
+    HTTP_CACHE_TTL_SECONDS: float = 7 * 24 * 60 * 60
+    HTTP_CACHE_MAX_ENTRIES: int = 10000
+    CIRCUIT_BREAKER_FAILURE_RATE: float = (
+        0.5  # Failed share of recent attempts that opens a host's circuit
+    )
+    CIRCUIT_BREAKER_MIN_REQUESTS: int = 10
+    CIRCUIT_BREAKER_WINDOW: int = 20
+    CIRCUIT_BREAKER_RESET_SECONDS: float = 30.0
+    HTTP_CASSETTE_MODE: Optional[Literal["record", "replay"]] = None
+    HTTP_CASSETTE_PATH: Optional[str] = None  # gzip JSON-lines archive of responses
+    HTTP_CASSETTE_LATENCY: float = 0.0  # Replay: seconds added to every response
+    HTTP_CASSETTE_BANDWIDTH: Optional[float] = None  # Replay: simulated bytes/sec
+    HTTP_CASSETTE_REUSE_LAST: bool = (
+        False  # Replay: serve the last response once a request's recordings run out
+    )
+    HTTP_CASSETTE_REDACT_PARAMS: list[str] = [  # Query params masked in cassette keys
+        "appid",
+        "api_key",
+        "apikey",
+        "access_token",
+        "token",
+    ]
 
     @property
     def DRIVERNAME(self) -> str:
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any, Literal, Optional, Type
 
 from pydantic import BaseModel, Field, model_validator
@@ -21,6 +22,9 @@ class TableBatch:
     def add_record(self, record: dict):
         self._records.append(record)
 
+    def add_records(self, records: list[dict]):
+        self._records.extend(records)
+
     def clear_records(self):
         self._records = []
 
@@ -49,6 +53,36 @@ class OffsetPaginationConfig(PaginationConfig):
     offset: int
     limit: int
 
+    """Upper bound for the adaptive request window; defaults to max_concurrent, so growing past it is opt-in."""
+    max_concurrent_ceiling: Optional[int] = Field(default=None)
+
+    """Key path to the total record count on the first page (e.g. 'total'); bounds the offsets requested."""
+    total_key: Optional[str] = Field(default=None)
+
+    """Yield pages in offset order; disable to yield each page as soon as it arrives."""
+    ordered: bool = Field(default=True)
+
+
+class CursorPartitionConfig(BaseModel):
+    """
+    Split [start, end) into equal time slices that are paginated concurrently,
+    each with its own cursor chain (e.g. Stripe's created[gte]/created[lt] filters).
+    `end` is required: slice bounds key the per-slice watermarks, so they must not move between runs.
+    """
+
+    start: datetime
+    end: datetime
+    partitions: int = Field(default=4, ge=1)
+    lower_param: str = Field(default="created[gte]")
+    upper_param: str = Field(default="created[lt]")
+    value_format: Literal["unix", "iso"] = Field(default="unix")
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        if self.end <= self.start:
+            raise ValueError("partition end must be after start")
+        return self
+
 
 class CursorPaginationConfig(PaginationConfig):
     cursor_param: str = Field(default="cursor")
@@ -59,10 +93,18 @@ class CursorPaginationConfig(PaginationConfig):
     """Optional value for the first request when no cursor/watermark (e.g. '0' for offset-style)."""
     initial_value: Optional[str] = Field(default=None)
 
+    """Pages fetched ahead of the consumer while it parses and writes; 0 fetches strictly in turn."""
+    lookahead: int = Field(default=0, ge=0)
+
+    partition: Optional[CursorPartitionConfig] = None
+
 
 class NextUrlPaginationConfig(PaginationConfig):
     next_url_key: str = Field(default="next_url")
 
+    """Pages fetched ahead of the consumer while it parses and writes; 0 fetches strictly in turn."""
+    lookahead: int = Field(default=0, ge=0)
+
 
 class QueryPaginationConfig(PaginationConfig):
     """
@@ -74,11 +116,74 @@ class QueryPaginationConfig(PaginationConfig):
     value_in: Literal["path", "params"]
     max_concurrent: int = Field(default=10)
 
+    """Rows fetched per round trip from the server-side cursor; bounds memory for large queries."""
+    query_batch_size: int = Field(default=1000, ge=1)
+
+    """Skip rows that resolve to a URL already requested in this run."""
+    deduplicate: bool = Field(default=False)
+
+    """URLs remembered for deduplicate (as 64-bit hashes, oldest forgotten first); bounds memory for huge queries."""
+    deduplicate_max_urls: int = Field(default=1_000_000, ge=1)
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side token bucket shared by all endpoints of a source."""
+
+    requests_per_second: float = Field(gt=0)
+    burst: int = Field(default=1, ge=1)
+
+
+class HedgeConfig(BaseModel):
+    """Duplicate GETs still unanswered after the `percentile` latency; first response wins."""
+
+    percentile: float = Field(default=0.95, gt=0, lt=1)
+
+    """Share of GETs that may be duplicated, so hedging cannot double rate-limit usage."""
+    budget: float = Field(default=0.05, gt=0, le=1)
+
+    """Latencies observed before the percentile is trusted; no hedging until then."""
+    min_samples: int = Field(default=20, ge=1)
+
+
+class GraphQLCursorPaginationConfig(PaginationConfig):
+    """
+    Relay-style pagination: pageInfo.endCursor is sent back as the `after` variable
+    until pageInfo.hasNextPage is false.
+    """
+
+    page_info_key: str
+    cursor_variable: str = Field(default="after")
+    page_size_variable: Optional[str] = Field(default=None)
+    page_size: Optional[int] = Field(default=None)
+
+    """Pages fetched ahead of the consumer while it parses and writes; 0 fetches strictly in turn."""
+    lookahead: int = Field(default=0, ge=0)
+
+
+class GraphQLPagePaginationConfig(PaginationConfig):
+    """
+    Page-number pagination through a query variable (e.g. `page`).
+    When total_pages_key is found on the first page, the remaining pages are fanned out concurrently;
+    otherwise next_page_key is followed until it is null.
+    """
+
+    page_variable: str = Field(default="page")
+    start_page: int = Field(default=1)
+    next_page_key: Optional[str] = Field(default=None)
+    total_pages_key: Optional[str] = Field(default=None)
+    max_concurrent: int = Field(default=5, ge=1)
+
+    """Fan-out pages packed into one POST as a JSON array; needs a server that accepts batched operations."""
+    operations_per_request: int = Field(default=1, ge=1)
+
 
 class TableConfig(BaseModel):
     data_model: Type[SQLModel]
     audit_query: Optional[str] = None
 
+    """Trusted sources only: skip Pydantic validation and coerce to the SQL column types."""
+    skip_validation: bool = Field(default=False)
+
 
 class APIEndpointConfig(BaseModel):
     json_entrypoint: Optional[str] = None
@@ -87,11 +192,22 @@ class APIEndpointConfig(BaseModel):
     backoff_starting_delay: float = Field(default=1)
     incremental: bool = Field(default=False)
     tables: list[TableConfig]
-    pagination_strategy: Optional[Literal["offset", "next_url", "cursor", "query"]] = (
-        None
-    )
+    pagination_strategy: Optional[
+        Literal[
+            "offset", "next_url", "cursor", "query", "graphql_cursor", "graphql_page"
+        ]
+    ] = None
     pagination: Optional[PaginationConfig] = None
 
+    """CPU-bound endpoints: parse in the Processor's process pool instead of threads."""
+    parse_in_process: bool = Field(default=False)
+
+    """Unpaginated REST endpoints: decode items under json_entrypoint as the body streams in."""
+    stream_response: bool = Field(default=False)
+
+    """Unpaginated endpoints: send cached ETag/Last-Modified; a 304 skips the whole run."""
+    conditional_requests: bool = Field(default=False)
+
 
 class APIConfig(BaseModel):
     name: str
@@ -102,11 +218,16 @@ class APIConfig(BaseModel):
     default_headers: dict[str, str] = Field(default_factory=dict)
     default_params: dict[str, Any] = Field(default_factory=dict)
 
-    pagination_strategy: Optional[Literal["offset", "next_url", "cursor", "query"]] = (
-        None
-    )
+    pagination_strategy: Optional[
+        Literal[
+            "offset", "next_url", "cursor", "query", "graphql_cursor", "graphql_page"
+        ]
+    ] = None
     pagination: Optional[PaginationConfig] = None
 
+    rate_limit: Optional[RateLimitConfig] = None
+    hedge: Optional[HedgeConfig] = None
+
     authentication_strategy: Optional[Literal["auth", "bearer"]] = None
     authentication_params: dict[str, Any] = Field(default_factory=dict)
 
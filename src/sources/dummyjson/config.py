@@ -18,6 +18,7 @@ DUMMYJSON_CONFIG = APIConfig(
         max_concurrent=5,
         offset=0,
         limit=10,
+        total_key="total",
     ),
     endpoints={
         "products": APIEndpointConfig(
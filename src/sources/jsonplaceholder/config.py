@@ -8,6 +8,7 @@ JSONPLACEHOLDER_CONFIG = APIConfig(
     endpoints={
         "posts": APIEndpointConfig(
             json_entrypoint=None,
+            conditional_requests=True,
             tables=[
                 TableConfig(data_model=JSONPlaceholderPosts),
             ],
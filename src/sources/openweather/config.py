@@ -17,12 +17,13 @@ OPENWEATHER_CONFIG = APIConfig(
     },
     endpoints={
         "onecall": APIEndpointConfig(
+            conditional_requests=True,
             tables=[
                 TableConfig(data_model=OpenWeatherCurrent),
                 TableConfig(data_model=OpenWeatherMinute),
                 TableConfig(data_model=OpenWeatherHourly),
                 TableConfig(data_model=OpenWeatherDaily),
-            ]
+            ],
         )
     },
 )
@@ -16,6 +16,7 @@ POLYGON_CONFIG = APIConfig(
     pagination_strategy="next_url",
     pagination=NextUrlPaginationConfig(
         next_url_key="next_url",
+        lookahead=2,
     ),
     default_params={"limit": 1000},
     endpoints={
@@ -24,7 +25,7 @@ POLYGON_CONFIG = APIConfig(
             incremental=True,
             backoff_starting_delay=60,
             tables=[
-                TableConfig(data_model=PolygonTickers),
+                TableConfig(data_model=PolygonTickers, skip_validation=True),
             ],
         )
     },
@@ -1,4 +1,9 @@
-from src.sources.base import APIConfig, APIEndpointConfig, TableConfig
+from src.sources.base import (
+    APIConfig,
+    APIEndpointConfig,
+    GraphQLPagePaginationConfig,
+    TableConfig,
+)
 from src.sources.rickandmorty.models.characters import RickAndMortyCharacters
 
 RICKANDMORTY_CONFIG = APIConfig(
@@ -35,6 +40,13 @@ RICKANDMORTY_CONFIG = APIConfig(
             tables=[
                 TableConfig(data_model=RickAndMortyCharacters),
             ],
+            pagination_strategy="graphql_page",
+            pagination=GraphQLPagePaginationConfig(
+                page_variable="page",
+                next_page_key="data.characters.info.next",
+                total_pages_key="data.characters.info.pages",
+                max_concurrent=5,
+            ),
         )
     },
 )
@@ -20,6 +20,7 @@ STRIPE_CONFIG = APIConfig(
         next_cursor_key="data[-1].id",
         limit_param="limit",
         limit=100,
+        lookahead=2,
     ),
     endpoints={
         "charges": APIEndpointConfig(
@@ -6,15 +6,26 @@ os.environ["ENV_STATE"] = "test"
 import pytest
 import pytest_asyncio
 from pytest_httpx import HTTPXMock
-from sqlalchemy import text
+from sqlalchemy import MetaData, create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from src.process.client import AsyncProductionHTTPClient
 from src.process.db import setup_db
 from src.process.tables import create_watermark_table
+from src.tests.fixtures.test_configs.graphql_configs import (
+    TEST_GRAPHQL_CONFIG_PAGE_PAGINATION,
+    TEST_GRAPHQL_CONFIG_RELAY_PAGINATION,
+)
 from src.tests.fixtures.test_responses.graphql_no_pagination import (
     TEST_GRAPHQL_SINGLE_REQUEST_RESPONSE,
 )
+from src.tests.fixtures.test_responses.graphql_pagination import (
+    TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES,
+    TEST_GRAPHQL_RELAY_PAGINATION_RESPONSES,
+)
+from src.tests.fixtures.test_responses.json_parser_responses import (
+    TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE,
+)
 from src.tests.fixtures.test_responses.rest_cursor_pagination import (
     TEST_REST_CURSOR_PAGINATION_PAGE_1_RESPONSE,
     TEST_REST_CURSOR_PAGINATION_PAGE_2_RESPONSE,
@@ -73,6 +84,14 @@ def mock_rest_offset_pagination_responses(httpx_mock: HTTPXMock):
         method="GET",
         url="https://api.example.com/items?offset=15&limit=5",
         json={"items": []},
+        is_optional=True,
+    )
+    # The window can run one page further ahead when offset 15 lands before the last page
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.example.com/items?offset=20&limit=5",
+        json={"items": []},
+        is_optional=True,
     )
     yield httpx_mock
 
@@ -132,6 +151,33 @@ def mock_graphql_no_pagination_response(httpx_mock: HTTPXMock):
     yield httpx_mock
 
 
+@pytest.fixture
+def mock_graphql_page_pagination_responses(httpx_mock: HTTPXMock):
+    body = TEST_GRAPHQL_CONFIG_PAGE_PAGINATION.endpoints["items"].body
+    for page, response in TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES.items():
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/graphql",
+            match_json={**body, "variables": {"page": page}},
+            json=response,
+        )
+    yield httpx_mock
+
+
+@pytest.fixture
+def mock_graphql_relay_pagination_responses(httpx_mock: HTTPXMock):
+    body = TEST_GRAPHQL_CONFIG_RELAY_PAGINATION.endpoints["items"].body
+    for cursor, response in TEST_GRAPHQL_RELAY_PAGINATION_RESPONSES.items():
+        variables = {"first": 2} if cursor is None else {"first": 2, "after": cursor}
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/graphql",
+            match_json={**body, "variables": variables},
+            json=response,
+        )
+    yield httpx_mock
+
+
 @pytest.fixture
 def test_db():
     """(engine, SessionFactory). query_input table is created and seeded for query-pagination tests."""
@@ -171,6 +217,14 @@ def mock_rest_offset_pagination_incremental_first_run(httpx_mock: HTTPXMock):
         method="GET",
         url="https://api.example.com/items?offset=15&limit=5",
         json={"items": []},
+        is_optional=True,
+    )
+    # The window can run one page further ahead when offset 15 lands before the last page
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.example.com/items?offset=20&limit=5",
+        json={"items": []},
+        is_optional=True,
     )
     yield httpx_mock
 
@@ -181,11 +235,20 @@ def mock_rest_offset_pagination_incremental_second_run(httpx_mock: HTTPXMock):
         method="GET",
         url="https://api.example.com/items?offset=12&limit=5",
         json={"items": []},
+        is_optional=True,
     )
     httpx_mock.add_response(
         method="GET",
         url="https://api.example.com/items?offset=17&limit=5",
         json={"items": []},
+        is_optional=True,
+    )
+    # The window can run one page further ahead when offset 17 lands before the last page
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.example.com/items?offset=22&limit=5",
+        json={"items": []},
+        is_optional=True,
     )
     yield httpx_mock
 
@@ -277,3 +340,48 @@ def mock_rest_query_pagination_params_responses(httpx_mock: HTTPXMock):
             json={"result": {"id": item_id, "ip": ip}},
         )
     yield httpx_mock
+
+
+@pytest.fixture
+def sqlite_file_db(tmp_path):
+    """File-backed SQLite engine so worker threads share the stage tables."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pipeline.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    metadata = MetaData()
+    create_watermark_table(engine, metadata)
+    yield engine, metadata
+    engine.dispose()
+
+
+@pytest.fixture
+def file_db(sqlite_file_db):
+    """(engine, SessionFactory) on a file database, for watermark and query reads run in threads."""
+    engine, _metadata = sqlite_file_db
+    yield engine, sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def query_db(file_db):
+    """file_db seeded with query_input, for query pagination run in threads."""
+    engine, Session = file_db
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE query_input (ip TEXT)"))
+        conn.execute(
+            text(
+                "INSERT INTO query_input (ip) VALUES ('1.2.3.4'), ('5.6.7.8'), ('9.10.11.12')"
+            )
+        )
+    yield engine, Session
+
+
+@pytest.fixture
+def mock_rest_products_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.example.com/products",
+        json={"products": TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE},
+        is_reusable=True,
+    )
+    yield httpx_mock
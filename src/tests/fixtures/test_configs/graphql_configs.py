@@ -1,4 +1,10 @@
-from src.sources.base import APIConfig, APIEndpointConfig, TableConfig
+from src.sources.base import (
+    APIConfig,
+    APIEndpointConfig,
+    GraphQLCursorPaginationConfig,
+    GraphQLPagePaginationConfig,
+    TableConfig,
+)
 from src.tests.fixtures.test_models.rest_models import TestItem
 
 TEST_GRAPHQL_CONFIG_NO_PAGINATION = APIConfig(
@@ -24,3 +30,77 @@ TEST_GRAPHQL_CONFIG_NO_PAGINATION = APIConfig(
         )
     },
 )
+
+TEST_GRAPHQL_CONFIG_PAGE_PAGINATION = APIConfig(
+    name="test_graphql_page_pagination",
+    base_url="https://api.example.com/graphql",
+    type="graphql",
+    endpoints={
+        "items": APIEndpointConfig(
+            json_entrypoint="data.items.results",
+            body={
+                "query": """
+                query GetItems($page: Int) {
+                  items(page: $page) {
+                    info {
+                      pages
+                      next
+                    }
+                    results {
+                      id
+                      name
+                    }
+                  }
+                }
+                """,
+                "variables": {"page": 1},
+            },
+            tables=[
+                TableConfig(data_model=TestItem),
+            ],
+            pagination_strategy="graphql_page",
+            pagination=GraphQLPagePaginationConfig(
+                page_variable="page",
+                next_page_key="data.items.info.next",
+                total_pages_key="data.items.info.pages",
+                max_concurrent=2,
+            ),
+        )
+    },
+)
+
+TEST_GRAPHQL_CONFIG_RELAY_PAGINATION = APIConfig(
+    name="test_graphql_relay_pagination",
+    base_url="https://api.example.com/graphql",
+    type="graphql",
+    endpoints={
+        "items": APIEndpointConfig(
+            json_entrypoint="data.items.nodes",
+            body={
+                "query": """
+                query GetItems($first: Int, $after: String) {
+                  items(first: $first, after: $after) {
+                    pageInfo {
+                      endCursor
+                      hasNextPage
+                    }
+                    nodes {
+                      id
+                      name
+                    }
+                  }
+                }
+                """,
+            },
+            tables=[
+                TableConfig(data_model=TestItem),
+            ],
+            pagination_strategy="graphql_cursor",
+            pagination=GraphQLCursorPaginationConfig(
+                page_info_key="data.items.pageInfo",
+                page_size_variable="first",
+                page_size=2,
+            ),
+        )
+    },
+)
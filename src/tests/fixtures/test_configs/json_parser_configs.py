@@ -4,11 +4,14 @@ from src.tests.fixtures.test_models.json_parser_models import (
     TestInvoiceLineItem,
     TestListItem,
     TestProduct,
+    TestProductWithConfig,
     TestProductWithList,
     TestProductWithMaxLength,
     TestProductWithNested,
+    TestProductWithValidator,
     TestReview,
     TestTransaction,
+    TestVariantPrice,
 )
 
 TEST_JSON_PARSER_CONFIG_SIMPLE = APIConfig(
@@ -111,3 +114,59 @@ TEST_JSON_PARSER_CONFIG_MAX_LENGTH = APIConfig(
         )
     },
 )
+
+TEST_JSON_PARSER_CONFIG_INDEXED_WILDCARD = APIConfig(
+    name="test_json_parser_indexed_wildcard",
+    base_url="https://api.example.com/",
+    type="rest",
+    endpoints={
+        "products": APIEndpointConfig(
+            json_entrypoint="products",
+            tables=[
+                TableConfig(data_model=TestVariantPrice),
+            ],
+        )
+    },
+)
+
+TEST_JSON_PARSER_CONFIG_WITH_VALIDATOR = APIConfig(
+    name="test_json_parser_with_validator",
+    base_url="https://api.example.com/",
+    type="rest",
+    endpoints={
+        "products": APIEndpointConfig(
+            json_entrypoint="products",
+            tables=[
+                TableConfig(data_model=TestProductWithValidator),
+            ],
+        )
+    },
+)
+
+TEST_JSON_PARSER_CONFIG_SKIP_VALIDATION = APIConfig(
+    name="test_json_parser_skip_validation",
+    base_url="https://api.example.com/",
+    type="rest",
+    endpoints={
+        "products": APIEndpointConfig(
+            json_entrypoint="products",
+            tables=[
+                TableConfig(data_model=TestProductWithNested, skip_validation=True),
+            ],
+        )
+    },
+)
+
+TEST_JSON_PARSER_CONFIG_WITH_MODEL_CONFIG = APIConfig(
+    name="test_json_parser_with_model_config",
+    base_url="https://api.example.com/",
+    type="rest",
+    endpoints={
+        "products": APIEndpointConfig(
+            json_entrypoint="products",
+            tables=[
+                TableConfig(data_model=TestProductWithConfig),
+            ],
+        )
+    },
+)
@@ -86,6 +86,30 @@ TEST_REST_CONFIG_WITH_CURSOR_PAGINATION = APIConfig(
     },
 )
 
+TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL = APIConfig(
+    name="test_api_offset_pagination_total",
+    base_url="https://api.example.com",
+    type="rest",
+    pagination_strategy="offset",
+    pagination=OffsetPaginationConfig(
+        offset_param="offset",
+        limit_param="limit",
+        start_offset=0,
+        max_concurrent=2,
+        offset=0,
+        limit=5,
+        total_key="total",
+    ),
+    endpoints={
+        "items": APIEndpointConfig(
+            json_entrypoint="items",
+            tables=[
+                TableConfig(data_model=TestItem),
+            ],
+        )
+    },
+)
+
 TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_INCREMENTAL = APIConfig(
     name="test_api_offset_pagination_incremental",
     base_url="https://api.example.com",
@@ -1,3 +1,4 @@
+from pydantic import field_serializer, field_validator
 from pydantic_extra_types.pendulum_dt import DateTime
 from sqlmodel import Field, SQLModel
 
@@ -32,6 +33,11 @@ class TestReview(SQLModel, table=True):
     comment: str = Field(alias="root.reviews[*].comment")
 
 
+class TestReviewer(SQLModel, table=True):
+    product_id: int = Field(primary_key=True, alias="root.reviews[*].productId")
+    reviewer_name: str = Field(primary_key=True, alias="root.reviews[*].reviewerName")
+
+
 class TestListItem(SQLModel, table=True):
     id: int = Field(primary_key=True, alias="root.id")
     title: str = Field(alias="root.title")
@@ -76,3 +82,32 @@ class TestProductWithMaxLength(SQLModel, table=True):
     id: int = Field(primary_key=True, alias="root.id")
     name: str = Field(alias="root.name")
     code: str = Field(max_length=3, alias="root.code")
+
+
+class TestVariantPrice(SQLModel, table=True):
+    product_id: int = Field(primary_key=True, alias="root.id")
+    sku: str = Field(primary_key=True, alias="root.variants[*].sku")
+    first_price: float = Field(alias="root.variants[*].prices[0].amount")
+    primary_image: str = Field(alias="root.images[0]")
+
+
+class TestProductWithValidator(SQLModel, table=True):
+    id: int = Field(primary_key=True, alias="root.id")
+    name: str = Field(alias="root.name")
+
+    @field_validator("name")
+    @classmethod
+    def upper_name(cls, value: str) -> str:
+        return value.upper()
+
+
+class TestProductWithConfig(SQLModel, table=True):
+    model_config = {"str_strip_whitespace": True}
+
+    id: int = Field(primary_key=True, alias="root.id")
+    name: str = Field(alias="root.name")
+    category: str = Field(alias="root.category")
+
+    @field_serializer("category")
+    def lower_category(self, value: str) -> str:
+        return value.lower()
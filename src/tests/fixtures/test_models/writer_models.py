@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON
+from sqlmodel import Field, SQLModel
+
+
+class TestEvent(SQLModel, table=True):
+    id: int = Field(primary_key=True)
+    name: Optional[str] = None
+    payload: Optional[dict] = Field(default=None, sa_type=JSON)
+    created_at: datetime
@@ -0,0 +1,45 @@
+TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES = {
+    1: {
+        "data": {
+            "items": {
+                "info": {"pages": 3, "next": 2},
+                "results": [{"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"}],
+            }
+        }
+    },
+    2: {
+        "data": {
+            "items": {
+                "info": {"pages": 3, "next": 3},
+                "results": [{"id": 3, "name": "Item 3"}, {"id": 4, "name": "Item 4"}],
+            }
+        }
+    },
+    3: {
+        "data": {
+            "items": {
+                "info": {"pages": 3, "next": None},
+                "results": [{"id": 5, "name": "Item 5"}],
+            }
+        }
+    },
+}
+
+TEST_GRAPHQL_RELAY_PAGINATION_RESPONSES = {
+    None: {
+        "data": {
+            "items": {
+                "pageInfo": {"endCursor": "cursor_2", "hasNextPage": True},
+                "nodes": [{"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"}],
+            }
+        }
+    },
+    "cursor_2": {
+        "data": {
+            "items": {
+                "pageInfo": {"endCursor": "cursor_3", "hasNextPage": False},
+                "nodes": [{"id": 3, "name": "Item 3"}],
+            }
+        }
+    },
+}
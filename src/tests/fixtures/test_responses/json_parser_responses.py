@@ -164,3 +164,21 @@ TEST_JSON_PARSER_DEEPLY_NESTED_RESPONSE = [
         ],
     },
 ]
+
+TEST_JSON_PARSER_INDEXED_WILDCARD_RESPONSE = [
+    {
+        "id": 1,
+        "images": ["front.jpg", "back.jpg"],
+        "variants": [
+            {"sku": "SKU-1-S", "prices": [{"amount": 9.99}, {"amount": 8.99}]},
+            {"sku": "SKU-1-M", "prices": [{"amount": 10.99}]},
+        ],
+    },
+    {
+        "id": 2,
+        "images": ["only.jpg"],
+        "variants": [
+            {"sku": "SKU-2-L", "prices": [{"amount": 12.5}]},
+        ],
+    },
+]
@@ -0,0 +1,413 @@
+import asyncio
+import gzip
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from src.exception.base import CassetteMissError, CircuitOpenError, NotModifiedError
+from src.process.cassette import Cassette
+from src.process.client import (
+    AsyncProductionHTTPClient,
+    AsyncTokenBucket,
+    CircuitBreaker,
+    RequestHedger,
+)
+from src.process.client_registry import HTTPClientRegistry
+from src.process.http_cache import HTTPValidatorCache
+from src.tests.fixtures.test_configs.rest_configs import TEST_REST_CONFIG_NO_PAGINATION
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces():
+    bucket = AsyncTokenBucket(rate=20, burst=2)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.02
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+    # 4 tokens beyond the burst at 20/sec take ~0.2s
+    assert time.monotonic() - start >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_client_rate_limiter_is_shared_between_clients(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.example.com/items", json={"ok": True}, is_reusable=True
+    )
+    bucket = AsyncTokenBucket(rate=20, burst=1)
+    clients = [AsyncProductionHTTPClient(rate_limiter=bucket) for _ in range(2)]
+
+    start = time.monotonic()
+    responses = await asyncio.gather(
+        *(
+            client.get("https://api.example.com/items")
+            for client in clients
+            for _ in range(2)
+        )
+    )
+    elapsed = time.monotonic() - start
+    for client in clients:
+        await client.close()
+
+    assert responses == [{"ok": True}] * 4
+    assert len(httpx_mock.get_requests()) == 4
+    assert elapsed >= 0.14
+
+
+@pytest.mark.asyncio
+async def test_client_conditional_get_raises_not_modified(
+    httpx_mock: HTTPXMock, tmp_path
+):
+    url = "https://api.example.com/items?page=1"
+    httpx_mock.add_response(url=url, json={"ok": True}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(
+        url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+    )
+    cache = HTTPValidatorCache(
+        str(tmp_path / "http_cache.db"), ttl_seconds=60, max_entries=10
+    )
+    client = AsyncProductionHTTPClient(http_cache=cache)
+
+    assert await client.get(
+        "https://api.example.com/items", conditional=True, params={"page": 1}
+    ) == {"ok": True}
+    # Validators are only persisted once the run commits them
+    key = HTTPValidatorCache.cache_key("GET", url)
+    assert cache.get(key) is None
+    client.commit_validators()
+    assert cache.get(key) == ('"v1"', None)
+
+    with pytest.raises(NotModifiedError):
+        await client.get(
+            "https://api.example.com/items", conditional=True, params={"page": 1}
+        )
+    await client.close()
+    cache.close()
+
+
+def test_http_validator_cache_evicts_expired_and_least_recently_used(tmp_path):
+    cache = HTTPValidatorCache(
+        str(tmp_path / "http_cache.db"), ttl_seconds=60, max_entries=2
+    )
+    cache.set("a", '"a"', None)
+    time.sleep(0.01)
+    cache.set("b", '"b"', None)
+    time.sleep(0.01)
+    writes = cache._connection.total_changes
+    assert cache.get("a") == ('"a"', None)
+    # Lookups do not write; the access time lands with the next set
+    assert cache._connection.total_changes == writes
+    time.sleep(0.01)
+    cache.set("c", '"c"', None)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("a") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_client_registry_shares_one_pool_per_host(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"ok": True}, is_reusable=True)
+    source = TEST_REST_CONFIG_NO_PAGINATION
+    registry = HTTPClientRegistry()
+    shared = registry.get_client(source)
+    assert (
+        registry.get_client(
+            source.model_copy(update={"base_url": "https://api.example.com/v2/"})
+        )
+        is shared
+    )
+    assert (
+        registry.get_client(
+            source.model_copy(update={"base_url": "https://other.example.com/"})
+        )
+        is not shared
+    )
+    # Same host, different client settings: a separate pool built from the source
+    with_headers = registry.get_client(
+        source.model_copy(update={"default_headers": {"X-Api-Version": "2"}})
+    )
+    assert with_headers is not shared
+    assert with_headers.headers["X-Api-Version"] == "2"
+
+    for path in ("a", "b"):
+        client = AsyncProductionHTTPClient(client=shared)
+        await client.get(f"https://api.example.com/{path}")
+        # Endpoint wrappers must not close the shared pool
+        await client.close()
+    assert not shared.is_closed
+    await with_headers.get("https://api.example.com/c")
+    assert httpx_mock.get_requests()[-1].headers["X-Api-Version"] == "2"
+
+    stats = registry.stats()
+    assert stats["https://api.example.com"]["pools"] == 2
+    assert stats["https://api.example.com"]["requests"] == 3
+    assert stats["https://api.example.com"]["responses"] == 3
+    assert stats["https://api.example.com"]["in_flight"] == 0
+    assert stats["https://api.example.com"]["peak_in_flight"] == 2
+    assert stats["https://other.example.com"]["requests"] == 0
+
+    await registry.close()
+    assert shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_registry_in_flight_settles_after_timeouts_and_dropped_hedges(
+    httpx_mock: HTTPXMock,
+):
+    calls = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        if calls == 2:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"copy": "primary"})
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    registry = HTTPClientRegistry()
+    shared = registry.get_client(TEST_REST_CONFIG_NO_PAGINATION)
+
+    client = AsyncProductionHTTPClient(client=shared, max_attempts=1)
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get("https://api.example.com/items")
+
+    hedger = RequestHedger(percentile=0.5, budget=1, min_samples=2)
+    hedger.latencies.extend([0.05, 0.05])
+    client = AsyncProductionHTTPClient(client=shared, hedger=hedger)
+    assert await client.get("https://api.example.com/items") == {"copy": "hedge"}
+
+    # The timed-out request and the cancelled primary each leave in_flight once
+    stats = registry.stats()["https://api.example.com"]
+    assert stats["requests"] == 3
+    assert stats["responses"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 2
+    await registry.close()
+
+
+def test_circuit_breaker_opens_on_error_rate_and_recovers_through_probe():
+    breaker = CircuitBreaker(
+        "https://api.example.com",
+        failure_rate_threshold=0.5,
+        minimum_requests=4,
+        window_size=4,
+        reset_timeout=0.05,
+    )
+    for outcome in (True, False, True):
+        started_at = breaker.before_request()
+        if outcome:
+            breaker.record_success(started_at)
+        else:
+            breaker.record_failure(started_at)
+    assert breaker.state == "closed"
+    breaker.record_failure(breaker.before_request())
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(0.06)
+    probe = breaker.before_request()
+    assert breaker.state == "half_open"
+    # Only one probe is let through while half-open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success(probe)
+    assert breaker.state == "closed"
+
+
+def test_circuit_breaker_ignores_late_outcomes_while_half_open():
+    breaker = CircuitBreaker(
+        "https://api.example.com",
+        minimum_requests=1,
+        window_size=1,
+        reset_timeout=0.05,
+    )
+    slow = breaker.before_request()
+    breaker.record_failure(breaker.before_request())
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    probe = breaker.before_request()
+    # A request sent before the breaker opened answers late: it says nothing about recovery
+    breaker.record_success(slow)
+    assert breaker.state == "half_open"
+    breaker.record_failure(slow)
+    assert breaker.state == "half_open"
+    breaker.record_failure(probe)
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_client_circuit_breaker_fails_fast_instead_of_backing_off(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(status_code=503, is_reusable=True)
+    breaker = CircuitBreaker(
+        "https://api.example.com", minimum_requests=2, window_size=2
+    )
+    client = AsyncProductionHTTPClient(circuit_breaker=breaker, max_attempts=5)
+
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://api.example.com/items", backoff_starting_delay=0.05)
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://api.example.com/items", backoff_starting_delay=0.05)
+    elapsed = time.monotonic() - start
+    await client.close()
+
+    # Two failed attempts open the circuit; the rest never reach the network
+    assert len(httpx_mock.get_requests()) == 2
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_client_hedges_slow_get_and_first_response_wins(httpx_mock: HTTPXMock):
+    calls = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"copy": "primary"})
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    hedger = RequestHedger(percentile=0.5, budget=1, min_samples=2)
+    hedger.latencies.extend([0.05, 0.05])
+    client = AsyncProductionHTTPClient(hedger=hedger)
+
+    start = time.monotonic()
+    response = await client.get("https://api.example.com/items")
+    elapsed = time.monotonic() - start
+    await client.close()
+
+    assert response == {"copy": "hedge"}
+    assert elapsed < 0.5
+    assert hedger.hedges == 1
+    # The hedge's own latency is recorded, not the time since the primary was sent
+    assert hedger.latencies[-1] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_client_skips_hedge_when_primary_answers_during_rate_limit_wait(
+    httpx_mock: HTTPXMock,
+):
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.08)
+        return httpx.Response(200, json={"copy": "primary"})
+
+    httpx_mock.add_callback(respond)
+    hedger = RequestHedger(percentile=0.5, budget=1, min_samples=2)
+    hedger.latencies.extend([0.02, 0.02])
+    client = AsyncProductionHTTPClient(
+        hedger=hedger, rate_limiter=AsyncTokenBucket(rate=5, burst=1)
+    )
+
+    response = await client.get("https://api.example.com/items")
+    await client.close()
+
+    assert response == {"copy": "primary"}
+    assert len(httpx_mock.get_requests()) == 1
+    assert hedger.hedges == 0
+
+
+def test_request_hedger_budget_caps_duplicates():
+    hedger = RequestHedger(budget=0.1, min_samples=1)
+    assert hedger.delay() is None
+    hedger.record_latency(0.2)
+    assert hedger.delay() == 0.2
+
+    granted = 0
+    for _ in range(50):
+        hedger.record_request()
+        granted += hedger.try_acquire()
+    assert granted == 5
+
+
+@pytest.mark.asyncio
+async def test_cassette_records_then_replays_without_network(
+    httpx_mock: HTTPXMock, tmp_path
+):
+    httpx_mock.add_response(
+        url="https://api.example.com/items?page=1",
+        json={"items": [1, 2]},
+        headers={"ETag": '"v1"'},
+    )
+    path = str(tmp_path / "run.cassette.gz")
+    cassette = Cassette(path)
+    recorder = AsyncProductionHTTPClient(transport=cassette.transport("record"))
+    recorded = await recorder.get("https://api.example.com/items", params={"page": 1})
+    await recorder.close()
+    cassette.save()
+
+    replayer = AsyncProductionHTTPClient(
+        transport=Cassette.load(path).transport("replay", latency=0.1),
+        max_attempts=1,
+    )
+    start = time.monotonic()
+    replayed = await replayer.get("https://api.example.com/items", params={"page": 1})
+    assert time.monotonic() - start >= 0.1
+    with pytest.raises(CassetteMissError):
+        await replayer.get("https://api.example.com/items", params={"page": 2})
+    await replayer.close()
+
+    assert replayed == recorded == {"items": [1, 2]}
+    # Only the recording run reached the (mocked) network
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_cassette_redacts_secret_params_and_misses_once_exhausted(
+    httpx_mock: HTTPXMock, tmp_path
+):
+    httpx_mock.add_response(
+        url="https://api.example.com/weather?lat=1&appid=secret-key",
+        json={"temp": 70},
+    )
+    path = str(tmp_path / "run.cassette.gz")
+    cassette = Cassette(path, redact_params=["appid"])
+    recorder = AsyncProductionHTTPClient(transport=cassette.transport("record"))
+    await recorder.get(
+        "https://api.example.com/weather", params={"lat": 1, "appid": "secret-key"}
+    )
+    await recorder.close()
+    cassette.save()
+
+    with gzip.open(path, "rb") as archive:
+        stored = archive.read()
+    assert b"secret-key" not in stored
+    assert b"appid=REDACTED" in stored
+
+    # A replay with another key still matches: only the param name is part of the key
+    loaded = Cassette.load(path, redact_params=["appid"])
+    replayer = AsyncProductionHTTPClient(
+        transport=loaded.transport("replay"), max_attempts=1
+    )
+    params = {"lat": 1, "appid": "rotated-key"}
+    assert await replayer.get("https://api.example.com/weather", params=params) == {
+        "temp": 70
+    }
+    with pytest.raises(CassetteMissError):
+        await replayer.get("https://api.example.com/weather", params=params)
+    await replayer.close()
+
+    reusing = AsyncProductionHTTPClient(
+        transport=loaded.transport("replay", reuse_last=True), max_attempts=1
+    )
+    for _ in range(2):
+        assert await reusing.get("https://api.example.com/weather", params=params) == {
+            "temp": 70
+        }
+    await reusing.close()
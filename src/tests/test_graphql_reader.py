@@ -1,8 +1,16 @@
+import json
+
 import pytest
+from pytest_httpx import HTTPXMock
 
 from src.pipeline.read.graphql import GraphQLReader
 from src.tests.fixtures.test_configs.graphql_configs import (
     TEST_GRAPHQL_CONFIG_NO_PAGINATION,
+    TEST_GRAPHQL_CONFIG_PAGE_PAGINATION,
+    TEST_GRAPHQL_CONFIG_RELAY_PAGINATION,
+)
+from src.tests.fixtures.test_responses.graphql_pagination import (
+    TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES,
 )
 
 
@@ -33,3 +41,152 @@ async def test_graphql_reader_no_pagination_single_request(
     assert batches[0][0]["id"] == 1
     assert batches[0][1]["id"] == 2
     assert batches[0][2]["id"] == 3
+
+
+@pytest.mark.asyncio
+async def test_graphql_reader_page_pagination_fans_out_known_pages(
+    mock_graphql_page_pagination_responses,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    reader = GraphQLReader(
+        source=TEST_GRAPHQL_CONFIG_PAGE_PAGINATION,
+        client=http_client,
+        Session=Session,
+        source_name="test_graphql_page_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com/graphql"
+    endpoint_config = TEST_GRAPHQL_CONFIG_PAGE_PAGINATION.endpoints["items"]
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    assert len(batches) == 1
+    assert sorted(item["id"] for item in batches[0]) == [1, 2, 3, 4, 5]
+    requests = mock_graphql_page_pagination_responses.get_requests()
+    pages = sorted(json.loads(r.content)["variables"]["page"] for r in requests)
+    assert pages == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_graphql_reader_page_pagination_batches_operations(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    source = TEST_GRAPHQL_CONFIG_PAGE_PAGINATION.model_copy(deep=True)
+    endpoint_config = source.endpoints["items"]
+    endpoint_config.pagination.operations_per_request = 2
+    body = endpoint_config.body
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.example.com/graphql",
+        match_json={**body, "variables": {"page": 1}},
+        json=TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES[1],
+    )
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.example.com/graphql",
+        match_json=[
+            {**body, "variables": {"page": 2}},
+            {**body, "variables": {"page": 3}},
+        ],
+        json=[
+            TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES[2],
+            TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES[3],
+        ],
+    )
+
+    _engine, Session = test_db
+    reader = GraphQLReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_graphql_page_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com/graphql"
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    assert [item["id"] for item in batches[0]] == [1, 2, 3, 4, 5]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_graphql_reader_page_pagination_fans_out_zero_indexed_pages(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    source = TEST_GRAPHQL_CONFIG_PAGE_PAGINATION.model_copy(deep=True)
+    endpoint_config = source.endpoints["items"]
+    endpoint_config.pagination.start_page = 0
+    body = endpoint_config.body
+    # Three pages numbered 0..2: the last one is total_pages - 1
+    for page in range(3):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/graphql",
+            match_json={**body, "variables": {"page": page}},
+            json=TEST_GRAPHQL_PAGE_PAGINATION_RESPONSES[page + 1],
+        )
+
+    _engine, Session = test_db
+    reader = GraphQLReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_graphql_page_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com/graphql"
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    assert sorted(item["id"] for item in batches[0]) == [1, 2, 3, 4, 5]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_graphql_reader_relay_pagination_follows_end_cursor(
+    mock_graphql_relay_pagination_responses,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    reader = GraphQLReader(
+        source=TEST_GRAPHQL_CONFIG_RELAY_PAGINATION,
+        client=http_client,
+        Session=Session,
+        source_name="test_graphql_relay_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com/graphql"
+    endpoint_config = TEST_GRAPHQL_CONFIG_RELAY_PAGINATION.endpoints["items"]
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    assert [item["id"] for item in batches[0]] == [1, 2, 3]
+    requests = mock_graphql_relay_pagination_responses.get_requests()
+    assert [json.loads(r.content)["variables"] for r in requests] == [
+        {"first": 2},
+        {"first": 2, "after": "cursor_2"},
+    ]
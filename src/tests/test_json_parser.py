@@ -1,19 +1,26 @@
+import pendulum
 import pytest
 from pydantic import ValidationError
 from pydantic_extra_types.pendulum_dt import DateTime
 
+from src.exception.base import RowCoercionError
 from src.pipeline.parse.json import JSONParser
 from src.tests.fixtures.test_configs.json_parser_configs import (
     TEST_JSON_PARSER_CONFIG_DEEPLY_NESTED,
+    TEST_JSON_PARSER_CONFIG_INDEXED_WILDCARD,
     TEST_JSON_PARSER_CONFIG_LIST_ROOT,
     TEST_JSON_PARSER_CONFIG_MAX_LENGTH,
     TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES,
     TEST_JSON_PARSER_CONFIG_NESTED,
     TEST_JSON_PARSER_CONFIG_SIMPLE,
+    TEST_JSON_PARSER_CONFIG_SKIP_VALIDATION,
     TEST_JSON_PARSER_CONFIG_WITH_LISTS,
+    TEST_JSON_PARSER_CONFIG_WITH_MODEL_CONFIG,
+    TEST_JSON_PARSER_CONFIG_WITH_VALIDATOR,
 )
 from src.tests.fixtures.test_responses.json_parser_responses import (
     TEST_JSON_PARSER_DEEPLY_NESTED_RESPONSE,
+    TEST_JSON_PARSER_INDEXED_WILDCARD_RESPONSE,
     TEST_JSON_PARSER_LIST_ROOT_RESPONSE,
     TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE,
     TEST_JSON_PARSER_NESTED_RESPONSE,
@@ -263,3 +270,132 @@ async def test_json_parser_max_length_validation_fails():
         error["type"] == "string_too_long" or "max_length" in str(error).lower()
         for error in errors
     )
+
+
+@pytest.mark.asyncio
+async def test_json_parser_indexed_alias_within_wildcard():
+    endpoint_config = TEST_JSON_PARSER_CONFIG_INDEXED_WILDCARD.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    batch = TEST_JSON_PARSER_INDEXED_WILDCARD_RESPONSE
+
+    table_batches = []
+    async for result in parser.parse(batch):
+        table_batches = result
+
+    assert len(table_batches) == 1
+    records = table_batches[0].records
+    assert len(records) == 3
+    assert records[0]["product_id"] == 1
+    assert records[0]["sku"] == "SKU-1-S"
+    assert records[0]["first_price"] == 9.99
+    assert records[0]["primary_image"] == "front.jpg"
+    assert records[1]["sku"] == "SKU-1-M"
+    assert records[1]["first_price"] == 10.99
+    assert records[2]["product_id"] == 2
+    assert records[2]["sku"] == "SKU-2-L"
+    assert records[2]["primary_image"] == "only.jpg"
+
+
+@pytest.mark.asyncio
+async def test_json_parser_model_validators_are_applied():
+    endpoint_config = TEST_JSON_PARSER_CONFIG_WITH_VALIDATOR.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    batch = TEST_JSON_PARSER_SIMPLE_RESPONSE
+
+    table_batches = []
+    async for result in parser.parse(batch):
+        table_batches = result
+
+    assert len(table_batches[0].records) == 2
+    assert table_batches[0].records[0] == {
+        "id": 1,
+        "name": "PRODUCT 1",
+        "etl_row_hash": table_batches[0].records[0]["etl_row_hash"],
+    }
+    assert table_batches[0].records[1]["name"] == "PRODUCT 2"
+
+
+@pytest.mark.asyncio
+async def test_json_parser_model_config_and_serializers_are_applied():
+    endpoint_config = TEST_JSON_PARSER_CONFIG_WITH_MODEL_CONFIG.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    batch = [
+        {**TEST_JSON_PARSER_SIMPLE_RESPONSE[0], "name": "  Product 1 "},
+        TEST_JSON_PARSER_SIMPLE_RESPONSE[1],
+    ]
+
+    table_batches = []
+    async for result in parser.parse(batch):
+        table_batches = result
+
+    records = table_batches[0].records
+    assert [record["name"] for record in records] == ["Product 1", "Product 2"]
+    assert [record["category"] for record in records] == ["electronics", "clothing"]
+    assert parser.model_dumps == {"TestProductWithConfig": True}
+
+    # Plain models keep the fast TypedDict path
+    simple_parser = JSONParser(
+        endpoint_config=TEST_JSON_PARSER_CONFIG_SIMPLE.endpoints["products"]
+    )
+    async for _ in simple_parser.parse(TEST_JSON_PARSER_SIMPLE_RESPONSE):
+        pass
+    assert simple_parser.model_dumps == {"TestProduct": False}
+
+
+@pytest.mark.asyncio
+async def test_json_parser_skip_validation_coerces_to_column_types():
+    endpoint_config = TEST_JSON_PARSER_CONFIG_SKIP_VALIDATION.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    batch = [
+        {**TEST_JSON_PARSER_NESTED_RESPONSE[0], "id": "1", "price": "19.99"},
+        TEST_JSON_PARSER_NESTED_RESPONSE[1],
+    ]
+
+    table_batches = []
+    async for result in parser.parse(batch):
+        table_batches = result
+
+    records = table_batches[0].records
+    assert len(records) == 2
+    assert records[0]["id"] == 1
+    assert records[0]["price"] == 19.99
+    assert records[0]["dimensions_height"] == 20.0
+    assert isinstance(records[0]["meta_created_at"], pendulum.DateTime)
+    assert records[0]["meta_created_at"] == pendulum.datetime(2024, 1, 1)
+    assert records[1]["id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_json_parser_skip_validation_missing_required_field_fails():
+    endpoint_config = TEST_JSON_PARSER_CONFIG_SKIP_VALIDATION.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    record = dict(TEST_JSON_PARSER_NESTED_RESPONSE[0])
+    del record["name"]
+
+    with pytest.raises(RowCoercionError, match="name"):
+        async for _ in parser.parse([record]):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [True, 2.5, float("inf"), "2.5"])
+async def test_json_parser_skip_validation_rejects_lossy_int_coercion(value):
+    endpoint_config = TEST_JSON_PARSER_CONFIG_SKIP_VALIDATION.endpoints["products"]
+    parser = JSONParser(endpoint_config=endpoint_config)
+
+    # Integral floats are still accepted
+    async for result in parser.parse(
+        [{**TEST_JSON_PARSER_NESTED_RESPONSE[0], "id": 3.0}]
+    ):
+        assert result[0].records[0]["id"] == 3
+
+    with pytest.raises(RowCoercionError, match="id"):
+        async for _ in parser.parse(
+            [{**TEST_JSON_PARSER_NESTED_RESPONSE[0], "id": value}]
+        ):
+            pass
@@ -0,0 +1,46 @@
+import orjson
+import pytest
+
+from src.pipeline.read.json_stream import JSONItemStream
+
+DOCUMENT = {
+    "meta": {"items": [{"id": "skip", "note": '}], "quoted" ['}]},
+    "data": {
+        "items": [
+            {"id": 1, "tags": ["a", "b"], "nested": {"x": [1, {"y": None}]}},
+            {"id": 2, "text": 'comma, bracket ] brace } escaped \\" quote'},
+            "plain string",
+            [3, 4],
+            5,
+        ],
+        "count": 5,
+    },
+}
+
+
+def _decode(document: bytes, json_entrypoint: str | None, chunk_size: int) -> list:
+    stream = JSONItemStream(json_entrypoint)
+    items = []
+    for start in range(0, len(document), chunk_size):
+        items.extend(stream.feed(document[start : start + chunk_size]))
+    return items + stream.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 20])
+def test_json_item_stream_matches_full_decode(chunk_size):
+    document = orjson.dumps(DOCUMENT, option=orjson.OPT_INDENT_2)
+
+    assert _decode(document, "data.items", chunk_size) == DOCUMENT["data"]["items"]
+    assert _decode(document, "data.count", chunk_size) == [5]
+    assert _decode(document, "meta", chunk_size) == [DOCUMENT["meta"]]
+    assert _decode(document, None, chunk_size) == [DOCUMENT]
+    assert _decode(b" [ ] ", None, chunk_size) == []
+
+
+def test_json_item_stream_missing_path_and_truncated_body():
+    document = orjson.dumps(DOCUMENT)
+
+    with pytest.raises(KeyError, match="Failed at key 'missing'"):
+        _decode(document, "data.missing", 8)
+    with pytest.raises(ValueError, match="ended before the items were complete"):
+        _decode(document[: len(document) // 2], "data.items", 8)
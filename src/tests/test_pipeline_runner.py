@@ -0,0 +1,300 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from sqlalchemy import MetaData, text
+
+from src.pipeline.runner import PipelineRunner
+from src.process.http_cache import HTTPValidatorCache
+from src.process.tables import create_production_tables
+from src.sources.base import TableConfig
+from src.sources.master import MASTER_SOURCE_REGISTRY
+from src.tests.fixtures.test_configs.json_parser_configs import (
+    TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES,
+)
+from src.tests.fixtures.test_models import json_parser_models
+from src.tests.fixtures.test_responses.json_parser_responses import (
+    TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE,
+)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_sqlite_publishes_with_upsert(
+    mock_rest_products_response,
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    source = TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES
+    endpoint_config = source.endpoints["products"]
+    create_production_tables(endpoint_config, engine, metadata)
+
+    runner = PipelineRunner(
+        source=source,
+        endpoint="products",
+        endpoint_config=endpoint_config,
+        engine=engine,
+        metadata=metadata,
+    )
+    result = await runner.run()
+    assert result == (True, "https://api.example.com/products", None)
+
+    with engine.connect() as conn:
+        products = conn.execute(
+            text("SELECT id, name, etl_updated_at FROM test_product ORDER BY id")
+        ).fetchall()
+        reviews = conn.execute(text("SELECT COUNT(*) FROM test_review")).scalar()
+        stage_tables = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE name LIKE 'stage_%'")
+        ).fetchall()
+    assert [(row.id, row.name) for row in products] == [
+        (1, "Product 1"),
+        (2, "Product 2"),
+    ]
+    assert all(row.etl_updated_at is None for row in products)
+    assert reviews == 3
+    assert stage_tables == []
+
+    # Only rows whose hash differs from the stage row are updated
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE test_product SET name = 'Stale', etl_row_hash = x'00' WHERE id = 1"
+            )
+        )
+    runner = PipelineRunner(
+        source=source,
+        endpoint="products",
+        endpoint_config=endpoint_config,
+        engine=engine,
+        metadata=MetaData(),
+    )
+    result = await runner.run()
+    assert result[0] is True
+    with engine.connect() as conn:
+        products = conn.execute(
+            text("SELECT id, name, etl_updated_at FROM test_product ORDER BY id")
+        ).fetchall()
+    assert [(row.id, row.name) for row in products] == [
+        (1, "Product 1"),
+        (2, "Product 2"),
+    ]
+    assert products[0].etl_updated_at is not None
+    assert products[1].etl_updated_at is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_sqlite_skips_rows_when_every_column_is_grain(
+    mock_rest_products_response,
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    source = TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES.model_copy(deep=True)
+    endpoint_config = source.endpoints["products"]
+    endpoint_config.tables = [TableConfig(data_model=json_parser_models.TestReviewer)]
+    create_production_tables(endpoint_config, engine, metadata)
+
+    for run_metadata in (metadata, MetaData()):
+        runner = PipelineRunner(
+            source=source,
+            endpoint="products",
+            endpoint_config=endpoint_config,
+            engine=engine,
+            metadata=run_metadata,
+        )
+        result = await runner.run()
+        assert result[0] is True
+
+    publish_sql = runner.publisher.create_publish_sql(
+        json_parser_models.TestReviewer, "2026-01-01T00:00:00+00:00"
+    )
+    assert "DO NOTHING" in str(publish_sql)
+    with engine.connect() as conn:
+        reviewers = conn.execute(
+            text("SELECT etl_updated_at FROM test_reviewer")
+        ).fetchall()
+    assert len(reviewers) == 3
+    assert all(row.etl_updated_at is None for row in reviewers)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_overlaps_reading_with_writing(
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    source = TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES
+    endpoint_config = source.endpoints["products"]
+    runner = PipelineRunner(
+        source=source,
+        endpoint="products",
+        endpoint_config=endpoint_config,
+        engine=engine,
+        metadata=metadata,
+    )
+    events = []
+
+    async def read():
+        for index in range(3):
+            events.append(f"read {index}")
+            yield [TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE[0]]
+
+    def write(table_batches):
+        events.append("write start")
+        time.sleep(0.05)
+        events.append("write end")
+
+    runner.read = read
+    runner.write = write
+    await runner.load_stage_tables()
+    await runner.client.close()
+
+    assert events.count("write end") == 3
+    assert events.index("read 1") < events.index("write end")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_stage_failure_fails_endpoint(
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    source = TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES
+    endpoint_config = source.endpoints["products"]
+    runner = PipelineRunner(
+        source=source,
+        endpoint="products",
+        endpoint_config=endpoint_config,
+        engine=engine,
+        metadata=metadata,
+    )
+
+    async def read():
+        yield [{"id": "not-an-int", "name": "Broken"}]
+
+    runner.read = read
+    status, url, error = await runner.run()
+
+    assert status is False
+    assert url == "https://api.example.com/products"
+    assert error is not None and "validation error" in error
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_parses_in_process_pool(
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    source = MASTER_SOURCE_REGISTRY.get_source("polygon")
+    endpoint_config = source.endpoints["tickers"]
+    batch = [
+        {"ticker": "A", "market": "stocks", "locale": "us", "active": True},
+        {"ticker": "B", "market": "stocks", "locale": "us", "active": "false"},
+    ]
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as process_pool:
+        runner = PipelineRunner(
+            source=source,
+            endpoint="tickers",
+            endpoint_config=endpoint_config,
+            engine=engine,
+            metadata=metadata,
+            parse_executor=process_pool,
+        )
+        results = []
+        for _ in range(2):
+            async for table_batches in runner.parse(batch=batch):
+                results.append(table_batches)
+        await runner.client.close()
+
+    for table_batches in results:
+        assert len(table_batches) == 1
+        assert table_batches[0].data_model.__name__ == "PolygonTickers"
+        assert [
+            (record["ticker"], record["active"]) for record in table_batches[0].records
+        ] == [("A", True), ("B", False)]
+        assert all("etl_row_hash" in record for record in table_batches[0].records)
+
+
+class UnusedProcessPool(ProcessPoolExecutor):
+    def submit(self, *args, **kwargs):
+        raise AssertionError("parsing was sent to a worker process")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_parses_unregistered_source_in_thread(
+    sqlite_file_db,
+):
+    engine, metadata = sqlite_file_db
+    # Workers could only rebuild the registry's polygon config, not this modified copy
+    source = MASTER_SOURCE_REGISTRY.get_source("polygon").model_copy(deep=True)
+    endpoint_config = source.endpoints["tickers"]
+    endpoint_config.json_entrypoint = "data.results"
+    with UnusedProcessPool(max_workers=1) as process_pool:
+        runner = PipelineRunner(
+            source=source,
+            endpoint="tickers",
+            endpoint_config=endpoint_config,
+            engine=engine,
+            metadata=metadata,
+            parse_executor=process_pool,
+        )
+        assert runner.parse_in_process is False
+        results = [
+            table_batches
+            async for table_batches in runner.parse(
+                batch=[
+                    {"ticker": "A", "market": "stocks", "locale": "us", "active": True}
+                ]
+            )
+        ]
+        await runner.client.close()
+
+    assert [record["ticker"] for record in results[0][0].records] == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runner_skips_endpoint_on_not_modified(
+    httpx_mock, sqlite_file_db, tmp_path
+):
+    url = "https://api.example.com/products"
+    httpx_mock.add_response(
+        url=url,
+        json={"products": TEST_JSON_PARSER_MULTIPLE_TABLES_RESPONSE},
+        headers={"ETag": '"v1"'},
+    )
+    httpx_mock.add_response(
+        url=url, status_code=304, match_headers={"If-None-Match": '"v1"'}
+    )
+    engine, metadata = sqlite_file_db
+    source = TEST_JSON_PARSER_CONFIG_MULTIPLE_TABLES.model_copy(deep=True)
+    endpoint_config = source.endpoints["products"]
+    endpoint_config.conditional_requests = True
+    create_production_tables(endpoint_config, engine, metadata)
+    cache = HTTPValidatorCache(
+        str(tmp_path / "http_cache.db"), ttl_seconds=60, max_entries=10
+    )
+
+    for run_metadata in (metadata, MetaData()):
+        runner = PipelineRunner(
+            source=source,
+            endpoint="products",
+            endpoint_config=endpoint_config,
+            engine=engine,
+            metadata=run_metadata,
+            http_cache=cache,
+        )
+        assert await runner.run() == (True, url, None)
+        if run_metadata is metadata:
+            with engine.begin() as conn:
+                conn.execute(text("DELETE FROM test_product"))
+
+    with engine.connect() as conn:
+        products = conn.execute(text("SELECT COUNT(*) FROM test_product")).scalar()
+        stage_tables = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE name LIKE 'stage_%'")
+        ).fetchall()
+    # The second run was a 304: nothing was staged or merged
+    assert products == 0
+    assert stage_tables == []
+    assert len(httpx_mock.get_requests()) == 2
+    cache.close()
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.process import processor as processor_module
+from src.process.processor import Processor
+from src.sources.base import RateLimitConfig
+from src.sources.master import MASTER_SOURCE_REGISTRY
+from src.tests.fixtures.test_configs.rest_configs import TEST_REST_CONFIG_NO_PAGINATION
+
+
+def _source(name: str, endpoints: int = 1, rate_limited: bool = False):
+    return TEST_REST_CONFIG_NO_PAGINATION.model_copy(
+        update={
+            "name": name,
+            "base_url": f"https://{name}.example.com/",
+            "endpoints": {
+                f"items_{index}": TEST_REST_CONFIG_NO_PAGINATION.endpoints["items"]
+                for index in range(endpoints)
+            },
+            "rate_limit": (
+                RateLimitConfig(requests_per_second=100) if rate_limited else None
+            ),
+        }
+    )
+
+
+class ConcurrencyProbe:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    async def run(self, name: str, delay: float = 0.02) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.calls.append(name)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def processor():
+    processor = Processor()
+    yield processor
+    processor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_all_caps_concurrent_sources(processor, monkeypatch):
+    sources = [_source(f"source{index}") for index in range(5)]
+    monkeypatch.setattr(MASTER_SOURCE_REGISTRY, "sources", sources)
+    probe = ConcurrencyProbe()
+    monkeypatch.setattr(processor, "process_api", probe.run)
+    processor.max_concurrent_sources = 2
+
+    await processor.process_all()
+
+    assert probe.peak == 2
+    assert sorted(probe.calls) == [source.name for source in sources]
+    assert processor.results == []
+
+
+@pytest.mark.asyncio
+async def test_process_all_records_failing_source_while_others_finish(
+    processor, monkeypatch
+):
+    sources = [_source("healthy1"), _source("broken"), _source("healthy2")]
+    monkeypatch.setattr(MASTER_SOURCE_REGISTRY, "sources", sources)
+    finished = []
+
+    async def process_api(name: str) -> None:
+        await asyncio.sleep(0.01)
+        if name == "broken":
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.02)
+        finished.append(name)
+
+    monkeypatch.setattr(processor, "process_api", process_api)
+
+    await processor.process_all()
+
+    assert sorted(finished) == ["healthy1", "healthy2"]
+    assert processor.results == [(False, "https://broken.example.com/", "boom")]
+
+
+@pytest.mark.asyncio
+async def test_process_api_runs_endpoints_in_parallel_only_under_rate_limit(
+    processor, monkeypatch
+):
+    limited = _source("limited", endpoints=3, rate_limited=True)
+    unlimited = _source("unlimited", endpoints=3)
+    monkeypatch.setattr(MASTER_SOURCE_REGISTRY, "sources", [limited, unlimited])
+
+    probe = ConcurrencyProbe()
+
+    async def process_endpoint(name, endpoint, api_config=None):
+        await probe.run(f"{name}/{endpoint}")
+
+    monkeypatch.setattr(processor, "process_endpoint", process_endpoint)
+
+    await processor.process_api("limited")
+    assert probe.peak == 3
+
+    probe.peak = 0
+    await processor.process_api("unlimited")
+    assert probe.peak == 1
+    assert len(probe.calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_process_endpoint_creates_tables_off_the_event_loop(
+    processor, monkeypatch
+):
+    source = _source("ddl")
+    loop_thread = threading.current_thread()
+    ddl_threads = []
+
+    def create_production_tables(endpoint_config, engine, metadata):
+        ddl_threads.append(threading.current_thread())
+
+    class FakeRunner:
+        def __init__(self, **kwargs):
+            self.url = kwargs["source"].base_url
+
+        async def run(self):
+            return True, self.url, None
+
+    monkeypatch.setattr(
+        processor_module, "create_production_tables", create_production_tables
+    )
+    monkeypatch.setattr(processor_module, "PipelineRunner", FakeRunner)
+
+    await processor.process_endpoint("ddl", "items_0", source)
+    await processor.close_clients()
+
+    assert ddl_threads and ddl_threads[0] is not loop_thread
+    assert processor.results == [(True, "https://ddl.example.com/", None)]
@@ -1,7 +1,21 @@
-import pytest
+import asyncio
+import threading
 
+import httpx
+import orjson
+import pendulum
+import pytest
+from pydantic import ValidationError
+from pytest_httpx import HTTPXMock, IteratorStream
+from sqlalchemy import event
+from sqlalchemy.engine import MappingResult
+
+from src.pipeline.read.pagination import offset as offset_pagination
+from src.pipeline.read.pagination.concurrency import AIMDConcurrencyController
+from src.pipeline.read.pagination.query import QueryPaginationStrategy, SeenURLs
 from src.pipeline.read.rest import RESTReader
-from src.pipeline.watermark import commit_watermark, get_watermark
+from src.pipeline.watermark import commit_watermark, get_watermark, set_watermark
+from src.sources.base import CursorPartitionConfig
 from src.tests.fixtures.test_configs.rest_configs import (
     TEST_REST_CONFIG_NO_PAGINATION,
     TEST_REST_CONFIG_WITH_CURSOR_PAGINATION,
@@ -10,9 +24,15 @@ from src.tests.fixtures.test_configs.rest_configs import (
     TEST_REST_CONFIG_WITH_NEXT_URL_PAGINATION_INCREMENTAL,
     TEST_REST_CONFIG_WITH_OFFSET_PAGINATION,
     TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_INCREMENTAL,
+    TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL,
     TEST_REST_CONFIG_WITH_QUERY_PAGINATION,
     TEST_REST_CONFIG_WITH_QUERY_PAGINATION_PARAMS,
 )
+from src.tests.fixtures.test_responses.rest_offset_pagination import (
+    TEST_REST_OFFSET_PAGINATION_PAGE_1_RESPONSE,
+    TEST_REST_OFFSET_PAGINATION_PAGE_2_RESPONSE,
+    TEST_REST_OFFSET_PAGINATION_PAGE_3_RESPONSE,
+)
 
 
 @pytest.mark.asyncio
@@ -44,6 +64,46 @@ async def test_rest_reader_no_pagination_single_request(
     assert batches[0][2]["id"] == 3
 
 
+@pytest.mark.asyncio
+async def test_rest_reader_stream_response_decodes_items_across_chunks(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    body = orjson.dumps(
+        {
+            "meta": {"items": "not this one"},
+            "items": [{"id": 1, "name": "a, [b]"}, {"id": 2}, {"id": 3}],
+        }
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.example.com/items",
+        stream=IteratorStream([body[i : i + 7] for i in range(0, len(body), 7)]),
+    )
+    _engine, Session = test_db
+    reader = RESTReader(
+        source=TEST_REST_CONFIG_NO_PAGINATION,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_no_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 2
+
+    batches = []
+    endpoint_config = TEST_REST_CONFIG_NO_PAGINATION.endpoints["items"].model_copy(
+        update={"stream_response": True}
+    )
+    async for batch in reader.read(
+        url="https://api.example.com/items", endpoint_config=endpoint_config
+    ):
+        batches.append([item["id"] for item in batch])
+
+    assert batches == [[1, 2], [3]]
+
+
 @pytest.mark.asyncio
 async def test_rest_reader_with_offset_pagination(
     mock_rest_offset_pagination_responses,
@@ -60,6 +120,8 @@ async def test_rest_reader_with_offset_pagination(
         engine=_engine,
     )
     reader.batch_size = 10
+    # The adaptive window only grows past max_concurrent when a ceiling is configured
+    assert reader.pagination_strategy.max_concurrent_ceiling == 2
 
     batches = []
     url = "https://api.example.com/items"
@@ -84,6 +146,200 @@ async def test_rest_reader_with_offset_pagination(
     assert "offset=15" in str(requests[3].url)
 
 
+def test_aimd_controller_grows_when_healthy_and_halves_on_overload():
+    controller = AIMDConcurrencyController(initial=2, maximum=4)
+    for _ in range(10):
+        controller.on_success(latency=0.1)
+    assert controller.limit == 4
+
+    controller.on_overload(started_at=float("inf"))
+    assert controller.limit == 2
+    # Requests started before the cut do not shrink the window again
+    controller.on_overload(started_at=0.0)
+    assert controller.limit == 2
+
+    # Slow responses hold the window instead of growing it
+    controller.on_success(latency=1.0)
+    assert controller.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_rest_reader_offset_pagination_slow_page_does_not_stall_window(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    first_page_released = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        if offset == 0:
+            await first_page_released.wait()
+        if offset >= 20:
+            return httpx.Response(200, json={"items": []})
+        if offset == 15:
+            first_page_released.set()
+        items = [{"id": offset + index + 1, "name": "Item"} for index in range(5)]
+        return httpx.Response(200, json={"items": items})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    # Buffering pages behind the stalled one needs room past max_concurrent
+    source = TEST_REST_CONFIG_WITH_OFFSET_PAGINATION.model_copy(deep=True)
+    source.pagination.max_concurrent_ceiling = 8
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_offset_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 100
+    assert reader.pagination_strategy.max_concurrent_ceiling == 8
+
+    url = "https://api.example.com/items"
+    endpoint_config = source.endpoints["items"]
+    batches = [
+        batch async for batch in reader.read(url=url, endpoint_config=endpoint_config)
+    ]
+
+    # Offsets 5..15 were fetched while offset 0 was still in flight
+    assert [item["id"] for item in batches[0]] == list(range(1, 21))
+
+
+@pytest.mark.asyncio
+async def test_rest_reader_offset_pagination_total_key_has_no_overshoot(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    pages = [
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_1_RESPONSE, "total": 12},
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_2_RESPONSE, "total": 12},
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_3_RESPONSE, "total": 12},
+    ]
+    for index, page in enumerate(pages):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://api.example.com/items?offset={index * 5}&limit=5",
+            json=page,
+        )
+    reader = RESTReader(
+        source=TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_offset_pagination_total",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 100
+
+    url = "https://api.example.com/items"
+    endpoint_config = TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL.endpoints["items"]
+    batches = [
+        batch async for batch in reader.read(url=url, endpoint_config=endpoint_config)
+    ]
+
+    assert [item["id"] for item in batches[0]] == list(range(1, 13))
+    # Exactly ceil(12 / 5) requests: no probing past the reported total
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("total", [{}, {"total": None}, {"total": "unknown"}])
+async def test_rest_reader_offset_pagination_unusable_total_falls_back_to_probing(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+    total,
+):
+    _engine, Session = test_db
+    pages = [
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_1_RESPONSE, **total},
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_2_RESPONSE, **total},
+        {**TEST_REST_OFFSET_PAGINATION_PAGE_3_RESPONSE, **total},
+    ]
+    for index, page in enumerate(pages):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://api.example.com/items?offset={index * 5}&limit=5",
+            json=page,
+        )
+    # Without a total the window may run ahead of the partial last page
+    for offset in (15, 20):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://api.example.com/items?offset={offset}&limit=5",
+            json={"items": []},
+            is_optional=True,
+        )
+    reader = RESTReader(
+        source=TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_offset_pagination_total",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 100
+
+    url = "https://api.example.com/items"
+    endpoint_config = TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_TOTAL.endpoints["items"]
+    batches = [
+        batch async for batch in reader.read(url=url, endpoint_config=endpoint_config)
+    ]
+
+    assert [item["id"] for item in batches[0]] == list(range(1, 13))
+
+
+@pytest.mark.asyncio
+async def test_rest_reader_offset_pagination_unordered_yields_on_arrival(
+    httpx_mock: HTTPXMock,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    first_page_released = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        if offset == 0:
+            await first_page_released.wait()
+        count = 5 if offset < 10 else 0
+        items = [{"id": offset + index + 1, "name": "Item"} for index in range(count)]
+        return httpx.Response(200, json={"items": items})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    source = TEST_REST_CONFIG_WITH_OFFSET_PAGINATION.model_copy(
+        update={
+            "pagination": TEST_REST_CONFIG_WITH_OFFSET_PAGINATION.pagination.model_copy(
+                update={"ordered": False}
+            )
+        }
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_offset_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 5
+
+    url = "https://api.example.com/items"
+    endpoint_config = source.endpoints["items"]
+    batches = []
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append([item["id"] for item in batch])
+        # Offset 0 only answers once a later page has already been yielded
+        first_page_released.set()
+
+    assert batches == [[6, 7, 8, 9, 10], [1, 2, 3, 4, 5]]
+
+
 @pytest.mark.asyncio
 async def test_rest_reader_with_next_url_pagination(
     mock_rest_next_url_pagination_responses,
@@ -164,14 +420,53 @@ async def test_rest_reader_with_cursor_pagination(
     assert "starting_after=item_12" in str(requests[3].url)
 
 
+@pytest.mark.asyncio
+async def test_rest_reader_cursor_pagination_prefetches_while_consumer_works(
+    mock_rest_cursor_pagination_responses,
+    http_client,
+    test_db,
+):
+    _engine, Session = test_db
+    source = TEST_REST_CONFIG_WITH_CURSOR_PAGINATION.model_copy(
+        update={
+            "pagination": TEST_REST_CONFIG_WITH_CURSOR_PAGINATION.pagination.model_copy(
+                update={"lookahead": 2}
+            )
+        }
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_cursor_pagination",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 5
+
+    url = "https://api.example.com/items"
+    endpoint_config = source.endpoints["items"]
+    batches = []
+    requests_seen = []
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append([item["id"] for item in batch])
+        # Simulate parse/write work on the first page
+        await asyncio.sleep(0.05)
+        requests_seen.append(len(mock_rest_cursor_pagination_responses.get_requests()))
+
+    assert [len(batch) for batch in batches] == [5, 5, 2]
+    # The remaining pages were fetched while the first one was still being processed
+    assert requests_seen[0] == 4
+
+
 @pytest.mark.asyncio
 async def test_rest_reader_with_query_pagination_path(
     mock_rest_query_pagination_path_responses,
     http_client,
-    test_db,
+    query_db,
 ):
     """Query pagination: rows from DB drive GETs with value in path (path={ip}/geo/lookup)."""
-    engine, Session = test_db
+    engine, Session = query_db
     reader = RESTReader(
         source=TEST_REST_CONFIG_WITH_QUERY_PAGINATION,
         client=http_client,
@@ -192,9 +487,12 @@ async def test_rest_reader_with_query_pagination_path(
 
     assert len(batches) == 1
     assert len(batches[0]) == 3
-    assert batches[0][0]["result"]["ip"] == "1.2.3.4"
-    assert batches[0][1]["result"]["ip"] == "5.6.7.8"
-    assert batches[0][2]["result"]["ip"] == "9.10.11.12"
+    # Responses are yielded as they complete, not in query order
+    assert sorted(item["result"]["ip"] for item in batches[0]) == [
+        "1.2.3.4",
+        "5.6.7.8",
+        "9.10.11.12",
+    ]
 
     requests = mock_rest_query_pagination_path_responses.get_requests()
     assert len(requests) == 3
@@ -203,14 +501,202 @@ async def test_rest_reader_with_query_pagination_path(
     assert str(requests[2].url) == "https://api.example.com/9.10.11.12/geo/lookup"
 
 
+@pytest.mark.asyncio
+async def test_rest_reader_query_pagination_streams_rows_in_chunks(
+    mock_rest_query_pagination_path_responses,
+    http_client,
+    query_db,
+    monkeypatch,
+):
+    engine, Session = query_db
+    fetch_sizes = []
+    db_threads = []
+    fetchmany = MappingResult.fetchmany
+
+    def spy_fetchmany(self, size=None):
+        fetch_sizes.append(size)
+        db_threads.append(threading.current_thread())
+        return fetchmany(self, size)
+
+    monkeypatch.setattr(MappingResult, "fetchmany", spy_fetchmany)
+    event.listen(
+        engine,
+        "engine_connect",
+        lambda conn: db_threads.append(threading.current_thread()),
+    )
+    endpoint_config = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.endpoints[
+        "{ip}/geo/lookup"
+    ]
+    endpoint_config = endpoint_config.model_copy(
+        update={
+            "pagination": endpoint_config.pagination.model_copy(
+                update={"query_batch_size": 1}
+            )
+        }
+    )
+    source = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.model_copy(
+        update={"endpoints": {"{ip}/geo/lookup": endpoint_config}}
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_query_pagination",
+        endpoint_name="{ip}/geo/lookup",
+        engine=engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com"
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    # One row per cursor fetch still drives every GET
+    assert sorted(item["result"]["ip"] for item in batches[0]) == [
+        "1.2.3.4",
+        "5.6.7.8",
+        "9.10.11.12",
+    ]
+    # Three one-row chunks and the empty fetch that ends the stream
+    assert fetch_sizes == [1, 1, 1, 1]
+    # Connecting and fetching never run on the event loop's thread
+    assert len(db_threads) == 5
+    assert threading.current_thread() not in db_threads
+
+
+@pytest.mark.asyncio
+async def test_rest_reader_query_pagination_window_and_deduplication(
+    httpx_mock: HTTPXMock,
+    http_client,
+    query_db,
+):
+    engine, Session = query_db
+    last_row_requested = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        ip = request.url.path.split("/")[1]
+        if ip == "1.2.3.4":
+            await last_row_requested.wait()
+        if ip == "9.10.11.12":
+            last_row_requested.set()
+        return httpx.Response(200, json={"result": {"ip": ip}})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    endpoint_config = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.endpoints[
+        "{ip}/geo/lookup"
+    ]
+    endpoint_config = endpoint_config.model_copy(
+        update={
+            "pagination": endpoint_config.pagination.model_copy(
+                update={
+                    "query": "SELECT ip FROM query_input UNION ALL SELECT '5.6.7.8'",
+                    "deduplicate": True,
+                }
+            )
+        }
+    )
+    source = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.model_copy(
+        update={"endpoints": {"{ip}/geo/lookup": endpoint_config}}
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_query_pagination",
+        endpoint_name="{ip}/geo/lookup",
+        engine=engine,
+    )
+    reader.batch_size = 10
+
+    batches = []
+    url = "https://api.example.com"
+    async for batch in reader.read(url=url, endpoint_config=endpoint_config):
+        batches.append(list(batch))
+
+    # The slow first row only answers once the third request is out (max_concurrent=2)
+    ips = [item["result"]["ip"] for item in batches[0]]
+    assert ips[0] == "5.6.7.8"
+    assert sorted(ips[1:]) == ["1.2.3.4", "9.10.11.12"]
+    # The duplicate row was not requested again
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_query_pagination_early_exit_closes_cursor_and_connection(
+    httpx_mock: HTTPXMock,
+    http_client,
+    query_db,
+    monkeypatch,
+):
+    engine, Session = query_db
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(200, json={"ok": True}), is_reusable=True
+    )
+    closed = []
+    close_query = QueryPaginationStrategy._close_query
+
+    def spy_close_query(conn, result):
+        close_query(conn, result)
+        closed.append(conn.closed)
+
+    monkeypatch.setattr(
+        QueryPaginationStrategy, "_close_query", staticmethod(spy_close_query)
+    )
+    endpoint_config = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.endpoints[
+        "{ip}/geo/lookup"
+    ]
+    endpoint_config = endpoint_config.model_copy(
+        update={
+            "pagination": endpoint_config.pagination.model_copy(
+                update={"query_batch_size": 1}
+            )
+        }
+    )
+    source = TEST_REST_CONFIG_WITH_QUERY_PAGINATION.model_copy(
+        update={"endpoints": {"{ip}/geo/lookup": endpoint_config}}
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_query_pagination",
+        endpoint_name="{ip}/geo/lookup",
+        engine=engine,
+    )
+
+    pages = reader.pagination_strategy.pages(
+        httpx.Request("GET", "https://api.example.com"), endpoint_config
+    )
+    async for _ in pages:
+        break
+    assert closed == []
+    await pages.aclose()
+
+    # Closing the pages generator closes the query stream with it, not at garbage collection
+    assert closed == [True]
+
+
+def test_query_pagination_seen_urls_is_bounded():
+    seen_urls = SeenURLs(max_urls=2)
+    assert seen_urls.add("https://api.example.com/a")
+    assert seen_urls.add("https://api.example.com/b")
+    assert not seen_urls.add("https://api.example.com/a")
+
+    # The oldest URL is forgotten once the cap is exceeded
+    assert seen_urls.add("https://api.example.com/c")
+    assert seen_urls.add("https://api.example.com/a")
+    assert not seen_urls.add("https://api.example.com/c")
+
+
 @pytest.mark.asyncio
 async def test_rest_reader_with_query_pagination_params(
     mock_rest_query_pagination_params_responses,
     http_client,
-    test_db,
+    query_db,
 ):
     """Query pagination: rows from DB drive GETs with value in query params (?ip=...)."""
-    engine, Session = test_db
+    engine, Session = query_db
     reader = RESTReader(
         source=TEST_REST_CONFIG_WITH_QUERY_PAGINATION_PARAMS,
         client=http_client,
@@ -229,8 +715,11 @@ async def test_rest_reader_with_query_pagination_params(
 
     assert len(batches) == 1
     assert len(batches[0]) == 3
-    assert batches[0][0]["result"]["ip"] == "1.2.3.4"
-    assert batches[0][2]["result"]["ip"] == "9.10.11.12"
+    assert sorted(item["result"]["ip"] for item in batches[0]) == [
+        "1.2.3.4",
+        "5.6.7.8",
+        "9.10.11.12",
+    ]
 
     requests = mock_rest_query_pagination_params_responses.get_requests()
     assert len(requests) == 3
@@ -244,11 +733,23 @@ async def test_rest_reader_with_offset_pagination_incremental(
     mock_rest_offset_pagination_incremental_first_run,
     mock_rest_offset_pagination_incremental_second_run,
     http_client,
-    test_db,
+    file_db,
+    monkeypatch,
 ):
-    _engine, Session = test_db
+    _engine, Session = file_db
     source_name = "test_api_offset_pagination_incremental"
     endpoint_name = "items"
+    watermark_threads = []
+
+    def spy(watermark_fn):
+        def wrapper(*args):
+            watermark_threads.append(threading.current_thread())
+            return watermark_fn(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(offset_pagination, "get_watermark", spy(get_watermark))
+    monkeypatch.setattr(offset_pagination, "set_watermark", spy(set_watermark))
 
     reader = RESTReader(
         source=TEST_REST_CONFIG_WITH_OFFSET_PAGINATION_INCREMENTAL,
@@ -286,6 +787,9 @@ async def test_rest_reader_with_offset_pagination_incremental(
     second_run_requests = all_requests[len(first_run_requests) :]
     assert len(second_run_requests) >= 1
     assert "offset=12" in str(second_run_requests[0].url)
+    # Watermark reads and writes never block the event loop's thread
+    assert len(watermark_threads) == 4
+    assert threading.current_thread() not in watermark_threads
 
 
 @pytest.mark.asyncio
@@ -293,9 +797,9 @@ async def test_rest_reader_with_next_url_pagination_incremental(
     mock_rest_next_url_pagination_incremental_first_run,
     mock_rest_next_url_pagination_incremental_second_run,
     http_client,
-    test_db,
+    file_db,
 ):
-    _engine, Session = test_db
+    _engine, Session = file_db
     source_name = "test_api_next_url_pagination_incremental"
     endpoint_name = "items"
 
@@ -342,9 +846,9 @@ async def test_rest_reader_with_cursor_pagination_incremental(
     mock_rest_cursor_pagination_incremental_first_run,
     mock_rest_cursor_pagination_incremental_second_run,
     http_client,
-    test_db,
+    file_db,
 ):
-    _engine, Session = test_db
+    _engine, Session = file_db
     source_name = "test_api_cursor_pagination_incremental"
     endpoint_name = "items"
 
@@ -384,3 +888,117 @@ async def test_rest_reader_with_cursor_pagination_incremental(
     second_run_requests = all_requests[len(first_run_requests) :]
     assert len(second_run_requests) == 1
     assert "starting_after=item_12" in str(second_run_requests[0].url)
+
+
+@pytest.mark.asyncio
+async def test_rest_reader_cursor_pagination_partitions_track_watermarks(
+    httpx_mock: HTTPXMock,
+    http_client,
+    file_db,
+):
+    _engine, Session = file_db
+    pages_by_slice = {
+        "1704067200": [["a1", "a2", "a3", "a4", "a5"], ["a6"]],
+        "1704153600": [["b1", "b2"]],
+    }
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        pages = pages_by_slice[request.url.params["created[gte]"]]
+        cursor = request.url.params.get("starting_after")
+        page_index = next(
+            (index + 1 for index, page in enumerate(pages) if page[-1] == cursor), 0
+        )
+        ids = pages[page_index] if page_index < len(pages) else []
+        return httpx.Response(
+            200, json={"data": [{"id": item_id, "name": item_id} for item_id in ids]}
+        )
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    pagination = TEST_REST_CONFIG_WITH_CURSOR_PAGINATION_INCREMENTAL.pagination
+    source = TEST_REST_CONFIG_WITH_CURSOR_PAGINATION_INCREMENTAL.model_copy(
+        update={
+            "pagination": pagination.model_copy(
+                update={
+                    "partition": CursorPartitionConfig(
+                        start=pendulum.datetime(2024, 1, 1),
+                        end=pendulum.datetime(2024, 1, 3),
+                        partitions=2,
+                    )
+                }
+            )
+        }
+    )
+    reader = RESTReader(
+        source=source,
+        client=http_client,
+        Session=Session,
+        source_name="test_api_cursor_pagination_partitioned",
+        endpoint_name="items",
+        engine=_engine,
+    )
+    reader.batch_size = 100
+
+    url = "https://api.example.com/items"
+    endpoint_config = source.endpoints["items"]
+    batches = [
+        batch async for batch in reader.read(url=url, endpoint_config=endpoint_config)
+    ]
+
+    assert sorted(item["id"] for item in batches[0]) == [
+        "a1",
+        "a2",
+        "a3",
+        "a4",
+        "a5",
+        "a6",
+        "b1",
+        "b2",
+    ]
+    slice_params = {
+        (request.url.params["created[gte]"], request.url.params["created[lt]"])
+        for request in httpx_mock.get_requests()
+    }
+    assert slice_params == {
+        ("1704067200", "1704153600"),
+        ("1704153600", "1704240000"),
+    }
+
+    commit_watermark("test_api_cursor_pagination_partitioned", "items", Session)
+    assert (
+        get_watermark(
+            "test_api_cursor_pagination_partitioned",
+            "items@1704067200-1704153600",
+            Session,
+        )
+        == "a6"
+    )
+    assert (
+        get_watermark(
+            "test_api_cursor_pagination_partitioned",
+            "items@1704153600-1704240000",
+            Session,
+        )
+        == "b2"
+    )
+
+
+def test_cursor_partition_requires_fixed_end():
+    with pytest.raises(ValidationError):
+        CursorPartitionConfig(start=pendulum.datetime(2024, 1, 1))
+    with pytest.raises(ValidationError):
+        CursorPartitionConfig(
+            start=pendulum.datetime(2024, 1, 2), end=pendulum.datetime(2024, 1, 1)
+        )
+
+
+def test_commit_watermark_matches_partition_keys_by_literal_prefix(test_db):
+    _engine, Session = test_db
+    source_name = "test_api_partition_prefix"
+    # "_" is a LIKE wildcard, so "line_items@%" would also match "lineXitems@..."
+    set_watermark(source_name, "line_items@1-2", "a", Session)
+    set_watermark(source_name, "lineXitems@1-2", "b", Session)
+
+    commit_watermark(source_name, "line_items", Session)
+
+    assert get_watermark(source_name, "line_items@1-2", Session) == "a"
+    assert get_watermark(source_name, "lineXitems@1-2", Session) is None